@@ -0,0 +1,80 @@
+# The benchmark cases, each is a name and a function that makes the arguments and the call to time
+
+import numpy as np
+import pandas as pd
+import design
+import analysis
+import cache
+
+
+def _factors(n_factors, n_levels=2):
+    return {'x{}'.format(i): list(np.linspace(0, 1, n_levels)) for i in range(n_factors)}
+
+
+def _screening_frame(n_factors, n_responses, seed=0):
+    df = design.full_factorial_2level(_factors(n_factors))
+    rng = np.random.default_rng(seed)
+    responses = pd.DataFrame(rng.standard_normal((len(df), n_responses)),
+                             columns=['y{}'.format(j) for j in range(n_responses)])
+    return pd.concat([df, responses], axis=1)
+
+
+def cases():
+    """
+    Returns a list of (name, setup) pairs, setup returning the function to benchmark. The coded design
+    cache is emptied by each setup so that the generators are timed doing their full work.
+    """
+    sweeps = []
+    for k in (5, 10, 15):
+        sweeps.append(('full_factorial_2level(k={})'.format(k),
+                       lambda k=k: lambda: design.full_factorial_2level(_factors(k))))
+    for k in (4, 8, 10):
+        sweeps.append(('full_factorial(k={},levels=3)'.format(k),
+                       lambda k=k: lambda: design.full_factorial(_factors(k, 3))))
+    for k, runs in ((7, 8), (15, 16), (31, 32), (63, 64), (127, 128), (30, 1024)):
+        sweeps.append(('frac_fact_2level(k={},runs={})'.format(k, runs),
+                       lambda k=k, runs=runs: lambda: design.frac_fact_2level(_factors(k), runs)))
+    for k, runs in ((11, 12), (47, 48), (95, 96), (255, 256)):
+        sweeps.append(('plackett_burman(k={},runs={})'.format(k, runs),
+                       lambda k=k, runs=runs: lambda: design.plackett_burman(_factors(k), runs)))
+    for k in (3, 10, 20, 30):
+        sweeps.append(('box_behnken(k={})'.format(k),
+                       lambda k=k: lambda: design.box_behnken(_factors(k))))
+    for k in (3, 6, 10):
+        sweeps.append(('central_composite(k={})'.format(k),
+                       lambda k=k: lambda: design.central_composite(_factors(k))))
+    sweeps.append(('central_composite(k=15,runs=256)',
+                   lambda: lambda: design.central_composite(_factors(15), runs=256)))
+    for k, runs in ((5, 100), (5, 10000), (20, 100000)):
+        sweeps.append(('latin_hypercube(k={},runs={})'.format(k, runs),
+                       lambda k=k, runs=runs: lambda: design.latin_hypercube(_factors(k), runs, seed=0)))
+    sweeps.append(('latin_hypercube(k=5,runs=100,method=maximin)',
+                   lambda: lambda: design.latin_hypercube(_factors(5), 100, method='maximin', seed=0)))
+    for k in (3, 4, 6, 8):
+        sweeps.append(('fit_two_level_screening(runs={})'.format(2 ** k),
+                       lambda k=k: _bind(analysis.fit_two_level_screening, _screening_frame(k, 1))))
+    for k, n_responses in ((6, 10), (6, 100), (8, 100)):
+        sweeps.append(('fit_two_level_screening_batch(runs={},responses={})'.format(2 ** k, n_responses),
+                       lambda k=k, n_responses=n_responses: _bind_batch(_screening_frame(k, n_responses), k)))
+    return [(name, _clearing(setup)) for name, setup in sweeps]
+
+
+def _bind(function, df):
+    return lambda: function(df)
+
+
+def _bind_batch(df, n_factors):
+    factors = list(df.columns[:n_factors])
+    responses = list(df.columns[n_factors:])
+    return lambda: analysis.fit_two_level_screening_batch(df, factors, responses)
+
+
+def _clearing(setup):
+    def clearing_setup():
+        function = setup()
+
+        def run():
+            cache.clear_structure_cache()
+            return function()
+        return run
+    return clearing_setup
@@ -0,0 +1,122 @@
+"""
+Runs the benchmarks of the design generators and the screening analysis, and compares results.
+
+    python benchmarks/run.py run --output results.json
+    python benchmarks/run.py compare benchmarks/baseline.json results.json --threshold 0.25
+
+Each case records its best wall time over several repeats and the peak memory allocated during a
+single call (measured with tracemalloc). compare exits with status 1 if any case is slower or uses
+more memory than the baseline by more than the threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+import benchmarks
+
+
+def measure(setup, repeats=5, min_time=0.2):
+    """
+    Returns the best wall time in seconds and the peak traced memory in bytes of the function made by setup.
+    """
+    function = setup()
+    # A first call warms up anything cached between calls on purpose, such as the Hadamard matrices
+    function()
+    times = []
+    started = time.perf_counter()
+    while len(times) < repeats or (time.perf_counter() - started < min_time and len(times) < 100):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def run(select=None, repeats=5):
+    results = {}
+    for name, setup in benchmarks.cases():
+        if select and select not in name:
+            continue
+        seconds, peak = measure(setup, repeats)
+        results[name] = {'time': seconds, 'peak_memory': peak}
+        print('{:<55} {:>12.6f} s {:>12.1f} KiB'.format(name, seconds, peak / 1024))
+    return {'machine': {'python': platform.python_version(), 'numpy': np.__version__, 'pandas': pd.__version__,
+                        'platform': platform.platform(), 'processor': platform.processor()},
+            'results': results}
+
+
+def compare(baseline, current, threshold=0.25, memory_threshold=None):
+    """
+    Returns the names of the cases in both result sets that regressed, printing a line for every case.
+    """
+    memory_threshold = threshold if memory_threshold is None else memory_threshold
+    regressions = []
+    for name, new in current['results'].items():
+        old = baseline['results'].get(name)
+        if old is None:
+            print('{:<55} new case'.format(name))
+            continue
+        time_ratio = new['time'] / old['time'] if old['time'] else 1.0
+        memory_ratio = new['peak_memory'] / old['peak_memory'] if old['peak_memory'] else 1.0
+        flags = []
+        if time_ratio > 1 + threshold:
+            flags.append('SLOWER')
+        if memory_ratio > 1 + memory_threshold:
+            flags.append('MORE MEMORY')
+        if flags:
+            regressions.append(name)
+        print('{:<55} time x{:<8.2f} memory x{:<8.2f} {}'.format(name, time_ratio, memory_ratio, ' '.join(flags)))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmarks for designofexperiment')
+    commands = parser.add_subparsers(dest='command')
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('--output', help='file to write the results to as JSON')
+    run_parser.add_argument('--select', help='only run cases whose name contains this text')
+    run_parser.add_argument('--repeats', type=int, default=5)
+    compare_parser = commands.add_parser('compare', help='compare results with a baseline')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.25,
+                                help='allowed fractional increase in time (default 0.25)')
+    compare_parser.add_argument('--memory-threshold', type=float, default=None,
+                                help='allowed fractional increase in peak memory (default the time threshold)')
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run(args.select, args.repeats)
+        if args.output:
+            with open(args.output, 'w') as file:
+                json.dump(results, file, indent=2, sort_keys=True)
+        return 0
+    if args.command == 'compare':
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        with open(args.current) as file:
+            current = json.load(file)
+        regressions = compare(baseline, current, args.threshold, args.memory_threshold)
+        if regressions:
+            print('{} regression(s) beyond the threshold'.format(len(regressions)))
+            return 1
+        return 0
+    parser.print_help()
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
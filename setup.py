@@ -8,7 +8,19 @@ setup(
     version='1.6.2',
     description='A Python Package for intuitive design of experiments with user-friendly analysis of results',
     py_modules=["design",
-                "analysis"],
+                "analysis",
+                "hadamard",
+                "cache",
+                "aberration",
+                "hypercube",
+                "instrument",
+                "model",
+                "exchange",
+                "diagnostics",
+                "storage",
+                "walsh",
+                "cli",
+                "lenth_tables"],
     package_dir={'': 'src'},
     classifiers = [
         "Programming Language :: Python :: 3",
@@ -31,6 +43,20 @@ setup(
             "check-manifest>=0.42",
             "twine>=3.2.0"
         ],
+        "stats": [
+            "scipy"
+        ],
+        "arrow": [
+            "pyarrow"
+        ],
+        "yaml": [
+            "PyYAML"
+        ],
+    },
+    entry_points={
+        "console_scripts": [
+            "doe-batch=cli:main"
+        ],
     },
     url="https://github.com/JamesMarshall31/design-of-experiments",
     author="James Marshall, Benedict Carling",
@@ -0,0 +1,300 @@
+# Search for minimum aberration generators of two level fractional factorials
+
+import time
+import concurrent.futures
+import numpy as np
+import cache
+
+# Results of finished searches, keyed on (number of factors, runs)
+_searched = {}
+
+
+def minimum_aberration_generators(dic_factors, runs, time_limit=60, processes=None):
+    """
+    Searches for the generators of a minimum aberration fractional factorial, the design with the highest
+    resolution that also has the fewest shortest words in its defining relation. The result can be passed
+    straight to design.frac_fact_2level, or the search can be run from there with generators='minimum_aberration'.
+
+    Parameters:
+        dic_factors: The dictionary (or list) of factors to be included in the design.
+
+        runs: The number of runs the design can use, rounded down to a power of 2 as in frac_fact_2level.
+
+        time_limit: The number of seconds the search can take, when it runs out the best design found so far
+        is returned and it is not cached.
+
+        processes: The number of processes to spread the search over, None or 1 searches in this process.
+        Splitting the search means each process prunes less, so this pays off for the large searches that
+        would otherwise run out of time.
+
+    Returns:
+        generators: A list of generators such as 'Pressure=Height*Width*Depth*Temp'.
+
+    Example:
+        >>> import aberration
+        >>> Factors = {'Height':[1.6,2],'Width':[0.2,0.4],'Depth':[0.2,0.3],'Temp':[10,20],'Pressure':[100,200]}
+        >>> aberration.minimum_aberration_generators(Factors, 16)
+        ['Pressure=Height*Width*Depth*Temp']
+    """
+    factor_names = list(dic_factors)
+    runs = int((1 << (runs).bit_length()) / 2)
+    n_base = min(int(np.log2(runs)), len(factor_names))
+    words = minimum_aberration_words(len(factor_names), runs, time_limit, processes)
+    generators = []
+    for i, word in enumerate(words):
+        generators.append(factor_names[n_base + i] + '=' +
+                          '*'.join(factor_names[j] for j in range(n_base) if word >> j & 1))
+    return generators
+
+
+def minimum_aberration_words(n_factors, runs, time_limit=60, processes=None):
+    """
+    Returns the generators of a minimum aberration design as bit masks over the base factors, where
+    runs is a power of 2. Finished searches are kept in memory and in the on-disk cache.
+    """
+    n_base = int(np.log2(runs))
+    n_generated = n_factors - n_base
+    if n_generated <= 0:
+        return []
+    if n_generated > runs - 1 - n_base:
+        raise ValueError('{} runs are too few for {} factors, the design would have a resolution below three'.format(
+            runs, n_factors))
+    key = (n_factors, runs)
+    if key in _searched:
+        return list(_searched[key])
+    name = 'minimum_aberration_{}_{}'.format(n_factors, runs)
+    stored = cache.load_array(name)
+    if stored is not None and stored.shape == (n_generated,):
+        _searched[key] = [int(word) for word in stored]
+        return list(_searched[key])
+
+    search = _Search(n_base, n_generated, time.time() + time_limit)
+    search.greedy()
+    if processes is not None and processes > 1 and n_generated > 2:
+        # The classes of two column designs are shared out between the processes, each searching
+        # below the ones it is given. Branches are handed out as processes become free so that each
+        # starts from the best design found so far.
+        branches = search.branches()
+        with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+            running = set()
+            while branches or running:
+                while branches and len(running) < processes:
+                    running.add(executor.submit(_search_branch, n_base, n_generated, search.deadline,
+                                                branches.pop(0), search.best))
+                finished, running = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    pattern, words, completed = future.result()
+                    search.completed = search.completed and completed
+                    if pattern < search.best[0]:
+                        search.best = (pattern, words)
+    else:
+        search.run([])
+    words = sorted(search.best[1])
+    if search.completed:
+        _searched[key] = words
+        cache.save_array(name, np.array(words, dtype=np.int64))
+    return list(words)
+
+
+def _search_branch(n_base, n_generated, deadline, chosen, best):
+    search = _Search(n_base, n_generated, deadline)
+    search.best = best
+    search.run(list(chosen))
+    return search.best[0], search.best[1], search.completed
+
+
+class _Search:
+    """
+    A depth first search over sets of generator words, a word being a bit mask over the base factors.
+    Adding a column can only add words to the defining relation, so a partial design whose word length
+    pattern is already worse than the best complete design is not extended. Only one design of each
+    isomorphism class (designs that are the same up to relabelling factors and levels) is extended. Isomorphic
+    designs share their word length pattern and letter pattern (the number of words of each length that each
+    factor is in), so a new design is only checked for isomorphism against the designs already seen with the
+    same patterns. The patterns alone are not enough to tell classes apart, so designs are never pruned on
+    them without the check.
+    """
+
+    def __init__(self, n_base, n_generated, deadline):
+        self.n_base = n_base
+        self.n_generated = n_generated
+        self.deadline = deadline
+        n_runs = 2 ** n_base
+        # candidates are every column that is a product of at least two base factors
+        masks = np.arange(1, n_runs, dtype=np.int64)
+        self.candidates = masks[[bin(int(mask)).count('1') >= 2 for mask in masks]]
+        # parity[m, u] is 1 when column m is at its low level in run u
+        runs = np.arange(n_runs, dtype=np.int64)
+        self.parity = np.zeros((n_runs, n_runs), dtype=np.int16)
+        for bit in range(n_base):
+            self.parity ^= (((runs >> bit) & 1)[:, None] & ((runs >> bit) & 1)[None, :]).astype(np.int16)
+        self.krawtchouk = {}
+        # For each number of generated columns, the designs kept for each (word length pattern, letter pattern)
+        self.seen = [{} for _ in range(n_generated + 1)]
+        self.best = (None, [])
+        self.completed = True
+
+    def _krawtchouk(self, n_columns):
+        """
+        Returns the matrix K[w, j] of Krawtchouk polynomials, so that the word length pattern of a design
+        is the histogram of its run weights times K divided by the runs (the MacWilliams identities).
+        """
+        if n_columns not in self.krawtchouk:
+            x = np.array(range(n_columns + 1), dtype=object)
+            columns = [np.array([1] * (n_columns + 1), dtype=object), n_columns - 2 * x]
+            for j in range(1, n_columns):
+                columns.append(((n_columns - 2 * x) * columns[-1] - (n_columns - j + 1) * columns[-2]) // (j + 1))
+            matrix = np.array(columns[:n_columns + 1], dtype=object).T
+            # Exact 64 bit integers are used whenever they cannot overflow
+            largest = max(abs(int(value)) for value in matrix.ravel())
+            if largest * 2 ** self.n_base < 2 ** 62:
+                matrix = matrix.astype(np.int64)
+            self.krawtchouk[n_columns] = matrix
+        return self.krawtchouk[n_columns]
+
+    def _patterns(self, weights, n_columns):
+        # weights has one row per design, the result has one word length pattern per design
+        histogram = np.zeros((len(weights), n_columns + 1), dtype=np.int64)
+        offsets = (weights + (n_columns + 1) * np.arange(len(weights))[:, None]).ravel()
+        histogram.ravel()[:] = np.bincount(offsets, minlength=histogram.size)
+        return (histogram @ self._krawtchouk(n_columns)) // 2 ** self.n_base
+
+    def _key(self, pattern):
+        # Patterns are compared from the shortest words, padded to the length of a complete design
+        n_factors = self.n_base + self.n_generated
+        return tuple(int(value) for value in pattern[1:]) + (0,) * (n_factors + 1 - len(pattern))
+
+    def _children(self, chosen):
+        """
+        Returns (key, mask, weights) of every design made by adding one more column to chosen,
+        best first and without any that are worse than the best complete design.
+        """
+        n_columns = self.n_base + len(chosen) + 1
+        weights = self._weights(chosen)
+        unused = self.candidates[~np.isin(self.candidates, chosen)]
+        child_weights = weights[None, :] + self.parity[unused]
+        keys = [self._key(pattern) for pattern in self._patterns(child_weights, n_columns)]
+        children = sorted(zip(keys, unused.tolist(), range(len(unused))))
+        return [(key, mask, child_weights[i]) for key, mask, i in children
+                if self.best[0] is None or key <= self.best[0]]
+
+    def _weights(self, chosen):
+        columns = [1 << j for j in range(self.n_base)] + list(chosen)
+        return self.parity[columns].sum(axis=0)
+
+    def _letter_rows(self, columns, weights):
+        # Row i is the word length pattern of the words that column i is in
+        n_columns = len(columns)
+        reduced = self._patterns(weights[None, :] - self.parity[columns], n_columns - 1)
+        whole = self._patterns(weights[None, :], n_columns)[0]
+        # Only the one word made of every column can have length n_columns
+        letters = whole[None, :] - np.hstack([reduced, np.zeros((n_columns, 1), dtype=reduced.dtype)])
+        return [tuple(int(value) for value in row) for row in letters]
+
+    def _new_class(self, chosen, key, weights):
+        columns = [1 << j for j in range(self.n_base)] + list(chosen)
+        rows = self._letter_rows(columns, weights)
+        kept = self.seen[len(chosen)].setdefault((key, tuple(sorted(rows))), [])
+        for other_columns, other_rows in kept:
+            if _isomorphic(columns, rows, other_columns, other_rows, self.n_base):
+                return False
+        kept.append((columns, rows))
+        return True
+
+    def greedy(self):
+        # The best single column is added each time, giving a first design to compare against. Columns that
+        # are products of an odd number of base factors never make words of length three, so a second
+        # design made only from those is tried when there are enough of them.
+        all_candidates = self.candidates
+        odd = all_candidates[[bin(int(mask)).count('1') % 2 == 1 for mask in all_candidates]]
+        best = (None, [])
+        for candidates in (all_candidates, odd):
+            if len(candidates) < self.n_generated:
+                continue
+            self.candidates = candidates
+            chosen = []
+            while len(chosen) < self.n_generated:
+                key, mask, weights = self._children(chosen)[0]
+                chosen.append(mask)
+            if best[0] is None or key < best[0]:
+                best = (key, chosen)
+        self.candidates = all_candidates
+        self.best = best
+
+    def branches(self):
+        branches = []
+        for key, mask, weights in self._children([]):
+            if self._new_class([mask], key, weights):
+                for second_key, second, second_weights in self._children([mask]):
+                    if self._new_class([mask, second], second_key, second_weights):
+                        branches.append([mask, second])
+        return branches
+
+    def run(self, chosen):
+        if len(chosen) == self.n_generated:
+            return
+        for key, mask, weights in self._children(chosen):
+            if time.time() > self.deadline:
+                self.completed = False
+                return
+            # Children are sorted, so once one is worse than the best design all the rest are too
+            if key > self.best[0]:
+                return
+            if not self._new_class(chosen + [mask], key, weights):
+                continue
+            if len(chosen) + 1 == self.n_generated:
+                if key < self.best[0]:
+                    self.best = (key, chosen + [mask])
+            else:
+                self.run(chosen + [mask])
+
+
+def _isomorphic(columns, rows, other_columns, other_rows, n_base):
+    """
+    Returns True if two regular two level designs are isomorphic, that is one becomes the other by
+    relabelling its factors and levels. The columns are bit masks over n_base base factors, the first
+    n_base being the base factors themselves, and rows gives an invariant of each column (such as its
+    row of the letter pattern) that an isomorphism must keep.
+
+    Relabelling the factors and levels of a regular design is an invertible linear map over GF(2) taking
+    one set of columns onto the other, and the map is fixed by where it sends the base factors. Base factor
+    t is tried at each column of the other design with the same invariant that is independent of the
+    images already chosen, and every column made only of base factors 0 to t must then land on a column of
+    the other design with the same invariant, which prunes most choices straight away.
+
+    Example:
+        >>> import aberration
+        >>> # E=ABC and E=ABD are the same design with C and D swapped, E=AB is not
+        >>> aberration._isomorphic([1, 2, 4, 8, 7], [0] * 5, [1, 2, 4, 8, 11], [0] * 5, 4)
+        True
+        >>> aberration._isomorphic([1, 2, 4, 8, 7], [0] * 5, [1, 2, 4, 8, 3], [0] * 5, 4)
+        False
+    """
+    if len(columns) != len(other_columns) or sorted(rows) != sorted(other_rows):
+        return False
+    invariant = dict(zip(columns, rows))
+    other_invariant = dict(zip(other_columns, other_rows))
+    alike = {}
+    for column, row in zip(other_columns, other_rows):
+        alike.setdefault(row, []).append(column)
+    # The columns whose highest base factor is t, checked once base factor t has its image
+    by_top = [[] for _ in range(n_base)]
+    for column in columns:
+        by_top[column.bit_length() - 1].append(column)
+
+    def extend(mapped):
+        # mapped[v] is the image of column v for every v made of the base factors given images so far
+        t = len(mapped).bit_length() - 1
+        if t == n_base:
+            return True
+        span = set(mapped)
+        for candidate in alike[invariant[1 << t]]:
+            if candidate in span:
+                continue
+            if all(other_invariant.get(mapped[column ^ 1 << t] ^ candidate) == invariant[column]
+                   for column in by_top[t]):
+                if extend(mapped + [value ^ candidate for value in mapped]):
+                    return True
+        return False
+
+    return extend([0])
@@ -1,16 +1,33 @@
 import numpy as np
-import design
 import pandas as pd
 import itertools
+import functools
+import concurrent.futures
+import cache
+import model as model_module
+import instrument
+import walsh
 
 
-def fit_two_level_screening(df):
+@instrument.instrumented
+def fit_two_level_screening(df, n_simulations=None, seed=None, engine='auto'):
     """
     Returns p-values for unreplicated two level  factorial designs
 
     Parameters:
         df: The dataframe containing the experimental design
 
+        n_simulations: By default the p-values are looked up in the precomputed reference distribution of
+        the Lenth t-ratios (see lenth_reference), if a number is given a fresh Monte Carlo simulation
+        of that many runs is used instead.
+
+        seed: Seed for the random number generator of a fresh simulation, the same seed gives the same p-values.
+
+        engine: How the contrasts are found. 'fwht' uses a fast Walsh-Hadamard transform of the results
+        (Yates' algorithm), which needs a full or regular fractional factorial with a power of two runs.
+        'dense' multiplies the results by the full T matrix, which works for any design but needs n^2 memory.
+        'auto' (the default) uses 'fwht' whenever the design allows it and 'dense' otherwise.
+
     Returns:
          Dataframe of P Values
 
@@ -22,97 +39,796 @@ def fit_two_level_screening(df):
         >>>df['Yield'] = [60,52,54,45,72,83,68,80]
         >>>print(fit_two_level_screening(df))
                                     Individual p-Value
-        Temp                                   0.0017
-        Concentration                          0.0610
-        Enzyme                                 0.4551
-        Temp*Concentration                     0.5014
-        Temp*Enzyme                            0.0142
+        Temp                                   0.0020
+        Concentration                          0.0542
+        Enzyme                                 0.4600
+        Temp*Concentration                     0.4600
+        Temp*Enzyme                            0.0137
         Concentration*Enzyme                   1.0000
-        Temp*Concentration*Enzyme              0.8516
+        Temp*Concentration*Enzyme              0.8511
     """
     n = len(df.index)
     # p_columns_list stores all the actual variable names, by stopping before the last column it doesnt include results
     p_columns_list = list(df.columns)[:-1]
-    # Creating the T matrix
-    # ------------------------
-    t_matrix = np.ones((n, n), dtype=int)
-    # count variable keeps track of what row of the t-matrix is currently being added to
-    count = 1
-    # for loop to set all numbers to one or minus one
-    for i in df.columns[0:-1]:
-        high = max(df[i])
-        low = min(df[i])
-        df[i] = (df[i].map({high: 1, low: -1}))
-        t_matrix[count] = df[i]
-        count += 1
-
-    rows_remaining = n - (len(df.columns))
-    t_rows = []  # we are technically making the transpose of the T matrix as we are adding to the rows
-    r = 2
-    combination_check = 0
-    for x in range(1, count):
-        t_rows.append(x)
-    while rows_remaining > 0:
-        for combination in itertools.combinations(t_rows, r):
-            string =''
-            for i in combination:
-                string = string + p_columns_list[i-1] + '*'
-            t_matrix[count] = 1
-            string = string[:-1]        # Get rid of asterisk at end
-            p_columns_list.append(string)
-            for i in range(r):
-                t_matrix[count] = t_matrix[count] * t_matrix[combination[i]]
-            rows_remaining -= 1
-            count += 1
-            combination_check += 1
-            if combination_check == len(list(itertools.combinations(t_rows, r))):
-                r += 1
-                combination_check = 0
-                break
-            if rows_remaining == 0:
-                break
-    t_matrix = t_matrix/np.sqrt(n)      # to normalize
+    # The factors are coded as one and minus one, the dataframe passed in is left as it is
+    with instrument.stage('coding'):
+        instrument.note(rows=n, columns=len(p_columns_list))
+        coded = _code_two_level(df, p_columns_list)
+
+    # Each contrast after the main effects is an interaction, these are taken in the order
+    # of all two factor interactions, then all three factor interactions etc.. until there are n - 1
+    combinations = _effect_combinations(len(p_columns_list), n - 1)
+    p_columns_list = _effect_names(p_columns_list, combinations)
 
     # Using the T matrix to get the contrasts
     # ---------------------------------------
-    results = np.array(df.iloc[:,-1:]).reshape(n, 1)
-    Contrasts = np.matmul(t_matrix, results)        # The first index is the intercept contrast
-    Contrasts = Contrasts[1:n]
+    results = np.array(df.iloc[:,-1:], dtype=float).reshape(n, 1)
+    with instrument.stage('contrasts'):
+        Contrasts = _contrasts(coded, combinations, results, engine)
 
     # Calculating Lenth's Pseudo-Standard Error
     # ---------------------------------------
-    v = 1.5 * np.median(abs(Contrasts))
-    PSE = 1.5 * np.median(abs(Contrasts[abs(Contrasts) < (2.5 * v)]))
+    with instrument.stage('pse'):
+        abs_contrasts = abs(Contrasts).reshape(1, n - 1)
+        PSE = _lenth_pse(abs_contrasts)
 
     # Calculate Lenth t-ratios for each contrast
     # -----------------------------------------
-    t_ratios = abs(Contrasts/PSE)
+    t_ratios = abs_contrasts[0] / PSE[0]
 
-    # Run Monte Carlo simulations to generate contrasts
-    # -----------------------------------------
-    sim_t_ratio = []
-    for i in range(10000):
-        simulation = np.array(np.random.normal(0, PSE, n-1))
-        v_sim = 1.5 * np.median(abs(simulation))
-        PSE_sim = 1.5 * np.median(abs(simulation[abs(simulation) < (2.5 * v_sim)]))
-        sim_t_ratio.append(abs(simulation / PSE_sim))
-    # Reorder these t-values so our t-values can be found in relation to it
-    simulated_t_reordered = np.zeros((n-1, 10000))
-    for j in range(n-1):
-        for i in range(10000):
-            simulated_t_reordered[j][i] = sim_t_ratio[i][j]
-        simulated_t_reordered[j] = np.sort(simulated_t_reordered[j])
-    p_value = []
-    for j in range(n-1):
-        for i in range(10000):
-            if t_ratios[j][0] < simulated_t_reordered[j][i]:
-                p_value.append(1 - (i / 10000))
-                break
+    # The t-ratios have the same distribution whatever the scale of the contrasts, so unless a fresh
+    # simulation is asked for the p-values come from the reference distribution for this many contrasts
+    if n_simulations is None:
+        with instrument.stage('p_values'):
+            p_value = list(lenth_p_values(t_ratios, n - 1))
+    else:
+        # Run Monte Carlo simulations to generate contrasts
+        # -----------------------------------------
+        # All the simulations are made at once, one per row, from a standard normal distribution.
+        with instrument.stage('simulation'):
+            rng = np.random.default_rng(seed)
+            simulation = abs(rng.standard_normal((n_simulations, n - 1)))
+            instrument.note(nbytes=simulation.nbytes)
+            sim_t_ratio = simulation / _lenth_pse(simulation)[:, None]
+        # Sort each contrast's simulated t-values so our t-values can be found in relation to them,
+        # the p-value is the fraction of simulated t-values that are larger than ours
+        with instrument.stage('p_values'):
+            simulated_t_sorted = np.sort(sim_t_ratio, axis=0)
+            p_value = []
+            for j in range(n - 1):
+                position = np.searchsorted(simulated_t_sorted[:, j], t_ratios[j], side='right')
+                p_value.append(1 - (position / n_simulations))
     p_values = pd.DataFrame(p_value,index=p_columns_list,columns=['Individual p-Value'])
     return p_values
 
 
-factors = {'Temp':[50,25],'Concentration':[0.4,0.6],'Enzyme':[-1,1]}
-df = design.full_factorial_2level(factors)
-df['Yield'] = [60,52,54,45,72,83,68,80]
-print(fit_two_level_screening(df))
\ No newline at end of file
+@instrument.instrumented
+def fit_two_level_screening_batch(df, factors, responses, engine='auto'):
+    """
+    Returns p-values for many responses of the same unreplicated two level factorial design in one pass.
+    The contrasts of every response come from a single transform (or matrix product) of all the
+    response columns together and the p-values from the Lenth reference distribution, so screening
+    a whole panel of responses costs about the same as screening one.
+
+    Parameters:
+        df: The dataframe containing the experimental design and the results.
+
+        factors: The names of the factor columns.
+
+        responses: The names of the response columns.
+
+        engine: 'fwht', 'dense' or 'auto', see fit_two_level_screening.
+
+    Returns:
+        A tidy dataframe with one row per response and effect, giving the contrast, Lenth t-ratio and
+        individual p-value.
+
+    Example:
+        >>> import analysis
+        >>> import design
+        >>> factors = {'Temp':[50,25],'Concentration':[0.4,0.6],'Enzyme':[-1,1]}
+        >>> df = design.full_factorial_2level(factors)
+        >>> df['Yield'] = [60,52,54,45,72,83,68,80]
+        >>> df['Purity'] = [91,92,90,93,90,89,91,92]
+        >>> analysis.fit_two_level_screening_batch(df, list(factors), ['Yield','Purity']).head(3)
+          Response         Effect  Contrast  Lenth t-Ratio  Individual p-Value
+        0    Yield           Temp  32.526912      10.222222            0.002000
+        1    Yield  Concentration  -7.071068       2.222222            0.054175
+        2    Yield         Enzyme   2.121320       0.666667            0.460000
+    """
+    factors = list(factors)
+    responses = list(responses)
+    n = len(df.index)
+    with instrument.stage('coding'):
+        instrument.note(rows=n, columns=len(factors), responses=len(responses))
+        coded = _code_two_level(df, factors)
+    combinations = _effect_combinations(len(factors), n - 1)
+    names = _effect_names(factors, combinations)
+
+    # contrasts has one row per effect and one column per response
+    with instrument.stage('contrasts'):
+        contrasts = _contrasts(coded, combinations, np.array(df[responses], dtype=float), engine)
+    with instrument.stage('pse'):
+        abs_contrasts = abs(contrasts.T)
+        PSE = _lenth_pse(abs_contrasts)
+        t_ratios = abs_contrasts / PSE[:, None]
+    with instrument.stage('p_values'):
+        p_values = lenth_p_values(t_ratios, n - 1)
+    return pd.DataFrame({'Response': np.repeat(responses, len(names)),
+                         'Effect': np.tile(names, len(responses)),
+                         'Contrast': contrasts.T.ravel(),
+                         'Lenth t-Ratio': t_ratios.ravel(),
+                         'Individual p-Value': p_values.ravel()})
+
+
+# Resamples are made in chunks of about this many values, so each chunk is one vectorised call
+_RESAMPLE_CHUNK_VALUES = 2 ** 21
+
+
+@instrument.instrumented
+def permutation_test(df, n_permutations=10000, seed=None, processes=None, engine='auto'):
+    """
+    Returns permutation p-values for the effects of an unreplicated two level factorial design. The results
+    are shuffled among the runs many times, each shuffle giving the contrasts that would be seen if no
+    factor had any effect, and the p-value of an effect is the fraction of shuffles with a contrast at least
+    as large. Unlike Lenth's method this assumes nothing about how many effects are active.
+
+    The shuffles are made in chunks, each with its own random stream spawned from the seed, so the p-values
+    are the same for a seed whatever the number of processes.
+
+    Parameters:
+        df: The dataframe containing the experimental design, with the results in the last column.
+
+        n_permutations: The number of shuffles of the results.
+
+        seed: Seed for the random number generator.
+
+        processes: The number of processes to share the chunks of shuffles between, None or 1 uses this one.
+
+        engine: 'fwht', 'dense' or 'auto', see fit_two_level_screening.
+
+    Returns:
+        df: A dataframe with the contrast and permutation p-value of each effect.
+
+    Example:
+        >>> import analysis
+        >>> import design
+        >>> factors = {'Temp':[50,25],'Concentration':[0.4,0.6],'Enzyme':[-1,1]}
+        >>> df = design.full_factorial_2level(factors)
+        >>> df['Yield'] = [60,52,54,45,72,83,68,80]
+        >>> analysis.permutation_test(df, seed=1).round(3)
+                                   Contrast  Permutation p-Value
+        Temp                         32.527                0.027
+        Concentration                -7.071                0.623
+        Enzyme                        2.121                0.946
+        Temp*Concentration            2.121                0.942
+        Temp*Enzyme                  14.142                0.344
+        Concentration*Enzyme          0.000                1.000
+        Temp*Concentration*Enzyme     0.707                0.971
+    """
+    coded, combinations, names, results = _screening_parts(df)
+    with instrument.stage('contrasts'):
+        observed = _contrasts(coded, combinations, results[:, None], engine)[:, 0]
+    chunks = _resample_chunks(n_permutations, len(results), seed)
+    arguments = [('permutation', coded, combinations, results, engine, size, seed_sequence, abs(observed))
+                 for size, seed_sequence in chunks]
+    with instrument.stage('resampling'):
+        instrument.note(resamples=n_permutations, chunks=len(chunks))
+        counts = sum(_map(_resample_chunk, arguments, processes))
+    # The observed arrangement counts as one of the permutations, so no p-value is ever zero
+    p_values = (counts + 1) / (n_permutations + 1)
+    return pd.DataFrame({'Contrast': observed, 'Permutation p-Value': p_values}, index=names)
+
+
+@instrument.instrumented
+def bootstrap_intervals(df, n_bootstrap=10000, alpha=0.05, active=None, seed=None, processes=None,
+                        engine='auto'):
+    """
+    Returns bootstrap confidence intervals for the contrasts of an unreplicated two level factorial design.
+    The active effects (the main effects unless given) are fitted and the residuals, scaled up for the
+    effects fitted, are resampled with replacement and added back to the fitted values to make each
+    bootstrap set of results. The intervals are the alpha / 2 and 1 - alpha / 2 quantiles of the contrasts.
+
+    The resamples are made in chunks with their own random streams spawned from the seed, so the intervals
+    are the same for a seed whatever the number of processes.
+
+    Parameters:
+        df: The dataframe containing the experimental design, with the results in the last column.
+
+        n_bootstrap: The number of bootstrap resamples.
+
+        alpha: One minus the coverage of the intervals.
+
+        active: The names of the effects treated as active, such as ['Temp', 'Temp*Enzyme'], if None the
+        main effects. Every other effect is treated as noise, so at least one must be left out.
+
+        seed: Seed for the random number generator.
+
+        processes: The number of processes to share the chunks of resamples between, None or 1 uses this one.
+
+        engine: 'fwht', 'dense' or 'auto', see fit_two_level_screening.
+
+    Returns:
+        df: A dataframe with the contrast and the lower and upper limits of its interval for each effect.
+    """
+    coded, combinations, names, results = _screening_parts(df)
+    if active is None:
+        active = names[:coded.shape[1]]
+    for name in active:
+        if name not in names:
+            raise ValueError('{} is not an effect of the design'.format(name))
+    if len(set(active)) >= len(names):
+        raise ValueError('At least one effect must be left out of active to estimate the noise')
+    n = len(results)
+    with instrument.stage('contrasts'):
+        observed = _contrasts(coded, combinations, results[:, None], engine)[:, 0]
+        # The rows of the T matrix are orthonormal, so the fitted values of the active effects are
+        # the mean plus their rows weighted by their contrasts
+        active_rows = _t_matrix(coded, [combinations[names.index(name)] for name in active])
+        fitted = results.mean() + active_rows.T @ observed[[names.index(name) for name in active]]
+        residuals = (results - fitted) * np.sqrt(n / (n - 1 - len(active)))
+    chunks = _resample_chunks(n_bootstrap, n, seed)
+    arguments = [('bootstrap', coded, combinations, (fitted, residuals), engine, size, seed_sequence, None)
+                 for size, seed_sequence in chunks]
+    with instrument.stage('resampling'):
+        instrument.note(resamples=n_bootstrap, chunks=len(chunks))
+        samples = np.hstack(_map(_resample_chunk, arguments, processes))
+    with instrument.stage('quantiles'):
+        lower, upper = np.quantile(samples, [alpha / 2, 1 - alpha / 2], axis=1)
+    return pd.DataFrame({'Contrast': observed, 'Lower': lower, 'Upper': upper}, index=names)
+
+
+def _screening_parts(df):
+    # The coded design, effects and results of an unreplicated two level design, as in fit_two_level_screening
+    factors = list(df.columns)[:-1]
+    coded = _code_two_level(df, factors)
+    combinations = _effect_combinations(len(factors), len(df.index) - 1)
+    results = np.array(df.iloc[:, -1], dtype=float)
+    return coded, combinations, _effect_names(factors, combinations), results
+
+
+def _resample_chunks(n_resamples, n_runs, seed):
+    """
+    Returns the size and random stream of each chunk of resamples. The chunks depend only on the
+    number of resamples and runs, so a seed gives the same resamples however they are shared out.
+    """
+    chunk = max(1, _RESAMPLE_CHUNK_VALUES // max(n_runs, 1))
+    sizes = [min(chunk, n_resamples - start) for start in range(0, n_resamples, chunk)]
+    return list(zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))))
+
+
+def _map(function, arguments, processes):
+    if processes is not None and processes > 1 and len(arguments) > 1:
+        with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+            return list(executor.map(function, arguments))
+    return [function(argument) for argument in arguments]
+
+
+def _resample_chunk(argument):
+    """
+    Makes one chunk of resamples, all at once with one column per resample. A permutation chunk returns
+    how often each absolute contrast reached the observed one, a bootstrap chunk its contrasts.
+    """
+    kind, coded, combinations, results, engine, size, seed_sequence, observed = argument
+    rng = np.random.default_rng(seed_sequence)
+    if kind == 'permutation':
+        shuffled = np.argsort(rng.random((len(results), size)), axis=0)
+        contrasts = _contrasts(coded, combinations, results[shuffled], engine)
+        # A small allowance stops rounding errors deciding ties
+        return (abs(contrasts) >= observed[:, None] * (1 - 1e-12)).sum(axis=1)
+    fitted, residuals = results
+    resampled = fitted[:, None] + residuals[rng.integers(0, len(residuals), size=(len(residuals), size))]
+    return _contrasts(coded, combinations, resampled, engine)
+
+
+@instrument.instrumented
+def fit_response_surface(df, factors=None, responses=None, model='quadratic', dic_factors=None):
+    """
+    Fits a least squares model (such as a response surface) to one or many responses of any design, with
+    an analysis of variance that splits the residual into lack of fit and pure error when runs are repeated.
+    The model matrix is factorised (QR) once for the design and the factorisation is cached, so every
+    response, and every later fit on the same design, only costs a multiplication by the stored factors.
+    The p-values need scipy, which is only imported here.
+
+    Parameters:
+        df: The dataframe containing the experimental design and the results.
+
+        factors: The names of the factor columns, if None the keys of dic_factors or, failing that, every
+        column but the last.
+
+        responses: The names of the response columns, if None every column that is not a factor.
+
+        model: 'linear', 'interaction', 'quadratic' (the default) or a list of terms such as
+        ['Temp', 'Time', 'Temp*Time', 'Temp^2'], the intercept is always included.
+
+        dic_factors: The dictionary of factors the design was made from, used to code the factors from
+        -1 to +1 (and to order the levels of categorical factors). If None each factor is coded from its
+        lowest to its highest value in df.
+
+    Returns:
+        fit: A dictionary of three dataframes. 'coefficients' has one row per response and model column with
+        its coefficient (in coded units), standard error, t-ratio and p-value. 'anova' has one row per
+        response and source (Model, Error, Lack of Fit, Pure Error, Total) with the degrees of freedom,
+        sums of squares, mean squares, F-ratios and p-values. 'summary' has one row per response with R^2,
+        adjusted R^2 and the root mean square error.
+
+    Example:
+        >>> import analysis
+        >>> import design
+        >>> factors = {'Temp':[20,40],'Time':[10,30]}
+        >>> df = design.central_composite(factors, alpha='face', centre_points=3)
+        >>> df['Yield'] = [52.3,57.5,60.2,62.4,60.7,55.1,61.8,58.5,59.6,60.6,59.9]
+        >>> analysis.fit_response_surface(df)['anova'].round(3)
+          Response       Source  DF  Sum of Squares  Mean Square  F-Ratio  p-Value
+        0    Yield        Model   5          89.248       17.850  111.879    0.000
+        1    Yield        Error   5           0.798        0.160      NaN      NaN
+        2    Yield  Lack of Fit   3           0.271        0.090    0.343    0.802
+        3    Yield   Pure Error   2           0.527        0.263      NaN      NaN
+        4    Yield        Total  10          90.045          NaN      NaN      NaN
+    """
+    if factors is None:
+        factors = list(dic_factors) if dic_factors is not None else list(df.columns)[:-1]
+    factors = list(factors)
+    if responses is None:
+        responses = [name for name in df.columns if name not in factors]
+    responses = list(responses)
+    with instrument.stage('coding'):
+        instrument.note(rows=len(df.index), columns=len(factors), responses=len(responses))
+        coded, level_counts, factor_names = model_module.code_design(df[factors], dic_factors)
+        categorical = [count is not None for count in level_counts]
+        terms = model_module.model_terms(model, factor_names, categorical)
+        levels = [list(dic_factors[name]) if dic_factors is not None else sorted(set(df[name]))
+                  for name in factor_names]
+        names = model_module.column_names(terms, factor_names, level_counts, levels)
+        matrix = model_module.model_matrix(coded, terms, level_counts)
+    n, p = matrix.shape
+    if n <= p:
+        raise ValueError('The model has {} columns so needs more than {} runs to be fitted'.format(p, n))
+    with instrument.stage('factorisation'):
+        q, r_inverse = _least_squares_factors(matrix)
+    results = np.array(df[responses], dtype=float)
+
+    with instrument.stage('solve'):
+        projected = q.T @ results
+        coefficients = r_inverse @ projected
+        residuals = results - q @ projected
+    from scipy import stats
+    with instrument.stage('anova'):
+        error_ss = (residuals ** 2).sum(axis=0)
+        total_ss = ((results - results.mean(axis=0)) ** 2).sum(axis=0)
+        model_ss = total_ss - error_ss
+        error_df = n - p
+        error_ms = error_ss / error_df
+        # Pure error is the variation between repeats of the same run, what is left is lack of fit
+        groups = np.unique(coded, axis=0, return_inverse=True)[1].ravel()
+        n_groups = groups.max() + 1
+        group_means = np.zeros((n_groups, results.shape[1]))
+        np.add.at(group_means, groups, results)
+        group_means /= np.bincount(groups, minlength=n_groups)[:, None]
+        pure_ss = ((results - group_means[groups]) ** 2).sum(axis=0)
+        pure_df = n - n_groups
+        standard_errors = np.sqrt(np.outer((r_inverse ** 2).sum(axis=1), error_ms))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_ratios = coefficients / standard_errors
+            model_f = (model_ss / (p - 1)) / error_ms
+            model_p = stats.f.sf(model_f, p - 1, error_df) if p > 1 else np.full(len(responses), np.nan)
+            lack_df = error_df - pure_df
+            lack_ms = (error_ss - pure_ss) / max(lack_df, 1)
+            lack_f = lack_ms / (pure_ss / max(pure_df, 1))
+            lack_p = stats.f.sf(lack_f, max(lack_df, 1), max(pure_df, 1))
+            rows = []
+            for i, response in enumerate(responses):
+                rows.append([response, 'Model', p - 1, model_ss[i], model_ss[i] / (p - 1), model_f[i], model_p[i]])
+                rows.append([response, 'Error', error_df, error_ss[i], error_ms[i], np.nan, np.nan])
+                if pure_df > 0 and lack_df > 0:
+                    rows.append([response, 'Lack of Fit', lack_df, error_ss[i] - pure_ss[i], lack_ms[i], lack_f[i],
+                                 lack_p[i]])
+                    rows.append([response, 'Pure Error', pure_df, pure_ss[i], pure_ss[i] / pure_df, np.nan, np.nan])
+                rows.append([response, 'Total', n - 1, total_ss[i], np.nan, np.nan, np.nan])
+            r_squared = 1 - error_ss / total_ss
+            adjusted = 1 - error_ms / (total_ss / (n - 1))
+    anova = pd.DataFrame(rows, columns=['Response', 'Source', 'DF', 'Sum of Squares', 'Mean Square', 'F-Ratio',
+                                        'p-Value'])
+    coefficient_table = pd.DataFrame({'Response': np.repeat(responses, p),
+                                      'Term': np.tile(names, len(responses)),
+                                      'Coefficient': coefficients.T.ravel(),
+                                      'Std Error': standard_errors.T.ravel(),
+                                      't-Ratio': t_ratios.T.ravel(),
+                                      'p-Value': 2 * stats.t.sf(abs(t_ratios.T.ravel()), error_df)})
+    summary = pd.DataFrame({'R^2': r_squared, 'Adjusted R^2': adjusted, 'RMSE': np.sqrt(error_ms)},
+                           index=pd.Index(responses, name='Response'))
+    return {'coefficients': coefficient_table, 'anova': anova, 'summary': summary}
+
+
+def _least_squares_factors(matrix):
+    """
+    Returns Q and the inverse of R from the QR factorisation of a model matrix, cached by the contents
+    of the matrix so that refitting the same design does not factorise it again. The inverse of R gives
+    the coefficients (R^-1 Q^T y) and their variances (the squared row lengths of R^-1) by multiplication.
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=float)
+    return _qr_factors(matrix.shape, matrix.tobytes())
+
+
+# The factors are floats kept apart from the cache of coded designs, keyed on the model matrix itself
+@functools.lru_cache(maxsize=32)
+def _qr_factors(shape, data):
+    matrix = np.frombuffer(data, dtype=float).reshape(shape)
+    q, r = np.linalg.qr(matrix)
+    diagonal = abs(np.diag(r))
+    if diagonal.min() <= 1e-10 * max(diagonal.max(), 1):
+        raise ValueError('The design cannot estimate every term of the model, some are confounded')
+    r_inverse = np.linalg.solve(r, np.eye(len(r)))
+    # The same arrays are handed to every caller
+    q.flags.writeable = False
+    r_inverse.flags.writeable = False
+    return q, r_inverse
+
+
+class IncrementalFit:
+    """
+    A least squares fit of a model that is updated as the results of runs come in, one at a time or in
+    batches, in any order and before the design is complete. The sums of squares and cross products are
+    kept and, once the runs so far can estimate the model, so is the inverse of the information matrix,
+    which each new run updates with a Sherman-Morrison step. Adding a run therefore costs O(p^2) for a
+    model of p columns rather than refitting every run.
+
+    Parameters:
+        design: The design being run, a Design or a dataframe of the factor columns.
+
+        model: 'linear' (the default), 'interaction', 'quadratic' or a list of terms, see fit_response_surface.
+
+        dic_factors: The dictionary of factors, used to code the factors from -1 to +1. If None each factor
+        is coded from its lowest to its highest level in the design.
+
+    Example:
+        >>> import analysis
+        >>> import design
+        >>> factors = {'Temp':[50,25],'Concentration':[0.4,0.6],'Enzyme':[-1,1]}
+        >>> fit = analysis.IncrementalFit(design.full_factorial_2level(factors))
+        >>> fit.add([0, 1, 2, 3, 4], [60, 52, 54, 45, 72])
+        >>> fit.add(5, 83)
+        >>> fit.n_observations
+        6
+        >>> fit.coefficients()['Coefficient'].round(3)
+        Intercept        63.50
+        Temp             10.75
+        Concentration    -3.25
+        Enzyme           -1.00
+        Name: Coefficient, dtype: float64
+    """
+
+    def __init__(self, design, model='linear', dic_factors=None):
+        if hasattr(design, 'to_dataframe'):
+            design = design.to_dataframe()
+        if dic_factors is None:
+            dic_factors = {name: sorted(set(design[name])) for name in design.columns}
+        self.dic_factors = dic_factors
+        self.factor_names = list(dic_factors)
+        coded, self.level_counts, _ = model_module.code_design(design[self.factor_names], dic_factors)
+        categorical = [count is not None for count in self.level_counts]
+        self.terms = model_module.model_terms(model, self.factor_names, categorical)
+        levels = [list(dic_factors[name]) for name in self.factor_names]
+        self.names = model_module.column_names(self.terms, self.factor_names, self.level_counts, levels)
+        self._design_rows = model_module.model_matrix(coded, self.terms, self.level_counts)
+        p = self._design_rows.shape[1]
+        self.n_observations = 0
+        self._information = np.zeros((p, p))
+        self._inverse = None
+        self._cross = np.zeros(p)
+        self._sum = 0.0
+        self._sum_squares = 0.0
+
+    def add(self, runs, results):
+        """
+        Adds the results of some runs.
+
+        Parameters:
+            runs: The index of a run of the design, a list of them, or a dataframe of the factor levels of
+            the runs (which need not be in the design).
+
+            results: The result of each run.
+        """
+        if hasattr(runs, 'columns'):
+            coded = model_module.code_design(runs[self.factor_names], self.dic_factors)[0]
+            rows = model_module.model_matrix(coded, self.terms, self.level_counts)
+        else:
+            rows = self._design_rows[np.atleast_1d(np.asarray(runs, dtype=np.intp))]
+        results = np.atleast_1d(np.asarray(results, dtype=float))
+        if len(results) != len(rows):
+            raise ValueError('There must be one result for each run, not {} for {} runs'.format(len(results),
+                                                                                               len(rows)))
+        for row in rows:
+            self._information += np.outer(row, row)
+            if self._inverse is not None:
+                # Sherman-Morrison update of the inverse for one more run
+                projected = self._inverse @ row
+                self._inverse -= np.outer(projected, projected) / (1 + row @ projected)
+        self._cross += rows.T @ results
+        self._sum += results.sum()
+        self._sum_squares += results @ results
+        self.n_observations += len(rows)
+        p = len(self._cross)
+        if self._inverse is None and self.n_observations >= p and np.linalg.matrix_rank(self._information) == p:
+            # The first time the model can be estimated the inverse is found directly, after that it is updated
+            self._inverse = np.linalg.inv(self._information)
+
+    @property
+    def estimable(self):
+        """
+        True once the runs so far can estimate every column of the model.
+        """
+        return self._inverse is not None
+
+    @property
+    def residual_degrees_of_freedom(self):
+        return self.n_observations - len(self._cross)
+
+    def _solution(self):
+        if self._inverse is None:
+            nan = np.full(len(self._cross), np.nan)
+            return nan, np.nan, np.nan
+        coefficients = self._inverse @ self._cross
+        error_ss = max(self._sum_squares - coefficients @ self._cross, 0.0)
+        total_ss = self._sum_squares - self._sum ** 2 / self.n_observations
+        return coefficients, error_ss, total_ss
+
+    @property
+    def residual_variance(self):
+        """
+        The estimate of the error variance, NaN until there are more runs than model columns.
+        """
+        coefficients, error_ss, total_ss = self._solution()
+        if self.residual_degrees_of_freedom <= 0:
+            return np.nan
+        return error_ss / self.residual_degrees_of_freedom
+
+    @property
+    def r_squared(self):
+        coefficients, error_ss, total_ss = self._solution()
+        return 1 - error_ss / total_ss if total_ss > 0 else np.nan
+
+    def coefficients(self):
+        """
+        Returns a dataframe of the coefficient (in coded units), standard error, t-ratio and p-value of each
+        model column from the runs so far. Standard errors need more runs than model columns and p-values
+        need scipy, until then they are NaN.
+        """
+        coefficients, error_ss, total_ss = self._solution()
+        variance = self.residual_variance
+        if self._inverse is not None and not np.isnan(variance):
+            from scipy import stats
+            standard_errors = np.sqrt(np.diag(self._inverse) * variance)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t_ratios = coefficients / standard_errors
+            p_values = 2 * stats.t.sf(abs(t_ratios), self.residual_degrees_of_freedom)
+        else:
+            standard_errors = t_ratios = p_values = np.full(len(coefficients), np.nan)
+        return pd.DataFrame({'Coefficient': coefficients, 'Std Error': standard_errors, 't-Ratio': t_ratios,
+                             'p-Value': p_values}, index=self.names)
+
+
+def _code_two_level(df, factors):
+    """
+    Returns the factor columns of a two level design coded as +1 (highest level) and -1 (lowest level).
+    """
+    coded = np.empty((len(df.index), len(factors)), dtype=np.int8)
+    for j, name in enumerate(factors):
+        column = np.asarray(df[name])
+        high = max(column)
+        low = min(column)
+        if not ((column == high) | (column == low)).all():
+            raise ValueError('The factor {} has more than two levels'.format(name))
+        coded[:, j] = np.where(column == high, 1, -1)
+    return coded
+
+
+def _effect_names(factor_names, combinations):
+    return ['*'.join(factor_names[i] for i in combination) for combination in combinations]
+
+
+def _effect_combinations(n_factors, n_effects):
+    """
+    Returns the factors making up each of the first n_effects effects, the main effects first
+    then all two factor interactions, all three factor interactions and so on.
+    """
+    combinations = []
+    for r in range(1, n_factors + 1):
+        for combination in itertools.combinations(range(n_factors), r):
+            if len(combinations) == n_effects:
+                return combinations
+            combinations.append(combination)
+    return combinations
+
+
+def _contrasts(coded, combinations, results, engine='auto'):
+    """
+    Returns the normalised contrast of each effect (rows) for each column of results.
+
+    Parameters:
+        coded: The design coded as -1 and +1, one row per run.
+
+        combinations: The factors making up each effect, as given by _effect_combinations.
+
+        results: The results, one row per run and one column per response.
+
+        engine: 'fwht', 'dense' or 'auto', see fit_two_level_screening.
+    """
+    n = len(coded)
+    results = np.asarray(results, dtype=float)
+    if engine not in ('auto', 'fwht', 'dense'):
+        raise ValueError("engine must be 'auto', 'fwht' or 'dense'")
+    if engine != 'dense':
+        structure = walsh.column_words(coded)
+        if structure is not None:
+            order, words, signs = structure
+            # The transform of the results in standard order holds the contrast of every word at once,
+            # the word of an interaction is the exclusive or of the words of its factors
+            instrument.note(engine='fwht')
+            transformed = walsh.fwht(results[order])
+            effect_words = np.zeros(len(combinations), dtype=np.int64)
+            effect_signs = np.ones(len(combinations))
+            for e, combination in enumerate(combinations):
+                for i in combination:
+                    effect_words[e] ^= words[i]
+                    effect_signs[e] *= signs[i]
+            return effect_signs[:, None] * transformed[effect_words] / np.sqrt(n)
+        if engine == 'fwht':
+            raise ValueError('The fwht engine needs a full or regular fractional two level factorial design')
+
+    # Creating the T matrix
+    # ------------------------
+    # Each row of the T matrix is the product of the columns of the factors in the effect,
+    # the first row (the intercept) is left out as its contrast isn't used
+    with instrument.stage('t_matrix'):
+        t_matrix = _t_matrix(coded, combinations)
+        instrument.note(engine='dense', nbytes=t_matrix.nbytes)
+    return np.matmul(t_matrix, results)
+
+
+def _t_matrix(coded, combinations):
+    n = len(coded)
+    t_matrix = np.empty((len(combinations), n))
+    for e, combination in enumerate(combinations):
+        t_matrix[e] = np.prod(coded[:, list(combination)], axis=1)
+    t_matrix = t_matrix/np.sqrt(n)      # to normalize
+    return t_matrix
+
+
+def lenth_reference(n_contrasts):
+    """
+    Returns the reference distribution of Lenth t-ratios for the number of contrasts given. The
+    distribution only depends on the number of contrasts, so it is simulated once (with 10^6 draws
+    for up to 200 contrasts) and kept. Tables for 7, 11, 15, 31 and 2^k - 1 contrasts up to 65535 (every
+    full or regular fractional factorial up to 2^16 runs) come with the package. Any other size is simulated
+    the first time it is needed, which takes several seconds (about 2 * 10^8 draws past 200 contrasts),
+    and is then stored in the on-disk cache (if one is set).
+
+    Parameters:
+        n_contrasts: The number of contrasts, one less than the number of runs.
+
+    Returns:
+        probabilities: The cumulative probabilities the quantiles are given at.
+
+        individual: The quantiles of the t-ratio of a single contrast.
+
+        simultaneous: The quantiles of the largest t-ratio of all the contrasts.
+
+    Example:
+        >>> import analysis
+        >>> probabilities, individual, simultaneous = analysis.lenth_reference(7)
+        >>> individual[probabilities.searchsorted(0.95)]
+        2.29542
+    """
+    n_contrasts = int(n_contrasts)
+    if n_contrasts not in _lenth_references:
+        # The bundled tables are only loaded the first time a reference distribution is needed
+        import lenth_tables
+        name = 'lenth_reference_{}'.format(n_contrasts)
+        if n_contrasts in lenth_tables.TABLES:
+            individual, simultaneous = lenth_tables.TABLES[n_contrasts]
+            table = np.array([lenth_tables.PROBABILITIES, individual, simultaneous])
+        else:
+            table = cache.load_array(name)
+            if table is None or table.shape != (3, len(lenth_tables.PROBABILITIES)):
+                # Past 200 contrasts fewer simulations are made so that no more than 2 * 10^8 contrasts are drawn
+                n_simulations = min(10 ** 6, max(1000, 2 * 10 ** 8 // n_contrasts))
+                table = _simulate_lenth_reference(n_contrasts, n_simulations, seed=n_contrasts)
+                cache.save_array(name, table)
+        table.flags.writeable = False
+        _lenth_references[n_contrasts] = (table[0], table[1], table[2])
+    return _lenth_references[n_contrasts]
+
+
+def lenth_p_values(t_ratios, n_contrasts):
+    """
+    Returns the individual p-value of each Lenth t-ratio, looked up in the reference distribution.
+    p-values smaller than the resolution of the reference (0.0001) are given as 0.0001.
+    """
+    probabilities, individual, simultaneous = lenth_reference(n_contrasts)
+    # The t-ratios have point masses (e.g. a contrast equal to the median), which show up as runs of equal
+    # quantiles. The p-value is the chance of a larger t-ratio, so a t-ratio equal to a quantile (to the
+    # 5 decimal places the tables are stored to) is placed at the top of its run of equal quantiles.
+    t_ratios = np.asarray(t_ratios, dtype=float)
+    upper = np.clip(np.searchsorted(individual, t_ratios + 1e-5, side='right'), 1, len(individual) - 1)
+    lower = upper - 1
+    fraction = np.clip((t_ratios - individual[lower]) / (individual[upper] - individual[lower]), 0, 1)
+    return 1 - (probabilities[lower] + fraction * (probabilities[upper] - probabilities[lower]))
+
+
+def lenth_critical_values(n_contrasts, alpha=0.05):
+    """
+    Returns Lenth's margin of error (ME) and simultaneous margin of error (SME) as critical values of
+    the t-ratio, multiplying them by the pseudo-standard error gives the margins in the units of the contrasts.
+
+    Parameters:
+        n_contrasts: The number of contrasts, one less than the number of runs.
+
+        alpha: The significance level.
+
+    Returns:
+        me: The t-ratio a single contrast must exceed to be significant at level alpha.
+
+        sme: The t-ratio that the largest of all the contrasts only exceeds with probability alpha.
+
+    Example:
+        >>> import analysis
+        >>> analysis.lenth_critical_values(15)
+        (2.15516, 4.23614)
+    """
+    probabilities, individual, simultaneous = lenth_reference(n_contrasts)
+    return (float(np.interp(1 - alpha, probabilities, individual)),
+            float(np.interp(1 - alpha, probabilities, simultaneous)))
+
+
+# The reference distributions already loaded or simulated in this session, by number of contrasts
+_lenth_references = {}
+
+
+def _simulate_lenth_reference(n_contrasts, n_simulations, seed):
+    """
+    Simulates the reference distribution of Lenth t-ratios and returns an array whose rows are the
+    probabilities of lenth_tables.PROBABILITIES and the individual and simultaneous quantiles at them.
+    """
+    rng = np.random.default_rng(seed)
+    # Every contrast has the same distribution, so when there are fewer than 10^6 simulations the
+    # individual quantiles are taken from several contrasts of each simulation
+    per_simulation = min(n_contrasts, -(-10 ** 6 // n_simulations))
+    individual = np.empty((n_simulations, per_simulation))
+    simultaneous = np.empty(n_simulations)
+    # The simulations are made in blocks so that memory stays small for large numbers of contrasts
+    block = max(1, 2000000 // n_contrasts)
+    for start in range(0, n_simulations, block):
+        stop = min(start + block, n_simulations)
+        simulation = abs(rng.standard_normal((stop - start, n_contrasts)))
+        sim_t_ratio = simulation / _lenth_pse(simulation)[:, None]
+        individual[start:stop] = sim_t_ratio[:, :per_simulation]
+        simultaneous[start:stop] = sim_t_ratio.max(axis=1)
+    import lenth_tables
+    probabilities = np.array(lenth_tables.PROBABILITIES)
+    return np.array([probabilities,
+                     np.quantile(individual, probabilities),
+                     np.quantile(simultaneous, probabilities)])
+
+
+def _lenth_pse(abs_contrasts):
+    """
+    Returns Lenth's pseudo-standard error for each row of absolute contrasts, working on all rows at once.
+    """
+    ordered = np.sort(abs_contrasts, axis=1)
+    count = ordered.shape[1]
+    s0 = 1.5 * _sorted_median(ordered, np.full(len(ordered), count))
+    # Only the contrasts smaller than 2.5 * s0 are used for the pseudo-standard error, as the rows are
+    # sorted these are the first 'kept' values of each row
+    kept = (ordered < (2.5 * s0)[:, None]).sum(axis=1)
+    return 1.5 * _sorted_median(ordered, kept)
+
+
+def _sorted_median(ordered, counts):
+    """
+    Returns the median of the first counts[i] values of each sorted row i.
+    """
+    lower = np.clip((counts - 1) // 2, 0, None)[:, None]
+    upper = np.clip(counts // 2, 0, ordered.shape[1] - 1)[:, None]
+    median = (np.take_along_axis(ordered, lower, axis=1) + np.take_along_axis(ordered, upper, axis=1))[:, 0] / 2
+    return np.where(counts > 0, median, np.nan)
@@ -0,0 +1,143 @@
+# The caches shared by the design and analysis modules, on disk (optional) and in memory
+
+import os
+import collections
+import numpy as np
+
+# Nothing is written to disk unless a cache directory has been chosen, either with
+# set_cache_dir or by setting the DOE_CACHE_DIR environment variable.
+_cache_dir = os.environ.get('DOE_CACHE_DIR') or None
+
+
+def set_cache_dir(path):
+    """
+    Sets the directory used to keep results between sessions, None turns the on-disk cache off.
+
+    Parameters:
+        path: The directory to store cached results in, it is created if it does not exist.
+
+    Example:
+        >>> import cache
+        >>> cache.set_cache_dir('~/.cache/designofexperiment')
+    """
+    global _cache_dir
+    _cache_dir = None if path is None else os.path.expanduser(str(path))
+
+
+def get_cache_dir():
+    """
+    Returns the directory currently used for the on-disk cache, or None if it is turned off.
+    """
+    return _cache_dir
+
+
+def _path(name, extension):
+    return os.path.join(_cache_dir, name + extension)
+
+
+def load_array(name):
+    """
+    Returns the array stored under name, or None if there is no cache or nothing has been stored.
+    """
+    if _cache_dir is None:
+        return None
+    try:
+        return np.load(_path(name, '.npy'), allow_pickle=False)
+    except (OSError, ValueError):
+        # A missing or damaged file is treated the same as an empty cache
+        return None
+
+
+def save_array(name, array):
+    """
+    Stores array under name if there is a cache directory, the file is written to a temporary
+    name first and then moved into place so that other processes never read half a file.
+    """
+    if _cache_dir is None:
+        return
+    try:
+        os.makedirs(_cache_dir, exist_ok=True)
+        temporary = _path(name, '.{}.tmp.npy'.format(os.getpid()))
+        np.save(temporary, np.asarray(array), allow_pickle=False)
+        os.replace(temporary, _path(name, '.npy'))
+    except OSError:
+        # The cache only saves time, so being unable to write to it is not an error
+        pass
+
+
+# Coded design matrices depend only on the type of design and its size, not on the factor levels, so the
+# most recently used are kept in memory and shared between calls. The cache is limited both in the number
+# of matrices and in their total size, the least recently used being dropped first.
+_structures = collections.OrderedDict()
+_structure_limits = {'max_entries': 128, 'max_bytes': 256 * 2 ** 20}
+_structure_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+
+def cached_structure(key, build):
+    """
+    Returns the coded matrix stored under key, calling build() to make it if it is not in the cache.
+    The matrix is read-only as the same array is handed to every caller.
+
+    Parameters:
+        key: A hashable description of the design, such as ('box_behnken', 4, 4).
+
+        build: A function with no arguments returning the coded matrix.
+
+    Returns:
+        matrix: The read-only numpy array.
+    """
+    if key in _structures:
+        _structures.move_to_end(key)
+        _structure_stats['hits'] += 1
+        return _structures[key]
+    _structure_stats['misses'] += 1
+    matrix = np.ascontiguousarray(build())
+    matrix.flags.writeable = False
+    if _structure_limits['max_entries'] > 0 and matrix.nbytes <= _structure_limits['max_bytes']:
+        _structures[key] = matrix
+        _evict()
+    return matrix
+
+
+def _evict():
+    total = sum(matrix.nbytes for matrix in _structures.values())
+    while _structures and (len(_structures) > _structure_limits['max_entries'] or
+                           total > _structure_limits['max_bytes']):
+        key, matrix = _structures.popitem(last=False)
+        total -= matrix.nbytes
+        _structure_stats['evictions'] += 1
+
+
+def set_structure_cache_limits(max_entries=128, max_bytes=256 * 2 ** 20):
+    """
+    Sets how many coded design matrices are kept in memory and their largest total size in bytes,
+    a max_entries of 0 turns the cache off.
+
+    Example:
+        >>> import cache
+        >>> cache.set_structure_cache_limits(max_entries=32, max_bytes=64 * 2 ** 20)
+    """
+    _structure_limits['max_entries'] = int(max_entries)
+    _structure_limits['max_bytes'] = int(max_bytes)
+    _evict()
+
+
+def structure_cache_info():
+    """
+    Returns a dictionary of the hits, misses and evictions of the coded design cache along with
+    the number of matrices held, their total size in bytes and the limits.
+    """
+    info = dict(_structure_stats)
+    info['entries'] = len(_structures)
+    info['bytes'] = sum(matrix.nbytes for matrix in _structures.values())
+    info.update(_structure_limits)
+    return info
+
+
+def clear_structure_cache():
+    """
+    Empties the coded design cache and resets its statistics.
+    """
+    _structures.clear()
+    for name in _structure_stats:
+        _structure_stats[name] = 0
@@ -0,0 +1,208 @@
+# Command line entry point generating many designs from a manifest, in parallel
+
+import argparse
+import concurrent.futures
+import inspect
+import json
+import os
+import shutil
+import sys
+import time
+import design
+import storage
+
+GENERATORS = ['full_factorial_2level', 'full_factorial', 'frac_fact_2level', 'plackett_burman', 'box_behnken',
+              'central_composite', 'latin_hypercube', 'optimal']
+FORMATS = {'csv': '.csv', 'npy': '.npy', 'arrow': '.arrow', 'parquet': '.parquet'}
+
+USAGE_EXAMPLE = """
+A manifest is a JSON or YAML file such as
+
+    {"output_dir": "designs", "format": "csv",
+     "designs": [{"name": "assay-1", "type": "frac_fact_2level",
+                  "factors": {"Temp": [20, 40], "Time": [10, 30], "pH": [6, 8]},
+                  "options": {"runs": 4}},
+                 {"name": "assay-2", "type": "box_behnken",
+                  "factors": {"Temp": [20, 40], "Time": [10, 30], "pH": [6, 8]}}]}
+
+where type is one of """ + ', '.join(GENERATORS) + """ and options are passed to it as keyword
+arguments.
+"""
+
+
+def main(argv=None):
+    """
+    Reads a manifest of designs, generates them over a process pool and writes each one as it is finished,
+    then prints how long each took. Designs with the same type, factors, options and format are only
+    generated once and copied to each of their names.
+
+    Returns:
+        status: 0 if every design was written, 1 if any failed.
+    """
+    parser = argparse.ArgumentParser(description='Generate many designs of experiments from a manifest.',
+                                     epilog=USAGE_EXAMPLE, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('manifest', help='JSON or YAML file listing the designs to generate')
+    parser.add_argument('--output-dir', help='directory to write the designs to (default: the manifest\'s '
+                                             'output_dir, or the current directory)')
+    parser.add_argument('--format', choices=sorted(FORMATS), help='default output format (default: csv)')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='number of worker processes (default: one per CPU)')
+    parser.add_argument('--summary', help='also write the timings summary to this JSON file')
+    args = parser.parse_args(argv)
+
+    manifest = load_manifest(args.manifest)
+    output_dir = args.output_dir or manifest.get('output_dir') or '.'
+    default_format = args.format or manifest.get('format', 'csv')
+    specs = [_normalise(spec, i, default_format) for i, spec in enumerate(manifest['designs'])]
+    _check_names(specs)
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Identical specs are generated once, the first name being written and the rest copied from it
+    groups = {}
+    for spec in specs:
+        groups.setdefault(_spec_key(spec), []).append(spec)
+    processes = args.processes if args.processes is not None else manifest.get('processes')
+    results = []
+    started = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+        futures = {executor.submit(generate, group[0], output_dir): group for group in groups.values()}
+        for future in concurrent.futures.as_completed(futures):
+            group = futures[future]
+            result = future.result()
+            results.append(result)
+            _report(result)
+            for duplicate in group[1:]:
+                results.append(_copy(result, duplicate, output_dir))
+                _report(results[-1])
+    total = time.perf_counter() - started
+
+    summary = {'designs': len(specs), 'generated': len(groups), 'failed': sum(r['status'] != 'ok' for r in results),
+               'seconds': total, 'results': sorted(results, key=lambda result: result['index'])}
+    _print_summary(summary)
+    if args.summary:
+        with open(args.summary, 'w') as file:
+            json.dump(summary, file, indent=2)
+    return 1 if summary['failed'] else 0
+
+
+def load_manifest(path):
+    """
+    Returns the manifest in a JSON or YAML file (YAML needs PyYAML), a list of designs being taken as
+    {'designs': list}.
+    """
+    with open(path) as file:
+        text = file.read()
+    if path.endswith(('.yaml', '.yml')):
+        import yaml
+        manifest = yaml.safe_load(text)
+    else:
+        manifest = json.loads(text)
+    if isinstance(manifest, list):
+        manifest = {'designs': manifest}
+    if not isinstance(manifest, dict) or not isinstance(manifest.get('designs'), list):
+        raise ValueError('The manifest must be a list of designs or have a list of them under "designs"')
+    return manifest
+
+
+def _normalise(spec, index, default_format):
+    # Fills in the defaults of a design's spec and checks it before any work is started
+    if spec.get('type') not in GENERATORS:
+        raise ValueError('Design {} has type {}, which is not one of {}'.format(index, spec.get('type'), GENERATORS))
+    if not isinstance(spec.get('factors'), dict) or not spec['factors']:
+        raise ValueError('Design {} needs a dictionary of factors'.format(index))
+    output_format = spec.get('format', default_format)
+    if output_format not in FORMATS:
+        raise ValueError('Design {} has format {}, which is not one of {}'.format(index, output_format,
+                                                                                  sorted(FORMATS)))
+    return {'index': index, 'name': str(spec.get('name', 'design-{}'.format(index))), 'type': spec['type'],
+            'factors': spec['factors'], 'options': dict(spec.get('options', {})), 'format': output_format}
+
+
+def _check_names(specs):
+    # Every design is written to a file named after it in the output directory, so the names must
+    # all be different and must not lead out of the directory
+    seen = {}
+    for spec in specs:
+        name = spec['name']
+        if not name or name in ('.', '..') or '/' in name or '\\' in name:
+            raise ValueError('Design {} has the name {!r}, which cannot be used as a file name'.format(spec['index'],
+                                                                                                    name))
+        if name in seen:
+            raise ValueError('Designs {} and {} are both named {!r}'.format(seen[name], spec['index'], name))
+        seen[name] = spec['index']
+
+
+def _spec_key(spec):
+    # The order of the factors changes the design (its columns and which factors are generated),
+    # so the factors are kept as an ordered list of names and levels rather than a sorted dictionary
+    factors = [[name, levels] for name, levels in spec['factors'].items()]
+    return json.dumps([spec['type'], factors, spec['options'], spec['format']], sort_keys=True)
+
+
+def generate(spec, output_dir):
+    """
+    Generates one design and writes it, returning a dictionary of how it went and how long it took.
+    Run in the worker processes, so any error is returned rather than raised.
+    """
+    result = {'index': spec['index'], 'name': spec['name'], 'type': spec['type'], 'format': spec['format'],
+              'path': os.path.join(output_dir, spec['name'] + FORMATS[spec['format']]),
+              'runs': None, 'generate_seconds': None, 'write_seconds': None, 'status': 'ok'}
+    try:
+        generator = getattr(design, spec['type'])
+        options = dict(spec['options'])
+        # Designs are kept as level codes for the binary formats, when the generator can give them
+        if spec['format'] != 'csv' and 'as_design' in inspect.signature(generator).parameters:
+            options['as_design'] = True
+        started = time.perf_counter()
+        result_design = generator(spec['factors'], **options)
+        result['generate_seconds'] = time.perf_counter() - started
+        result['runs'] = len(result_design)
+        started = time.perf_counter()
+        if spec['format'] == 'csv':
+            result_design.to_csv(result['path'], index=False)
+        else:
+            getattr(storage, 'write_' + spec['format'])(result['path'], result_design)
+        result['write_seconds'] = time.perf_counter() - started
+    except Exception as error:
+        result['status'] = 'error: {}: {}'.format(type(error).__name__, error)
+    return result
+
+
+def _copy(result, spec, output_dir):
+    # A duplicate spec gets a copy of the file written for the first spec like it
+    copied = dict(result, index=spec['index'], name=spec['name'], generate_seconds=0.0, write_seconds=None,
+                  path=os.path.join(output_dir, spec['name'] + FORMATS[spec['format']]), duplicate_of=result['name'])
+    if result['status'] != 'ok':
+        return copied
+    started = time.perf_counter()
+    shutil.copyfile(result['path'], copied['path'])
+    if spec['format'] == 'npy':
+        shutil.copyfile(result['path'] + '.json', copied['path'] + '.json')
+    copied['write_seconds'] = time.perf_counter() - started
+    return copied
+
+
+def _report(result):
+    print('{}: {}'.format(result['name'], 'written to ' + result['path'] if result['status'] == 'ok'
+                          else result['status']), file=sys.stderr)
+
+
+def _print_summary(summary):
+    print('{:<30} {:<22} {:>10} {:>12} {:>12}  {}'.format('Name', 'Type', 'Runs', 'Generate (s)', 'Write (s)',
+                                                         'Status'))
+    for result in summary['results']:
+        print('{:<30} {:<22} {:>10} {:>12} {:>12}  {}'.format(
+            result['name'][:30], result['type'], '' if result['runs'] is None else result['runs'],
+            _seconds(result['generate_seconds']), _seconds(result['write_seconds']),
+            'duplicate of ' + result['duplicate_of'] if 'duplicate_of' in result and result['status'] == 'ok'
+            else result['status']))
+    print('{} designs ({} generated, {} failed) in {:.3f} s'.format(summary['designs'], summary['generated'],
+                                                                   summary['failed'], summary['seconds']))
+
+
+def _seconds(value):
+    return '' if value is None else '{:.4f}'.format(value)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
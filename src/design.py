@@ -1,14 +1,141 @@
 # Our Design of experiment class
 
-import urllib.request
 import pandas as pd
 import itertools
 import math
-import lhsmdu
 import numpy as np
+import hadamard
+import aberration
+import hypercube
+import cache
+import instrument
+import exchange
+import walsh
+import model as model_module
 
 
-def full_factorial_2level(dic_factors):
+def _codes_dtype(level_counts):
+    # int8 is used whenever every factor has few enough levels
+    largest = max(list(level_counts) + [1])
+    return np.int8 if largest <= 128 else np.min_scalar_type(largest - 1)
+
+
+class Design:
+    """
+    A design held as a compact matrix of level codes, with a table of the levels of each factor.
+    Entry (i, j) of codes is the index of the level factor j takes in run i, stored as int8 so that
+    a design takes an eighth of the memory of a dataframe of floats. The dataframe of real values
+    (or the coded -1 to +1 values) is only made when asked for.
+
+    Every design generator returns a Design instead of a dataframe when given as_design=True.
+
+    Parameters:
+        codes: An integer array with one row per run and one column per factor of level indexes.
+
+        levels: A list of the levels of each factor, in the order the codes refer to them.
+
+        factor_names: The name of each factor.
+
+        coded_levels: A list of the coded value of each level of each factor, if None the levels
+        are spread evenly from -1 to +1 (so -1 and +1 for two levels, -1, 0 and +1 for three).
+
+    Example:
+        >>> import design
+        >>> Factors = {'Height':[1.6,2],'Width':[0.2,0.4],'Depth':[0.2,0.3]}
+        >>> d = design.full_factorial_2level(Factors, as_design=True)
+        >>> d.codes[:3]
+        array([[0, 0, 0],
+               [0, 0, 1],
+               [0, 1, 0]], dtype=int8)
+        >>> d.coded()[:3]
+        array([[-1, -1, -1],
+               [-1, -1,  1],
+               [-1,  1, -1]], dtype=int8)
+        >>> d.to_dataframe().head(3)
+           Height  Width  Depth
+        0     1.6    0.2    0.2
+        1     1.6    0.2    0.3
+        2     1.6    0.4    0.2
+    """
+
+    def __init__(self, codes, levels, factor_names, coded_levels=None):
+        codes = np.asarray(codes)
+        if codes.ndim != 2 or codes.shape[1] != len(factor_names) or len(levels) != len(factor_names):
+            raise ValueError('codes must have one column for each factor and its levels')
+        self._codes = np.ascontiguousarray(codes, dtype=_codes_dtype([len(factor_levels) for factor_levels in levels]))
+        self._codes.flags.writeable = False
+        self.levels = [pd.Index(factor_levels) for factor_levels in levels]
+        self.factor_names = list(factor_names)
+        if coded_levels is None:
+            coded_levels = [np.linspace(-1, 1, len(factor_levels)) if len(factor_levels) > 1 else np.zeros(1)
+                            for factor_levels in levels]
+        self.coded_levels = [np.asarray(values, dtype=float) for values in coded_levels]
+
+    @property
+    def codes(self):
+        """
+        The read-only int8 matrix of level codes, this is not a copy.
+        """
+        return self._codes
+
+    @property
+    def runs(self):
+        return self._codes.shape[0]
+
+    @property
+    def shape(self):
+        return self._codes.shape
+
+    @property
+    def nbytes(self):
+        return self._codes.nbytes
+
+    def __len__(self):
+        return self.runs
+
+    def __repr__(self):
+        return 'Design(runs={}, factors={})'.format(self.runs, self.factor_names)
+
+    def column_codes(self, name):
+        """
+        Returns the codes of one factor as a view of the code matrix, without copying.
+        """
+        return self._codes[:, self.factor_names.index(name)]
+
+    def coded(self):
+        """
+        Returns the design in coded units, as int8 if every coded level is a whole number
+        (as in factorial, Plackett-Burman and Box-Behnken designs) and as floats otherwise.
+        """
+        whole = all(np.array_equal(values, np.round(values)) and abs(values).max() <= 127
+                    for values in self.coded_levels if len(values))
+        result = np.empty(self.shape, dtype=np.int8 if whole else float)
+        for j, values in enumerate(self.coded_levels):
+            result[:, j] = values.take(self._codes[:, j])
+        return result
+
+    def to_numpy(self):
+        """
+        Returns the design in the units of the factor levels as an array of floats.
+        """
+        result = np.empty(self.shape, dtype=float)
+        for j, factor_levels in enumerate(self.levels):
+            result[:, j] = np.asarray(factor_levels, dtype=float).take(self._codes[:, j])
+        return result
+
+    def to_dataframe(self):
+        """
+        Returns the design as a dataframe in the units of the factor levels, each column keeping
+        the type of the levels it was given.
+        """
+        columns = {}
+        for j, name in enumerate(self.factor_names):
+            columns[name] = self.levels[j].take(self._codes[:, j].astype(np.intp))
+        return pd.DataFrame(columns)
+
+
+@instrument.instrumented
+def full_factorial_2level(dic_factors, as_design=False):
     """
     Creates a Two-level full factorial design from the dictionary of factors entered,
     if more than two levels are given for each factor the maximum and minimum values will be selected
@@ -16,6 +143,8 @@ def full_factorial_2level(dic_factors):
     Parameters:
         dic_factors: The dictionary of factors to be included in the full factorial's design
 
+        as_design: If True the design is returned as a Design of level codes rather than a dataframe.
+
     Returns:
         df: A dataframe of the two-level full factorial resulting from the factors entered
 
@@ -33,10 +162,8 @@ def full_factorial_2level(dic_factors):
         6     2.0    0.4    0.2
         7     2.0    0.4    0.3
     """
-    # df is the dataframe that will be returned.
-    df = pd.DataFrame()
     # factor_levels will be filled with the levels of each factor and
-    # used when iterating through the runs of the design.
+    # used when building the runs of the design.
     factor_levels = []
     # factor_names is filled at the same time as factor_levels and
     # is used at the end to correctly name the columns of the dataframe.
@@ -48,22 +175,13 @@ def full_factorial_2level(dic_factors):
         factor_names.append(name)
         factor_levels.append([min(dic_factors[name]), max(dic_factors[name])])
 
-    # This for loop will run through each combination(technically product) and build up
-    # the dataframe df with each loop.
-    for run in itertools.product(*factor_levels, repeat=1):
-        run = list(run)
-        s_add = pd.Series(run)
-        df = pd.concat([df, s_add], axis=1, ignore_index=True)
-    # The dataframe is made with the runs being the columns, we want them to be the rows
-    # hence the need to transpose.
-    df = df.transpose()
-    # The column headers are initially labelled '0','1','2' etc.., the line below
-    # renames them by relating them to the factor_names list made earlier
-    df = df.rename(columns=lambda x: factor_names[x])
-    return df
+    # The whole design is built in one pass by _build_full_factorial, in the same
+    # row order that itertools.product would give.
+    return _build_full_factorial(factor_names, factor_levels, as_design=as_design)
 
 
-def full_factorial(dic_factors):
+@instrument.instrumented
+def full_factorial(dic_factors, as_design=False):
     """
     Creates a full factorial design from the dictionary of factors, but does not choose
     highest and lowest levels of each factor.
@@ -71,6 +189,8 @@ def full_factorial(dic_factors):
     Parameters:
         dic_factors: The dictionary of factors to be included in the full factorial's design
 
+        as_design: If True the design is returned as a Design of level codes rather than a dataframe.
+
     Returns:
         df: A dataframe of the full factorial resulting from the factors entered
 
@@ -91,7 +211,6 @@ def full_factorial(dic_factors):
     """
     # The variables initialised below play the same role here as in the two level
     # full factorial above.
-    df = pd.DataFrame()
     factor_levels = []
     factor_names = []
     # This for loop plays the same role as the for loop in the two level
@@ -101,18 +220,168 @@ def full_factorial(dic_factors):
         factor_names.append(name)
         factor_levels.append(dic_factors[name])
 
-    # This for loop functions the same as its two level counterpart.
-    for run in itertools.product(*factor_levels, repeat=1):
-        run = list(run)
-        s_add = pd.Series(run)
-        df = pd.concat([df, s_add], axis=1, ignore_index=True)
-    # As in the two level, the dataframe must be transposed and renamed.
-    df = df.transpose()
-    df = df.rename(columns=lambda x: factor_names[x])
+    return _build_full_factorial(factor_names, factor_levels, as_design=as_design)
+
+
+def _full_factorial_indices(level_counts, run_indices=None):
+    """
+    Decodes run numbers of a full factorial into the index of each factor's level, using
+    mixed-radix arithmetic. The last factor changes fastest, which is the same order that
+    itertools.product gives.
+
+    Parameters:
+        level_counts: A list of how many levels each factor has.
+
+        run_indices: The run numbers to decode, if None every run of the design is decoded.
+
+    Returns:
+        indices: An array with one row per run and one column per factor holding the level index.
+    """
+    level_counts = np.asarray(level_counts, dtype=np.int64)
+    # strides[j] is how many runs go by before factor j moves on to its next level
+    strides = np.ones(len(level_counts), dtype=np.int64)
+    if len(level_counts) > 1:
+        strides[:-1] = np.cumprod(level_counts[::-1])[-2::-1]
+    if run_indices is None:
+        run_indices = np.arange(int(np.prod(level_counts)), dtype=np.int64)
+    run_indices = np.asarray(run_indices, dtype=np.int64)
+    # The smallest integer type is used so that millions of runs stay cheap to hold
+    largest = int(level_counts.max()) - 1 if len(level_counts) else 0
+    indices = np.empty((len(run_indices), len(level_counts)), dtype=np.min_scalar_type(largest))
+    for j in range(len(level_counts)):
+        indices[:, j] = (run_indices // strides[j]) % level_counts[j]
+    return indices
+
+
+def _build_full_factorial(factor_names, factor_levels, run_indices=None, as_design=False):
+    """
+    Builds the dataframe of a full factorial from the names and levels of each factor,
+    every column is made with a single vectorised lookup so the cost is linear in the runs.
+    If run_indices is given only those runs are built and they are used as the index.
+    """
+    level_counts = [len(levels) for levels in factor_levels]
+    with instrument.stage('structure'):
+        if run_indices is None:
+            indices = cache.cached_structure(('full_factorial', tuple(level_counts)), lambda: _full_factorial_indices(
+                level_counts).astype(_codes_dtype(level_counts)))
+        else:
+            indices = _full_factorial_indices(level_counts, run_indices)
+    design = Design(indices, factor_levels, factor_names)
+    if as_design:
+        return design
+    # Each column keeps the type of the levels it was given rather than becoming an object column
+    with instrument.stage('dataframe'):
+        instrument.note(rows=design.runs, columns=len(factor_names))
+        df = design.to_dataframe()
+    if run_indices is not None:
+        df.index = pd.Index(np.asarray(run_indices, dtype=np.int64))
     return df
 
 
-def frac_fact_2level(dic_factors, runs):
+class LazyFullFactorial:
+    """
+    A full factorial design that is never held in memory, runs are decoded from their run
+    number only when they are asked for. This allows designs with far too many combinations
+    to build as a dataframe to be worked through in chunks, sliced, sampled or split between workers.
+    The run numbers are the same as the row labels full_factorial would give.
+
+    Parameters:
+        dic_factors: The dictionary of factors to be included in the full factorial's design
+
+        two_level: If True only the maximum and minimum of each factor are used, as in full_factorial_2level.
+
+    Example:
+        >>> import design
+        >>> Factors = {'Height':[1.6,1.8,2],'Width':[0.2,0.3,0.4]}
+        >>> lazy = design.LazyFullFactorial(Factors)
+        >>> len(lazy)
+        9
+        >>> lazy[4]
+        Height    1.8
+        Width     0.3
+        Name: 4, dtype: float64
+        >>> for chunk in lazy.chunks(4):
+        ...     print(len(chunk))
+        4
+        4
+        1
+    """
+
+    def __init__(self, dic_factors, two_level=False):
+        self.factor_names = []
+        self.factor_levels = []
+        for name in dic_factors:
+            self.factor_names.append(name)
+            if two_level:
+                self.factor_levels.append([min(dic_factors[name]), max(dic_factors[name])])
+            else:
+                self.factor_levels.append(list(dic_factors[name]))
+        self.level_counts = [len(levels) for levels in self.factor_levels]
+        # The number of runs is worked out with python integers so that it can be checked
+        # before it overflows the 64 bit run numbers used when decoding
+        self.runs = 1
+        for count in self.level_counts:
+            self.runs *= count
+        if self.runs > np.iinfo(np.int64).max:
+            raise ValueError('The design has too many runs to be numbered with 64 bit integers')
+
+    def __len__(self):
+        return self.runs
+
+    def __getitem__(self, key):
+        # A single run is returned as a series, anything else as a dataframe
+        if isinstance(key, (int, np.integer)):
+            run = int(key)
+            if run < 0:
+                run += self.runs
+            if not 0 <= run < self.runs:
+                raise IndexError('Run {} is out of range for a design with {} runs'.format(key, self.runs))
+            return self.take([run]).iloc[0]
+        if isinstance(key, slice):
+            return self.take(np.arange(*key.indices(self.runs), dtype=np.int64))
+        return self.take(key)
+
+    def take(self, run_indices):
+        """
+        Returns a dataframe of the runs with the run numbers given, indexed by run number.
+        """
+        run_indices = np.asarray(run_indices, dtype=np.int64)
+        run_indices = np.where(run_indices < 0, run_indices + self.runs, run_indices)
+        if len(run_indices) and (run_indices.min() < 0 or run_indices.max() >= self.runs):
+            raise IndexError('Run numbers must be below the {} runs of the design'.format(self.runs))
+        return _build_full_factorial(self.factor_names, self.factor_levels, run_indices)
+
+    def chunks(self, chunk_size, start=0, stop=None):
+        """
+        Yields the runs from start up to (but not including) stop as dataframes of at most chunk_size runs.
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least one')
+        stop = self.runs if stop is None else min(stop, self.runs)
+        for first in range(start, stop, chunk_size):
+            yield self.take(np.arange(first, min(first + chunk_size, stop), dtype=np.int64))
+
+    def sample(self, n, seed=None, replace=False):
+        """
+        Returns n randomly chosen runs, sorted by run number. The seed makes the sample repeatable.
+        """
+        rng = np.random.default_rng(seed)
+        return self.take(np.sort(rng.choice(self.runs, size=n, replace=replace)))
+
+    def shard(self, worker, n_workers, chunk_size):
+        """
+        Splits the runs into n_workers contiguous blocks of (nearly) equal size and yields
+        the block belonging to worker (counted from 0) in chunks of chunk_size runs.
+        """
+        if not 0 <= worker < n_workers:
+            raise ValueError('worker must be between 0 and n_workers - 1')
+        start = self.runs * worker // n_workers
+        stop = self.runs * (worker + 1) // n_workers
+        return self.chunks(chunk_size, start, stop)
+
+
+@instrument.instrumented
+def frac_fact_2level(dic_factors, runs, generators=None, as_design=False, time_limit=60, processes=None):
     """
     Returns a fractional factorial based on the dictionary of factors entered and the runs entered,
      the number of runs of the design will be the next lowest power of 2 from the runs entered
@@ -124,6 +393,19 @@ def frac_fact_2level(dic_factors, runs):
         runs: The number of runs the design can use - if the number of runs causes the design's resolution
         to be less than three then it will not work.
 
+        generators: Optional list of generators such as ['E=ABCD', 'F=-ABC'] where A is the first factor
+        entered, B the second etc.., or using factor names such as 'Pressure=Height*Width*Depth'.
+        The factors that are not generated make up the base full factorial, so there must be
+        log2(runs) of them. If None the generators are all two factor products of the base factors,
+        then all three factor products and so on. 'minimum_aberration' searches for the generators giving
+        the highest resolution and fewest short words, see aberration.minimum_aberration_generators.
+
+        as_design: If True the design is returned as a Design of level codes rather than a dataframe.
+
+        time_limit: The number of seconds the 'minimum_aberration' search can take.
+
+        processes: The number of processes to spread the 'minimum_aberration' search over.
+
     returns:
         df: A dataframe of the runs for the fractional factorial resulting from the factors and runs entered.
 
@@ -141,7 +423,6 @@ def frac_fact_2level(dic_factors, runs):
         6     2.0    0.4    0.2    20       100
         7     2.0    0.4    0.3    20       200
     """
-    df = pd.DataFrame()
     factor_levels = []
     factor_names = []
     # this for loop fills up factor_levels and factor_names arrays
@@ -149,132 +430,402 @@ def frac_fact_2level(dic_factors, runs):
         factor_names.append(name)
         factor_levels.append([min(dic_factors[name]), max(dic_factors[name])])
 
+    # The design is -1 and 1, which become the codes 0 and 1 of each factor's factor_levels
+    key = ('frac_fact_2level', len(factor_names), int((1 << (runs).bit_length()) / 2),
+           _generators_key(generators, factor_names))
+    if isinstance(generators, str) and generators == 'minimum_aberration':
+        # A search that runs out of time can find a different design, so the limit is part of the key
+        key += (time_limit, processes)
+    with instrument.stage('structure'):
+        codes = cache.cached_structure(key, lambda: (_frac_fact_coded(factor_names, runs, generators, time_limit,
+                                                                      processes) > 0).astype(np.int8))
+    return _finish(Design(codes, factor_levels, factor_names), as_design)
+
+
+def _frac_fact_coded(factor_names, runs, generators=None, time_limit=60, processes=None):
+    """
+    Returns the fractional factorial for frac_fact_2level coded as an int8 matrix of -1 and +1,
+    with one column per factor in the order they were entered. time_limit and processes are passed
+    to the 'minimum_aberration' search.
+    """
     # If runs entered isn't a power of 2 this will set it to the
     # next lowest power of 2.
     runs = int((1 << (runs).bit_length()) / 2)
     # The fractional factorial is generated from a base full factorial
     # see https://www.itl.nist.gov/div898/handbook/pri/section3/pri3342.htm
     # the line below determines the level of this full fact level
-    full_fact_level = int(math.log(runs, 2))
-
-    # This for loop creates the base Full Factorial from which the
-    # fractional factorial will be generated
-    for run in itertools.product([-1, 1], repeat=full_fact_level):
-        run = list(run)
-        s_add = pd.Series(run)
-        df = pd.concat([df, s_add], axis=1, ignore_index=True)
-    df = df.transpose()
-    # factors_remaining will be used in the coming loops - it measures how many columns
-    # are left to be added to the fractional factorial.
-    factors_remaining = len(factor_names) - full_fact_level
-    # count will be used for the creation of new columns in the dataframe.
-    count = 0
-    # df_cols is quite literally a list of the column headers in the dataframe
-    # the columns are automatically name as if in an array 0,1,2 etc..
-    df_cols = []
-    # r is used in the itertools combination function, it is set to two as
-    # the first columns of the fractional factorial are the two combinations,
-    # it is incremented as higher combinations are required.
-    r = 2
-    # r will need to be incremented when all combinations at its current level have been
-    # added, combination check is used in a conditional that will increase r and
-    # reinitialise the for loop that r is used in.
-    combination_check = 0
-
-    # This for loop fills up df_cols with the columns already made in the base full factorial
-    for x in range((len(dic_factors) - factors_remaining)):
-        df_cols.append(x)
-
-    # The while loop is here to reinitialise the for loop once r has changed, and
-    # to stop the for loop creating too many columns once factors_remaining is 0.
-    while factors_remaining > 0:
-        # As each new column is the combination of columns from the base full factorial
-        # this for loop goes through each combination and creates these columns.
-        for combination in itertools.combinations(df_cols, r):
-            # We initialise the values as 1 so that we can multiply them by however much
-            # is necessary in the coming for loop.
-            df[full_fact_level + count] = 1
-
-            # The for loop here goes up to r because if r is two the result will be the multiplication
-            # of two columns, if r is three, three columns etc..
-            for i in range(r):
-                df[full_fact_level + count] = df[full_fact_level + count] * df[combination[i]]
-            count += 1
-            factors_remaining -= 1
-            combination_check += 1
-
-            # If we have run through all combinations with this 'r' value
-            # we should increase r.
-            if combination_check == len(list(itertools.combinations(df_cols, r))):
-                r += 1
-                combination_check = 0
-                break
-            # If there are no factors left then we should stop adding columns.
-            if factors_remaining == 0:
-                break
-
-    # The dataframe is currently -1 and 1, this for loop assigns the right levels to
-    # each factor using the factor_levels list
-    for i in range(len(dic_factors)):
-        df[i] = df[i].apply(lambda y: factor_levels[i][0] if y == -1 else factor_levels[i][1])
-    df = df.rename(columns=lambda y: factor_names[y])
-    return df
+    full_fact_level = min(int(math.log(runs, 2)), len(factor_names))
+
+    # Each generated column is the product of a set of base columns, stored as a bit mask 'word'
+    # where bit j is set if base factor j is in the product.
+    if isinstance(generators, str) and generators == 'minimum_aberration':
+        generators = None
+        if len(factor_names) > full_fact_level:
+            with instrument.stage('generator_search'):
+                generators = aberration.minimum_aberration_generators(factor_names, runs, time_limit, processes)
+    if generators is None:
+        base_factors = list(range(full_fact_level))
+        generated_factors = list(range(full_fact_level, len(factor_names)))
+        words = _default_generator_words(full_fact_level, len(generated_factors))
+        signs = [1] * len(words)
+    else:
+        base_factors, generated_factors, words, signs = _parse_generators(generators, factor_names)
+        if 2 ** len(base_factors) != runs:
+            raise ValueError('The generators leave {} base factors, which need {} runs not {}'.format(
+                len(base_factors), 2 ** len(base_factors), runs))
+
+    coded = _two_level_columns(len(base_factors), words, signs)
+    # The columns of coded are the base factors followed by the generated ones, the line below
+    # puts them back into the order the factors were entered
+    position = np.empty(len(factor_names), dtype=np.intp)
+    position[base_factors + generated_factors] = np.arange(len(factor_names))
+    return coded[:, position]
+
+
+def _default_generator_words(n_base, n_generated):
+    """
+    Returns the words of the first n_generated generators in the order all two factor products
+    of the base factors, then all three factor products and so on.
+    """
+    words = []
+    for r in range(2, n_base + 1):
+        for combination in itertools.combinations(range(n_base), r):
+            if len(words) == n_generated:
+                return words
+            words.append(sum(1 << j for j in combination))
+    if len(words) < n_generated:
+        raise ValueError('{} runs are too few for {} factors, the design would have a resolution below three'.format(
+            2 ** n_base, n_base + n_generated))
+    return words
+
+
+def _two_level_columns(n_base, words, signs):
+    """
+    Returns the coded (-1 and +1) int8 matrix of a regular two level design, the first n_base columns
+    are the base full factorial in standard order and the rest are the products given by words and signs.
+    """
+    with instrument.stage('base_matrix'):
+        run_numbers = np.arange(2 ** n_base, dtype=np.int64)
+        # minus[i, j] is 1 where base factor j is at its low level, the first factor changes slowest
+        minus = np.empty((len(run_numbers), n_base), dtype=np.uint8)
+        for j in range(n_base):
+            minus[:, j] = 1 - ((run_numbers >> (n_base - 1 - j)) & 1)
+        coded = np.empty((len(run_numbers), n_base + len(words)), dtype=np.int8)
+        coded[:, :n_base] = 1 - 2 * minus.astype(np.int8)
+    with instrument.stage('interaction_columns'):
+        instrument.note(columns=len(words))
+        # word_matrix[j, g] is 1 if base factor j is in generator g, so that the number of low levels
+        # in each product is a single matrix product and its parity gives the sign
+        word_matrix = np.zeros((n_base, len(words)), dtype=np.uint8)
+        for g, word in enumerate(words):
+            for j in range(n_base):
+                word_matrix[j, g] = (word >> j) & 1
+        parity = (minus.astype(np.int32) @ word_matrix.astype(np.int32)) & 1
+        coded[:, n_base:] = (1 - 2 * parity.astype(np.int8)) * np.asarray(signs, dtype=np.int8)
+    return coded
+
+
+def _parse_generators(generators, factor_names):
+    """
+    Reads generators such as 'E=ABCD', 'F=-ABC' or 'Pressure=Height*Width' where letters stand for
+    the factors in the order they were entered. A single string can hold several generators separated
+    by commas, with or without spaces, as in 'D = ABC, E = ACD'.
+
+    Returns:
+        base_factors: The indexes of the factors that are not generated.
+
+        generated_factors: The indexes of the generated factors.
+
+        words: The bit mask over the base factors of each generated factor.
+
+        signs: +1 or -1 for each generated factor.
+    """
+    if isinstance(generators, str):
+        generators = [generator for generator in generators.split(',') if generator.strip()]
+    parsed = []
+    for generator in generators:
+        generator = generator.strip()
+        left, right = [part.strip() for part in generator.split('=')] if generator.count('=') == 1 else ('', '')
+        sign = 1
+        if right[:1] in ('+', '-'):
+            sign = -1 if right[0] == '-' else 1
+            right = right[1:].strip()
+        if not left or not right:
+            raise ValueError('The generator {} should look like E=ABCD'.format(generator))
+        parsed.append((_factor_index(left, factor_names), [_factor_index(term, factor_names)
+                       for term in _generator_terms(right, factor_names)], sign))
+
+    generated_factors = [left for left, right, sign in parsed]
+    if len(set(generated_factors)) != len(generated_factors):
+        raise ValueError('Each factor can only be generated once')
+    base_factors = [i for i in range(len(factor_names)) if i not in generated_factors]
+    words = []
+    signs = []
+    for left, right, sign in parsed:
+        word = 0
+        for i in right:
+            if i not in base_factors:
+                raise ValueError('Generators can only use base factors, {} is generated'.format(factor_names[i]))
+            # A factor appearing twice cancels out, as its column squared is all ones
+            word ^= 1 << base_factors.index(i)
+        if bin(word).count('1') < 2:
+            raise ValueError('The generator for {} must be a product of at least two base factors'.format(
+                factor_names[left]))
+        words.append(word)
+        signs.append(sign)
+    return base_factors, generated_factors, words, signs
+
+
+def _generator_terms(text, factor_names):
+    # Terms are separated by '*', otherwise the whole text is a factor name or a run of letters
+    if '*' in text:
+        return [term.strip() for term in text.split('*')]
+    if text in factor_names:
+        return [text]
+    return list(text)
+
+
+def _factor_index(term, factor_names):
+    if term in factor_names:
+        return factor_names.index(term)
+    if len(term) == 1 and 'A' <= term <= 'Z' and ord(term) - ord('A') < len(factor_names):
+        return ord(term) - ord('A')
+    raise ValueError('{} is not a factor name or the letter of a factor'.format(term))
+
+
+@instrument.instrumented
+def alias_structure(factors, generators=None, max_order=2):
+    """
+    Works out what is confounded with what in a regular two level fractional factorial, from either the
+    generators used to make it or the design itself. Columns are handled as bit masks over the base factors,
+    so this stays fast for designs with many factors where listing every one of the 2^k effects is not possible.
+
+    Parameters:
+        factors: A dataframe of a two level fractional factorial design (factor columns only), or the dictionary
+        (or list) of factor names when generators are given.
+
+        generators: The generators of the design such as ['E=ABCD', 'F=-ABC'], in the same form taken by
+        frac_fact_2level. If None the generators are found from the design.
+
+        max_order: Alias chains are given for all effects up to this many factors, made up of effects up to
+        this many factors.
+
+    Returns:
+        structure: A dictionary with
+
+        'defining_relation': The words (products of factors equal to I, with a minus sign when equal to -I)
+        that make up the defining relation, shortest first. This is None if there are more than 2^16 words.
+
+        'resolution': The length of the shortest word, None for a full factorial.
+
+        'word_length_pattern': A series of the number of words of each length.
+
+        'aliases': A dictionary of each effect and the effects it is aliased with, 'I' meaning the mean.
+
+    Example:
+        >>> import design
+        >>> Factors = {'Height':[1.6,2],'Width':[0.2,0.4],'Depth':[0.2,0.3],'Temp':[10,20],'Pressure':[100,200]}
+        >>> structure = design.alias_structure(Factors, ['Temp=ABC', 'Pressure=AB'])
+        >>> structure['defining_relation']
+        ['Height*Width*Pressure', 'Depth*Temp*Pressure', 'Height*Width*Depth*Temp']
+        >>> structure['resolution']
+        3
+        >>> structure['aliases']['Temp']
+        ['Depth*Pressure']
+    """
+    if isinstance(factors, pd.DataFrame) and generators is None:
+        factor_names = list(factors.columns)
+        coded = np.empty(factors.shape, dtype=np.int8)
+        for j, name in enumerate(factor_names):
+            levels = pd.unique(factors[name])
+            if len(levels) != 2:
+                raise ValueError('{} has {} levels, alias structures need two level factors'.format(name, len(levels)))
+            coded[:, j] = np.where(factors[name] == max(levels), 1, -1)
+        structure = walsh.column_words(coded)
+        if structure is None:
+            raise ValueError('The design is not a regular two level fractional factorial')
+        order, masks, signs = structure
+        n_base = int(np.log2(len(coded)))
+    else:
+        if generators is None:
+            raise ValueError('Either a design or its generators must be given')
+        factor_names = list(factors)
+        base_factors, generated_factors, words, generator_signs = _parse_generators(generators, factor_names)
+        masks = np.zeros(len(factor_names), dtype=np.int64)
+        signs = np.ones(len(factor_names), dtype=np.int8)
+        masks[base_factors] = [1 << j for j in range(len(base_factors))]
+        masks[generated_factors] = words
+        signs[generated_factors] = generator_signs
+        n_base = len(base_factors)
+
+    # A product of factors is I (or -I) exactly when the exclusive or of their masks is zero, the
+    # sign being the product of the signs of the factors
+    independent_words = _independent_words(masks)
+    defining_relation = None
+    if len(independent_words) <= 16:
+        all_words = [0]
+        for word in independent_words:
+            all_words += [word ^ other for other in all_words]
+        negative = sum(1 << i for i in range(len(factor_names)) if signs[i] < 0)
+        indexes = sorted(([i for i, bit in enumerate(bin(word)[:1:-1]) if bit == '1'], word) for word in all_words[1:])
+        indexes.sort(key=lambda pair: len(pair[0]))
+        defining_relation = [('-' if bin(word & negative).count('1') % 2 else '') +
+                             '*'.join(factor_names[i] for i in word_indexes) for word_indexes, word in indexes]
+
+    pattern = _word_length_pattern(masks, n_base)
+    lengths = [length for length in range(1, len(factor_names) + 1) if pattern[length]]
+    word_length_pattern = pd.Series(pattern[1:], index=range(1, len(factor_names) + 1), name='Words')
+
+    # Effects are aliased when their masks are equal, and aliased with the mean when their mask is zero
+    effect_names = []
+    effect_masks = []
+    effect_signs = []
+    for r in range(1, min(max_order, len(factor_names)) + 1):
+        combinations = np.array(list(itertools.combinations(range(len(factor_names)), r)), dtype=np.intp)
+        effect_masks.append(np.bitwise_xor.reduce(masks[combinations], axis=1))
+        effect_signs.append(np.prod(signs[combinations], axis=1))
+        effect_names += ['*'.join(factor_names[i] for i in combination) for combination in combinations]
+    effect_masks = np.concatenate(effect_masks)
+    effect_signs = np.concatenate(effect_signs)
+    groups, group_of_effect = np.unique(effect_masks, return_inverse=True)
+    members = [[] for _ in groups]
+    for e, group in enumerate(group_of_effect.ravel()):
+        members[group].append(e)
+    aliases = {}
+    for e, group in enumerate(group_of_effect.ravel()):
+        chain = ['I' if effect_signs[e] > 0 else '-I'] if groups[group] == 0 else []
+        for other in members[group]:
+            if other != e:
+                sign = '' if effect_signs[e] * effect_signs[other] > 0 else '-'
+                chain.append(sign + effect_names[other])
+        aliases[effect_names[e]] = chain
+
+    return {'defining_relation': defining_relation,
+            'resolution': lengths[0] if lengths else None,
+            'word_length_pattern': word_length_pattern,
+            'aliases': aliases}
+
+
+def _independent_words(masks):
+    """
+    Returns a set of words (bit masks over the factors) that generate every product of factors equal to
+    plus or minus I, found by Gaussian elimination over the bits of the factors' masks.
+    """
+    basis = []
+    words = []
+    for i, mask in enumerate(masks):
+        mask = int(mask)
+        combination = 1 << i
+        # The basis is kept with the highest leading bits first so each is removed in one pass
+        for basis_mask, basis_combination in basis:
+            if mask & (1 << (basis_mask.bit_length() - 1)):
+                mask ^= basis_mask
+                combination ^= basis_combination
+        if mask:
+            basis.append((mask, combination))
+            basis.sort(key=lambda pair: -pair[0].bit_length())
+        else:
+            words.append(combination)
+    return words
+
+
+def _word_length_pattern(masks, n_base):
+    """
+    Returns a list whose entry j is the number of words of length j in the defining relation, without
+    listing the words. The designs columns span a code whose weights are counted over all 2^n_base runs,
+    the defining relation is the dual of that code so its weights follow from the MacWilliams identities.
+    """
+    n_factors = len(masks)
+    masks = np.asarray(masks, dtype=np.int64)
+    weight_counts = np.zeros(n_factors + 1, dtype=np.int64)
+    chunk_size = 65536
+    for start in range(0, 2 ** n_base, chunk_size):
+        runs = np.arange(start, min(start + chunk_size, 2 ** n_base), dtype=np.int64)
+        parity = np.zeros((len(runs), n_factors), dtype=np.uint8)
+        for bit in range(n_base):
+            parity ^= (((runs >> bit) & 1)[:, None] & ((masks >> bit) & 1)[None, :]).astype(np.uint8)
+        weight_counts += np.bincount(parity.sum(axis=1), minlength=n_factors + 1)
+    weights = np.nonzero(weight_counts)[0]
+    counts = np.array([int(weight_counts[w]) for w in weights], dtype=object)
+    # Krawtchouk polynomials K_j(w) for every weight w present, by their three term recurrence, in
+    # python integers so that large designs stay exact
+    x = np.array([int(w) for w in weights], dtype=object)
+    previous = np.array([1] * len(x), dtype=object)
+    current = n_factors - 2 * x
+    pattern = [int((counts * previous).sum()) // 2 ** n_base, int((counts * current).sum()) // 2 ** n_base]
+    for j in range(1, n_factors):
+        previous, current = current, ((n_factors - 2 * x) * current - (n_factors - j + 1) * previous) // (j + 1)
+        pattern.append(int((counts * current).sum()) // 2 ** n_base)
+    return pattern[:n_factors + 1]
 
 
-def plackett_burman(dic_factors, runs):
+@instrument.instrumented
+def plackett_burman(dic_factors, runs, as_design=False):
     """
     Returns a Plackett-Burman design where the number of runs is the next multiple of four
     higher than the number of runs entered if the runs given isn't a multiple of four.
 
+    Parameters:
+        dic_factors: The dictionary of factors to be included in the Plackett-Burman design.
+
+        runs: The number of runs the design can use, this must be more than the number of factors.
+
+        as_design: If True the design is returned as a Design of level codes rather than a dataframe.
+
+    Returns:
+        df: A dataframe of the runs for the Plackett-Burman design.
+
+    Example:
+        >>> import design
+        >>> Factors = {'Height':[1.6,2],'Width':[0.2,0.4],'Depth':[0.2,0.3]}
+        >>> design.plackett_burman(Factors,4)
+           Height  Width  Depth
+        0     2.0    0.4    0.3
+        1     1.6    0.4    0.2
+        2     2.0    0.2    0.2
+        3     1.6    0.2    0.3
     """
-    # Plackett-Burman designs are made using hadamard matrices
-    # the hadamard matrices are taken in via an online library
+    # Plackett-Burman designs are made using hadamard matrices,
+    # these are built (and cached) by the hadamard module
     factor_names = []
     factor_levels = []
     # this for loop fills up factor_levels and factor_names arrays
     for name in dic_factors:
         factor_names.append(name)
         factor_levels.append([min(dic_factors[name]), max(dic_factors[name])])
-    # The links to the various URLs of the hadamard matrices are stored in this dictionary
-    url_dictionary = {8: "http://neilsloane.com/hadamard/had.8.txt",
-                      12: "http://neilsloane.com/hadamard/had.12.txt",
-                      16: "http://neilsloane.com/hadamard/had.16.0.txt",
-                      20: "http://neilsloane.com/hadamard/had.20.hall.n.txt",
-                      24: "http://neilsloane.com/hadamard/had.24.pal.txt",
-                      28: "http://neilsloane.com/hadamard/had.28.pal2.txt",
-                      32: "http://neilsloane.com/hadamard/had.32.pal.txt"}
     # Conditional changes run number to be a multiple of four
     if runs % 4 != 0:
         runs = runs + (4 - (runs % 4))
+    if runs <= len(dic_factors):
+        raise ValueError('A Plackett-Burman design for {} factors needs more than {} runs'.format(len(dic_factors), runs))
 
-    file = urllib.request.urlopen(url_dictionary.get(runs))
-    array = []
-    # This for loop takes the lines of the hadamard matrices and places them into the array variable
-    for line in file:
-        # decoded_line stores each line in a way that can be interacted with
-        decoded_line = line.decode("utf-8")
-        # Conditional breaks the for loop when the table has been read completely
-        if decoded_line[0] == 'H':
-            break
-        # The array is appended with the current row of the table, excluding the new line
-        array.append(list(decoded_line.split('\n')[0]))
-    # Array is currently a square, so only the columns are taken that are needed for the number of factors entered
-    df = pd.DataFrame(array[(runs - len(dic_factors)):])
-    df = df.transpose()
-    # The dataframe is currently '+' and '-' so this for loop converts to the factor levels entered in the dictionary
-    for i in range(len(dic_factors)):
-        df[i] = df[i].apply(lambda y: factor_levels[i][0] if y == '-' else factor_levels[i][1])
-    df = df.rename(columns=lambda y: factor_names[y])
-    return df
+    # The matrix is a square, so only the last rows are taken that are needed for the number of
+    # factors entered, the first row is all +1 so is never used. These rows become the columns of the design.
+    # The matrix is -1 and +1 which become the codes of the factor levels entered in the dictionary
+    with instrument.stage('structure'):
+        codes = cache.cached_structure(('plackett_burman', len(dic_factors), runs),
+                                       lambda: (_hadamard(runs)[(runs - len(dic_factors)):].T > 0).astype(np.int8))
+    return _finish(Design(codes, factor_levels, factor_names), as_design)
 
 
-def box_behnken(dic_factors):
+def _hadamard(runs):
+    with instrument.stage('hadamard'):
+        return hadamard.hadamard(runs)
+
+
+@instrument.instrumented
+def box_behnken(dic_factors, centre_points=None, as_design=False):
     """
     Creates a dataframe for a Box-Behken experimental design based on the factors given.
 
     Parameters:
         dic_factors: The dictionary of factors to be included in the Box-Behnken design.
 
+        centre_points: The number of centre runs added at the end of the design, if None there is one
+        for each factor.
+
+        as_design: If True the design is returned as a Design of level codes rather than a dataframe.
+
     Returns:
         df: The dataframe containing the Box-Behnken design.
 
@@ -329,7 +880,6 @@ def box_behnken(dic_factors):
         43     1.8    0.3   0.25  15.0     150.0
         44     1.8    0.3   0.25  15.0     150.0
     """
-    df = pd.DataFrame()
     factor_levels = []
     factor_names = []
     # this for loop fills up factor_levels and factor_names arrays
@@ -343,33 +893,62 @@ def box_behnken(dic_factors):
         else:
             factor_levels.append(
                 [sorted(dic_factors[name])[0], sorted(dic_factors[name])[1], sorted(dic_factors[name])[2]])
-    # This for loop will go through too many iterations, generating +1,+1,+1 designs which aren't needed,
-    # so a conditional is added to cut it down
-    for run in itertools.product([-1, 1, 0], repeat=len(dic_factors)):
-        run = list(run)
-        if run.count(1) < 3 and run.count(-1) < 3 and run.count(0) == len(dic_factors) - 2:
-            s_add = pd.Series(run)
-            df = pd.concat([df, s_add], axis=1, ignore_index=True)
-    # for loop adds default centre runs
-    for i in range(len(dic_factors)):
-        centre_points = [0,0,0,0,0]
-        df = pd.concat([df, pd.Series(centre_points[:len(dic_factors)])], axis=1, ignore_index=True)
-    df = df.transpose()
-    # for loop takes the -1, 0, +1 to the corresponding three factor levels for each factor
-    for i in range(len(dic_factors)):
-        df[i] = df[i].apply(
-            lambda y: factor_levels[i][0] if y == -1 else (factor_levels[i][1] if y == 0 else factor_levels[i][2]))
-    df = df.rename(columns=lambda y: factor_names[y])
-    return df
+    n_factors = len(factor_names)
+    if n_factors < 2:
+        raise ValueError('A Box-Behnken design needs at least two factors')
+    if centre_points is None:
+        centre_points = n_factors
+
+    # The coded levels -1, 0, +1 become the codes of the corresponding three factor levels for each factor
+    with instrument.stage('structure'):
+        codes = cache.cached_structure(('box_behnken', n_factors, centre_points),
+                                       lambda: _box_behnken_coded(n_factors, centre_points) + 1)
+    return _finish(Design(codes, factor_levels, factor_names), as_design)
 
 
-def central_composite(dic_factors):
+def _box_behnken_coded(n_factors, centre_points):
+    """
+    Returns a Box-Behnken design coded as an int8 matrix of -1, 0 and +1.
     """
-    Creates a Central Composite design for the factors given
+    # Each pair of factors is run at the four combinations of their -1 and +1 levels with every other
+    # factor at its centre, so the design is built straight from the pairs rather than searching the 3^k grid
+    pairs = np.array(list(itertools.combinations(range(n_factors), 2)), dtype=np.intp)
+    corners = np.array([[-1, -1], [-1, 1], [1, -1], [1, 1]], dtype=np.int8)
+    rows = np.arange(4 * len(pairs))
+    coded = np.zeros((len(rows) + centre_points, n_factors), dtype=np.int8)
+    coded[rows, np.repeat(pairs[:, 0], 4)] = np.tile(corners[:, 0], len(pairs))
+    coded[rows, np.repeat(pairs[:, 1], 4)] = np.tile(corners[:, 1], len(pairs))
+    # The runs are put in the order the design has always been listed in, taking the first factor first
+    # with its levels ordered -1, +1, 0
+    sort_keys = np.array([0, 2, 1])[coded[rows] + 1]
+    coded[rows] = coded[rows][np.lexsort(sort_keys.T[::-1])]
+    return coded
+
+
+@instrument.instrumented
+def central_composite(dic_factors, alpha='rotatable', centre_points=None, runs=None, generators=None,
+                      as_design=False):
+    """
+    Creates a Central Composite design for the factors given, made of a two level factorial core,
+    two axial runs for each factor and centre runs.
 
     Parameters:
         dic_factors: The dictionary of factors to be included in the Central Composite design.
 
+        alpha: The distance of the axial runs from the centre, relative to the factorial runs. Either a number
+        or one of 'rotatable' (the default), 'orthogonal' (the quadratic effects are uncorrelated with the
+        intercept), 'face' (the axial runs are on the faces of the factorial, so every factor has three levels)
+        or 'inscribed' (rotatable, but shrunk so that the axial runs are at the factor limits given).
+
+        centre_points: The number of centre runs, if None there is one for each factor.
+
+        runs: If given the factorial core is a fractional factorial with this many runs rather than
+        a full factorial, as in frac_fact_2level.
+
+        generators: The generators of the fractional factorial core, as in frac_fact_2level.
+
+        as_design: If True the design is returned as a Design of level codes rather than a dataframe.
+
     Returns:
         df: The dataframe containing the Central Composite design.
 
@@ -426,10 +1005,8 @@ def central_composite(dic_factors):
         45  1.800000  0.300000  0.250000  15.000000  150.000000
         46  1.800000  0.300000  0.250000  15.000000  150.000000
     """
-    df2 = pd.DataFrame()  # df2 will contain the axial points of the design
     factor_levels = []
     factor_names = []
-    alpha = 2 ** (len(dic_factors) / 4)  # this is alpha for rotatability, alpha should eventually be optional
     # this for loop fills up factor_levels and factor_names arrays
     for name in dic_factors:
         factor_names.append(name)
@@ -441,122 +1018,246 @@ def central_composite(dic_factors):
         else:
             factor_levels.append(
                 [sorted(dic_factors[name])[0], sorted(dic_factors[name])[1], sorted(dic_factors[name])[2]])
-    # The full factorial design points are made using the full factorial function
-    df1 = full_factorial_2level(dic_factors)
-    # This for loop creates the dataframe of the axial points
-    for i in range(len(dic_factors)):
-        run1 = []
-        run2 = []
-        # extremeplus and extrememinus contain the values for the extreme points of the design
-        extremeplus = factor_levels[i][1] + ((factor_levels[i][2] - factor_levels[i][1]) * alpha)
-        extrememinus = factor_levels[i][1] - ((factor_levels[i][2] - factor_levels[i][1]) * alpha)
-        # This for loop fills up the runs with the centre points for all factors
-        for j in range(len(dic_factors)):
-            run1.append(factor_levels[j][1])
-            run2.append(factor_levels[j][1])
-        # run1 and run2 have the extreme points entered in, replacing the centre point they will currently have
-        run1[i] = extremeplus
-        run2[i] = extrememinus
-        # The runs are stored as series to be concatenated to the dataframe
-        s_add1 = pd.Series(run1)
-        s_add2 = pd.Series(run2)
-        df2 = pd.concat([df2, s_add1, s_add2], axis=1, ignore_index=True)
-    # The axial dataframe is then transposed and renamed so it can be concated with the full factorial dataframe
-    df2 = df2.transpose()
-    df2 = df2.rename(columns=lambda y: factor_names[y])
-    df = pd.concat([df1, df2], axis=0, ignore_index=True)
-    # This for loop adds as many centre points as there are factors entered
-    centre_points = []
-    for i in range(len(dic_factors)):
-        centre_points.append(factor_levels[i][1])
-    for j in range(len(dic_factors)):
-        df3 = pd.DataFrame([centre_points],columns=list(dic_factors))
-        df = df.append(df3,ignore_index=True)
-    return df
+    n_factors = len(factor_names)
+    if centre_points is None:
+        centre_points = n_factors
+
+    # Every factor takes the five coded levels -alpha, -1, 0, +1, +alpha, stored as the codes 0 to 4.
+    # The codes do not depend on alpha, which only changes the coded levels.
+    key = ('central_composite', n_factors, runs, _generators_key(generators, factor_names), centre_points)
+    with instrument.stage('structure'):
+        codes = cache.cached_structure(key, lambda: _central_composite_codes(factor_names, runs, generators,
+                                                                             centre_points))
+    alpha_value = _ccd_alpha(alpha, len(codes) - 2 * n_factors - centre_points, n_factors, centre_points)
+    coded_levels = np.array([-alpha_value, -1, 0, 1, alpha_value])
+    if isinstance(alpha, str) and alpha == 'inscribed':
+        coded_levels /= alpha_value
+
+    # The coded levels are taken to the factor levels in one step, each side of the middle level
+    # is scaled separately in case three uneven levels were given
+    levels = np.array(factor_levels, dtype=float)
+    values = levels[:, 1:2] + np.where(coded_levels < 0, coded_levels * (levels[:, 1:2] - levels[:, 0:1]),
+                                       coded_levels * (levels[:, 2:3] - levels[:, 1:2]))
+    return _finish(Design(codes, values, factor_names, [coded_levels] * n_factors), as_design)
+
+
+def _central_composite_codes(factor_names, runs, generators, centre_points):
+    n_factors = len(factor_names)
+    # The factorial core is a full factorial unless runs or generators are given for a fractional one
+    if runs is None and generators is None:
+        core = _two_level_columns(n_factors, [], [])
+    else:
+        core = _frac_fact_coded(factor_names, 2 ** n_factors if runs is None else runs, generators)
+    # The design is made in one go, the core then the axial runs (+alpha then -alpha for each factor
+    # in turn) then the centre runs
+    codes = np.full((len(core) + 2 * n_factors + centre_points, n_factors), 2, dtype=np.int8)
+    codes[:len(core)] = core + 2
+    axial_rows = len(core) + np.arange(2 * n_factors)
+    codes[axial_rows, np.repeat(np.arange(n_factors), 2)] = np.tile([4, 0], n_factors)
+    return codes
+
+
+def _generators_key(generators, factor_names):
+    # Generators written with factor names depend on the names, so they are part of the cache key
+    if generators is None:
+        return None
+    if isinstance(generators, str):
+        generators = [generators]
+    return tuple(generators), tuple(factor_names)
+
+
+def _finish(design, as_design):
+    # Generators return the Design itself or, as they always have, its dataframe
+    instrument.note(rows=design.runs, columns=len(design.factor_names), nbytes=design.nbytes)
+    if as_design:
+        return design
+    with instrument.stage('dataframe'):
+        return design.to_dataframe()
+
+
+def _ccd_alpha(alpha, core_runs, n_factors, centre_points):
+    """
+    Returns the axial distance for a central composite design from the name of its type or a number.
+    """
+    if isinstance(alpha, str):
+        if alpha in ('rotatable', 'inscribed'):
+            return core_runs ** 0.25
+        if alpha == 'orthogonal':
+            total_runs = core_runs + 2 * n_factors + centre_points
+            return (core_runs * (total_runs ** 0.5 - core_runs ** 0.5) ** 2 / 4) ** 0.25
+        if alpha in ('face', 'faced', 'face-centred', 'face centred'):
+            return 1.0
+        raise ValueError("alpha must be a number or one of 'rotatable', 'orthogonal', 'face' or 'inscribed', not {}".format(
+            alpha))
+    if alpha <= 0:
+        raise ValueError('alpha must be positive')
+    return float(alpha)
 
 
-def latin_hypercube(dic_factors, runs):
+@instrument.instrumented
+def latin_hypercube(dic_factors, runs, method='random', seed=None, iterations=None, restarts=1, processes=None):
     """
     Parameters:
         dic_factors: The dictionary of factors to be included in the Latin Hypercube design.
 
         runs: The number of runs to be used in the design.
 
+        method: How the hypercube is made, 'random', 'centred', 'maximin' (spread out by swapping levels),
+        'orthogonal' (balanced over pairs of factors, runs must be the square of a prime) or 'lhsmdu'
+        (the lhsmdu package, as used before). See hypercube.sample for details.
+
+        seed: Seed for the random number generator, so that the design can be made again.
+
+        iterations: The number of swaps tried by the 'maximin' method, if None at least ten per run.
+
+        restarts: The number of independent 'maximin' searches, the best is kept.
+
+        processes: The number of processes to run the restarts over.
+
     Returns:
         df: The dataframe containing the Latin Hypercube design.
 
     Example:
         >>> import design
         >>> Factors = {'Height':[1.6,2],'Width':[0.2,0.4],'Depth':[0.2,0.3],'Temp':[10,20],'Pressure':[100,200]}
-        >>> design.latin_hypercube(Factors,50)
-              Height     Width     Depth       Temp    Pressure
-        0   1.814372  0.316126  0.203734  12.633408  150.994350
-        1   1.683852  0.327745  0.221157  10.833524  149.235694
-        2   1.952938  0.220208  0.212877  14.207334  177.737810
-        3   1.921001  0.306165  0.249451  13.747280  195.141219
-        4   1.709485  0.286836  0.214973  12.132761  144.060774
-        5   1.795442  0.339484  0.263747  16.494926  105.861897
-        6   1.849604  0.390856  0.229801  17.768834  157.379054
-        7   1.635933  0.295207  0.244843  15.561134  119.353027
-        8   1.800514  0.257358  0.232554  19.117071  114.431350
-        9   1.748656  0.311259  0.209185  19.573654  147.317771
-        10  1.610152  0.200320  0.269825  14.041168  192.787729
-        11  1.670380  0.283579  0.270421  11.422384  161.302466
-        12  1.914483  0.374190  0.273246  15.253950  110.213186
-        13  1.731642  0.363269  0.211263  15.011417  175.315691
-        14  1.864093  0.245809  0.235466  10.506234  123.998827
-        15  1.856580  0.314574  0.260263  11.787321  152.096424
-        16  1.651140  0.262106  0.289432  14.407869  121.954348
-        17  1.827840  0.278926  0.223818  12.824422  168.813816
-        18  1.780800  0.380327  0.252359  12.290440  171.741507
-        19  1.762333  0.224241  0.216475  18.386775  165.564771
-        20  1.949560  0.300988  0.285943  10.063231  155.134033
-        21  1.646881  0.248638  0.250362  16.701447  163.476898
-        22  1.974239  0.379487  0.279709  17.208315  181.757031
-        23  1.904317  0.216877  0.292985  18.829669  136.808281
-        24  1.899844  0.343903  0.230494  13.197326  198.654066
-        25  1.696839  0.329348  0.283741  18.193024  135.335187
-        26  1.689936  0.272728  0.218891  19.800988  131.615692
-        27  1.823893  0.299159  0.247030  10.790362  191.524570
-        28  1.841140  0.210635  0.286718  10.327824  167.595627
-        29  1.883991  0.385993  0.277186  18.773584  178.871167
-        30  1.932945  0.358221  0.294327  16.890948  125.635668
-        31  1.837620  0.370877  0.242782  17.103119  142.240418
-        32  1.740477  0.352914  0.265939  14.697769  129.088978
-        33  1.624078  0.347985  0.298516  13.933373  132.011517
-        34  1.786612  0.351899  0.225313  15.827930  188.649172
-        35  1.892142  0.206601  0.254650  14.805995  138.732923
-        36  1.656703  0.252798  0.205547  18.461586  184.792345
-        37  1.770805  0.270721  0.226262  11.940936  113.390934
-        38  1.672266  0.288289  0.275940  15.640371  186.777116
-        39  1.600629  0.240123  0.280908  17.934686  126.897387
-        40  1.995175  0.237031  0.240472  16.393982  116.475088
-        41  1.713062  0.265850  0.256147  17.418780  172.746504
-        42  1.964540  0.235473  0.266340  11.334520  196.454539
-        43  1.757516  0.366909  0.207040  13.488750  102.146392
-        44  1.942405  0.214971  0.290674  13.373628  109.206897
-        45  1.985601  0.229702  0.297658  12.435430  101.336426
-        46  1.617340  0.321384  0.200862  19.338525  159.238981
-        47  1.976837  0.393484  0.258497  16.167623  140.926988
-        48  1.877091  0.399951  0.239234  19.788923  182.759572
-        49  1.725652  0.332160  0.237414  11.136650  107.726667
-    """
-    df = pd.DataFrame()
-    factor_names = []
-    count = 0
-    # Creates an array filled with a latin hypercube form 0 to 1
-    array = lhsmdu.sample(len(dic_factors), runs)
-    # This for loop converts the latin hypercube to have the levels entered into the dictionary of factors
-    for name in dic_factors:
-        factor_names.append(name)
-        low = min(dic_factors[name])
-        high = max(dic_factors[name])
-        # non_coded stored the array being mapped to fit the levels of the factors entered
-        non_coded = np.array(list(map(lambda x: low + ((high - low) * x), array[count])))
-        # Converts non_coded (which is currently one column of the final dataframe) to a series
-        s_add = pd.Series(non_coded[0][0])
-        count += 1
-        # Adds the series to the dataframe
-        df = pd.concat([df, s_add], ignore_index=True, axis=1)
-    df = df.rename(columns=lambda y: factor_names[y])
-    return df
\ No newline at end of file
+        >>> design.latin_hypercube(Factors,5,method='maximin',seed=1)
+           Height  Width  Depth  Temp  Pressure
+        0    1.80   0.38   0.29  13.0     170.0
+        1    1.64   0.34   0.27  15.0     110.0
+        2    1.96   0.26   0.25  17.0     130.0
+        3    1.72   0.22   0.21  19.0     190.0
+        4    1.88   0.30   0.23  11.0     150.0
+    """
+    factor_names = list(dic_factors)
+    if method == 'lhsmdu':
+        # lhsmdu reduces the correlation between columns but grows with the square of the runs, it is
+        # only imported when used as it is slow to import and not otherwise needed
+        import lhsmdu
+        if seed is not None:
+            lhsmdu.setRandomSeed(seed)
+        with instrument.stage('sample'):
+            array = np.asarray(lhsmdu.sample(len(dic_factors), runs)).T
+    else:
+        # Creates an array filled with a latin hypercube from 0 to 1
+        with instrument.stage('sample'):
+            array = hypercube.sample(runs, len(dic_factors), method=method, seed=seed, iterations=iterations,
+                                     restarts=restarts, processes=processes)
+    # The hypercube is converted to have the levels entered into the dictionary of factors in one step
+    low = np.array([min(dic_factors[name]) for name in factor_names], dtype=float)
+    high = np.array([max(dic_factors[name]) for name in factor_names], dtype=float)
+    with instrument.stage('dataframe'):
+        instrument.note(rows=runs, columns=len(factor_names))
+        return pd.DataFrame(low + (high - low) * array, columns=factor_names)
+
+
+@instrument.instrumented
+def optimal(dic_factors, runs, model='linear', criterion='D', starts=10, seed=None, processes=None,
+            constraint=None, as_design=False):
+    """
+    Creates a D-optimal or I-optimal design for a model in the factors, found by coordinate exchange
+    from several random starting designs.
+
+    Factors given two numbers can take any value between them, searched over an evenly spaced grid of
+    two values (three if the factor is squared in the model). Factors given three or more numbers can
+    only take those values, and factors given anything else (such as names) are categorical.
+
+    Parameters:
+        dic_factors: The dictionary of factors to be included in the design.
+
+        runs: The number of runs, at least the number of columns of the model matrix.
+
+        model: 'linear' (main effects), 'interaction' (main effects and two factor interactions),
+        'quadratic' (interactions and squares) or a list of terms such as ['Height', 'Width', 'Height*Width',
+        'Height^2'], the intercept is always included.
+
+        criterion: 'D' maximises the determinant of the information matrix, so that the effects are
+        estimated as precisely as possible, 'I' minimises the average variance of predictions over the factor
+        ranges, so is better for response surfaces.
+
+        starts: The number of random starting designs, the best design found is kept.
+
+        seed: Seed for the random starting designs, the same seed always gives the same design.
+
+        processes: The number of processes to share the starts between, None or 1 runs them in this process.
+
+        constraint: Optional function taking a dataframe of runs and returning True for each run that is
+        allowed, to stop combinations of levels that cannot be run being chosen. It must be defined at
+        the top level of a module when processes is more than 1.
+
+        as_design: If True the design is returned as a Design of level codes rather than a dataframe.
+
+    Returns:
+        df: The dataframe containing the optimal design.
+
+    Example:
+        >>> import design
+        >>> Factors = {'Height':[1.6,2],'Width':[0.2,0.4],'Material':['Steel','Wood']}
+        >>> design.optimal(Factors, 4, seed=1)
+           Height  Width Material
+        0     1.6    0.2     Wood
+        1     1.6    0.4    Steel
+        2     2.0    0.2    Steel
+        3     2.0    0.4     Wood
+    """
+    factor_names = list(dic_factors)
+    categorical = [not model_module.is_numeric(dic_factors[name]) for name in factor_names]
+    terms = model_module.model_terms(model, factor_names, categorical)
+    level_counts = [len(dic_factors[name]) if categorical[j] else None for j, name in enumerate(factor_names)]
+    if criterion not in ('D', 'I'):
+        raise ValueError("criterion must be 'D' or 'I', not {}".format(criterion))
+
+    # Each factor's candidate values in coded units (level indexes for categorical factors), the levels
+    # they stand for, and the points averaged over for the I criterion
+    candidate_levels, levels, coded_levels, points = [], [], [], []
+    for j, name in enumerate(factor_names):
+        values = list(dic_factors[name])
+        if categorical[j]:
+            candidate_levels.append(np.arange(len(values)))
+            levels.append(values)
+            coded_levels.append(None)
+            points.append((np.arange(len(values)), np.full(len(values), 1 / len(values))))
+            continue
+        low, high = float(min(values)), float(max(values))
+        middle, half = (low + high) / 2, (high - low) / 2
+        if len(set(values)) > 2:
+            coded = (np.array(sorted(set(values)), dtype=float) - middle) / (half if half else 1)
+            points.append((coded, np.full(len(coded), 1 / len(coded))))
+        else:
+            squared = any(term.count(j) > 1 for term in terms)
+            coded = np.linspace(-1, 1, 3 if squared else 2)
+            # Gauss-Legendre points average polynomials over the whole range exactly
+            nodes, weights = np.polynomial.legendre.leggauss(10)
+            points.append((nodes, weights / 2))
+        candidate_levels.append(coded)
+        levels.append(middle + half * coded)
+        coded_levels.append(coded)
+    n_columns = len(model_module.column_names(terms, factor_names, level_counts))
+    if runs < n_columns:
+        raise ValueError('The model has {} columns so needs at least that many runs, not {}'.format(n_columns, runs))
+
+    moments = model_module.moment_matrix(terms, level_counts, points) if criterion == 'I' else None
+    allowed = None if constraint is None else _Allowed(constraint, levels, factor_names)
+    with instrument.stage('search'):
+        value, indexes = exchange.search(candidate_levels, level_counts, terms, runs, criterion=criterion,
+                                         starts=starts, seed=seed, processes=processes, allowed=allowed,
+                                         moments=moments)
+    instrument.note(criterion=value)
+    # The runs are put in order of their levels so the design reads like the other designs
+    indexes = indexes[np.lexsort(indexes.T[::-1])]
+    coded_levels = [values if values is not None else np.linspace(-1, 1, len(levels[j])) if len(levels[j]) > 1
+                    else np.zeros(1) for j, values in enumerate(coded_levels)]
+    return _finish(Design(indexes, levels, factor_names, coded_levels), as_design)
+
+
+class _Allowed:
+    # Turns the level indexes tried by the search into a dataframe for the user's constraint, as a
+    # class rather than a closure so that it can be sent to other processes
+
+    def __init__(self, constraint, levels, factor_names):
+        self.constraint = constraint
+        self.levels = [pd.Index(factor_levels) for factor_levels in levels]
+        self.factor_names = factor_names
+
+    def __call__(self, indexes):
+        runs = pd.DataFrame({name: self.levels[j].take(indexes[:, j]) for j, name in enumerate(self.factor_names)})
+        return np.asarray(self.constraint(runs), dtype=bool)
@@ -0,0 +1,293 @@
+# Measures of how well candidate designs estimate a model, for comparing designs before running them
+
+import numpy as np
+import pandas as pd
+import model as model_module
+import instrument
+
+
+@instrument.instrumented
+def efficiency(designs, model='linear', dic_factors=None):
+    """
+    Returns the D, A and G efficiencies (in percent) of one or many designs for a model. 100 is the best
+    possible for a design with that many runs over the coded -1 to +1 region. The designs are stacked and
+    evaluated together, so comparing hundreds of candidates costs a few numpy calls.
+
+    Parameters:
+        designs: A design (a Design, a dataframe or an array in coded units) or a list of them.
+
+        model: 'linear', 'interaction', 'quadratic' or a list of terms, as in design.optimal.
+
+        dic_factors: The dictionary of factors, needed to code dataframes with categorical factors or whose
+        runs do not reach the ends of the factor ranges. See model.code_design.
+
+    Returns:
+        df: A dataframe with one row per design and the columns 'D-Efficiency', 'A-Efficiency' and 'G-Efficiency'.
+
+    Example:
+        >>> import design
+        >>> import diagnostics
+        >>> Factors = {'Height':[1.6,2],'Width':[0.2,0.4],'Depth':[0.2,0.3],'Temp':[10,20]}
+        >>> diagnostics.efficiency([design.full_factorial_2level(Factors), design.frac_fact_2level(Factors, 8)])
+           D-Efficiency  A-Efficiency  G-Efficiency
+        0         100.0         100.0         100.0
+        1         100.0         100.0         100.0
+    """
+    stack = _Stack(designs, model, dic_factors)
+    d = np.full(stack.count, np.nan)
+    a = np.full(stack.count, np.nan)
+    g = np.full(stack.count, np.nan)
+    for indexes, matrices, information, inverse, ok in stack.groups():
+        n, p = matrices.shape[1:]
+        with instrument.stage('criteria'):
+            log_determinant = np.linalg.slogdet(information)[1]
+            d[indexes] = np.where(ok, 100 * np.exp(log_determinant / p) / n, 0)
+            a[indexes] = np.where(ok, 100 * p / (n * np.trace(inverse, axis1=1, axis2=2)), 0)
+            # The largest prediction variance over the runs of each design
+            leverage = np.einsum('bij,bjk,bik->bi', matrices, inverse, matrices)
+            g[indexes] = np.where(ok, 100 * p / (n * leverage.max(axis=1)), 0)
+    return stack.frame({'D-Efficiency': d, 'A-Efficiency': a, 'G-Efficiency': g})
+
+
+@instrument.instrumented
+def variance_inflation(designs, model='linear', dic_factors=None):
+    """
+    Returns the variance inflation factor of each model column (except the intercept) of one or many
+    designs, how many times larger the variance of its estimate is than it would be if it were
+    uncorrelated with every other column. 1 is ideal, and above about 10 the column is badly confounded.
+
+    Parameters:
+        designs: A design or a list of them, see efficiency.
+
+        model: The model, see efficiency.
+
+        dic_factors: The dictionary of factors, see efficiency.
+
+    Returns:
+        df: A dataframe with one row per design and one column per model column, singular designs are NaN.
+    """
+    stack = _Stack(designs, model, dic_factors)
+    vif = np.full((stack.count, len(stack.names) - 1), np.nan)
+    for indexes, matrices, information, inverse, ok in stack.groups():
+        with instrument.stage('criteria'):
+            centred = matrices[:, :, 1:] - matrices[:, :, 1:].mean(axis=1, keepdims=True)
+            spread = (centred ** 2).sum(axis=1)
+            values = np.diagonal(inverse, axis1=1, axis2=2)[:, 1:] * spread
+            vif[indexes] = np.where(ok[:, None], values, np.nan)
+    return stack.frame(dict(zip(stack.names[1:], vif.T)))
+
+
+@instrument.instrumented
+def correlation_map(designs, model='interaction', dic_factors=None):
+    """
+    Returns the absolute correlations between every pair of model columns (except the intercept), the
+    colour map of correlations used to see which effects and interactions are confounded. By default
+    the model includes every two factor interaction so their aliasing with main effects shows.
+
+    Parameters:
+        designs: A design or a list of them, see efficiency.
+
+        model: The model, see efficiency.
+
+        dic_factors: The dictionary of factors, see efficiency.
+
+    Returns:
+        df: A square dataframe of absolute correlations for a single design, or a list of them for a list
+        of designs. Columns that do not vary in a design have correlations of NaN.
+
+    Example:
+        >>> import design
+        >>> import diagnostics
+        >>> Factors = {'A':[-1,1],'B':[-1,1],'C':[-1,1]}
+        >>> diagnostics.correlation_map(design.frac_fact_2level(Factors, 4)).loc['A']
+        A      1.0
+        B      0.0
+        C      0.0
+        A*B    0.0
+        A*C    0.0
+        B*C    1.0
+        Name: A, dtype: float64
+    """
+    stack = _Stack(designs, model, dic_factors, need_inverse=False)
+    maps = np.full((stack.count, len(stack.names) - 1, len(stack.names) - 1), np.nan)
+    for indexes, matrices, information, inverse, ok in stack.groups():
+        with instrument.stage('criteria'):
+            centred = matrices[:, :, 1:] - matrices[:, :, 1:].mean(axis=1, keepdims=True)
+            norms = np.sqrt((centred ** 2).sum(axis=1))
+            with np.errstate(invalid='ignore', divide='ignore'):
+                normalised = centred / norms[:, None, :]
+                maps[indexes] = abs(np.einsum('bij,bik->bjk', normalised, normalised))
+    frames = [pd.DataFrame(values, index=stack.names[1:], columns=stack.names[1:]) for values in maps]
+    return frames if stack.many else frames[0]
+
+
+@instrument.instrumented
+def prediction_variance(designs, points=None, model='linear', dic_factors=None, steps=21):
+    """
+    Returns the relative prediction variance, the variance of the predicted response divided by the
+    error variance, of one or many designs at a set of points.
+
+    Parameters:
+        designs: A design or a list of them, see efficiency.
+
+        points: The points to predict at, as a dataframe in the units of the factors or an array in coded
+        units. If None the variance profile is given, each numeric factor moving from -1 to +1 in coded
+        units with the other numeric factors at 0 and categorical factors at their first level.
+
+        model: The model, see efficiency.
+
+        dic_factors: The dictionary of factors, see efficiency.
+
+        steps: The number of points along each factor of the variance profile.
+
+    Returns:
+        df: A dataframe with one row per point and one column per design. The profile is indexed by the
+        factor moved and its coded value.
+    """
+    stack = _Stack(designs, model, dic_factors)
+    if points is None:
+        index = []
+        coded_points = []
+        for j, count in enumerate(stack.level_counts):
+            if count is not None:
+                continue
+            for value in np.linspace(-1, 1, steps):
+                point = np.zeros(len(stack.level_counts))
+                point[j] = value
+                coded_points.append(point)
+                index.append((stack.factor_names[j], value))
+        coded_points = np.array(coded_points).reshape(-1, len(stack.level_counts))
+        index = pd.MultiIndex.from_tuples(index, names=['Factor', 'Coded Value'])
+    else:
+        if hasattr(points, 'columns'):
+            coded_points = model_module.code_design(points[stack.factor_names], dic_factors)[0]
+        else:
+            coded_points = np.asarray(points, dtype=float)
+        index = pd.RangeIndex(len(coded_points))
+    rows = model_module.model_matrix(coded_points, stack.terms, stack.level_counts)
+    variances = np.full((len(rows), stack.count), np.nan)
+    for indexes, matrices, information, inverse, ok in stack.groups():
+        with instrument.stage('criteria'):
+            values = np.einsum('ij,bjk,ik->ib', rows, inverse, rows)
+            variances[:, indexes] = np.where(ok[None, :], values, np.nan)
+    return pd.DataFrame(variances, index=index, columns=pd.RangeIndex(stack.count))
+
+
+@instrument.instrumented
+def power(designs, effect_sizes=1.0, model='linear', dic_factors=None, alpha=0.05, sigma=1.0):
+    """
+    Returns the power of the t-test of each model coefficient, the chance it is found significant at
+    level alpha when its true value is the effect size given. Needs scipy, which is only imported here.
+
+    Parameters:
+        designs: A design or a list of them, see efficiency.
+
+        effect_sizes: The size of the coefficients in coded units (half the change in the response from the
+        low to the high level), either one number for every model column or a dictionary of model column
+        names and sizes, in which case only those columns are given.
+
+        model: The model, see efficiency.
+
+        dic_factors: The dictionary of factors, see efficiency.
+
+        alpha: The significance level of the tests.
+
+        sigma: The standard deviation of the error.
+
+    Returns:
+        df: A dataframe with one row per design and one column per model column. Designs with no degrees
+        of freedom for error, or that cannot estimate the model, have a power of NaN.
+
+    Example:
+        >>> import design
+        >>> import diagnostics
+        >>> Factors = {'A':[-1,1],'B':[-1,1],'C':[-1,1]}
+        >>> diagnostics.power(design.full_factorial_2level(Factors), effect_sizes=1).round(3)
+               A      B      C
+        0  0.572  0.572  0.572
+    """
+    from scipy import stats
+
+    stack = _Stack(designs, model, dic_factors)
+    if isinstance(effect_sizes, dict):
+        names = list(effect_sizes)
+        for name in names:
+            if name not in stack.names:
+                raise ValueError('{} is not a column of the model'.format(name))
+        columns = [stack.names.index(name) for name in names]
+        sizes = np.array([effect_sizes[name] for name in names], dtype=float)
+    else:
+        names = stack.names[1:]
+        columns = list(range(1, len(stack.names)))
+        sizes = np.full(len(columns), float(effect_sizes))
+    powers = np.full((stack.count, len(columns)), np.nan)
+    for indexes, matrices, information, inverse, ok in stack.groups():
+        n, p = matrices.shape[1:]
+        if n <= p:
+            continue
+        with instrument.stage('power'):
+            standard_errors = sigma * np.sqrt(np.diagonal(inverse, axis1=1, axis2=2)[:, columns])
+            noncentrality = sizes[None, :] / standard_errors
+            critical = stats.t.ppf(1 - alpha / 2, n - p)
+            values = stats.nct.sf(critical, n - p, noncentrality) + stats.nct.cdf(-critical, n - p, noncentrality)
+            powers[indexes] = np.where(ok[:, None], values, np.nan)
+    return stack.frame(dict(zip(names, powers.T)))
+
+
+class _Stack:
+    """
+    The model matrices of a list of designs. Designs with the same number of runs are stacked into one
+    three dimensional array so that the information matrices, their inverses and every criterion are
+    found for the whole group in single numpy calls.
+    """
+
+    def __init__(self, designs, model, dic_factors, need_inverse=True):
+        self.many = isinstance(designs, (list, tuple)) or (isinstance(designs, np.ndarray) and designs.ndim == 3)
+        designs = list(designs) if self.many else [designs]
+        self.count = len(designs)
+        self.need_inverse = need_inverse
+        with instrument.stage('coding'):
+            coded = [model_module.code_design(d, dic_factors) for d in designs]
+            self.level_counts = coded[0][1]
+            self.factor_names = coded[0][2]
+            for _, level_counts, factor_names in coded[1:]:
+                if factor_names != self.factor_names or level_counts != self.level_counts:
+                    raise ValueError('Every design must have the same factors')
+            categorical = [count is not None for count in self.level_counts]
+            self.terms = model_module.model_terms(model, self.factor_names, categorical)
+            self.names = model_module.column_names(self.terms, self.factor_names, self.level_counts,
+                                                   self._levels(designs[0], dic_factors))
+            self.coded = [values for values, _, _ in coded]
+        instrument.note(designs=self.count, columns=len(self.names))
+
+    def _levels(self, design, dic_factors):
+        if hasattr(design, 'coded_levels'):
+            return [list(levels) for levels in design.levels]
+        if dic_factors is not None:
+            return [list(dic_factors[name]) for name in self.factor_names]
+        if hasattr(design, 'columns'):
+            return [sorted(set(design[name])) for name in self.factor_names]
+        return None
+
+    def groups(self):
+        """
+        Yields, for each number of runs, the indexes of the designs with that many runs, their model
+        matrices, information matrices, inverse information matrices and whether each can estimate the model.
+        """
+        sizes = {}
+        for i, values in enumerate(self.coded):
+            sizes.setdefault(values.shape, []).append(i)
+        for indexes in sizes.values():
+            with instrument.stage('information'):
+                matrices = model_module.model_matrix(np.stack([self.coded[i] for i in indexes]), self.terms,
+                                                     self.level_counts)
+                information = np.einsum('bij,bik->bjk', matrices, matrices)
+                p = information.shape[-1]
+                ok = np.linalg.matrix_rank(information) == p
+                inverse = np.full(information.shape, np.nan)
+                if self.need_inverse and ok.any():
+                    inverse[ok] = np.linalg.inv(information[ok])
+            yield np.array(indexes), matrices, information, inverse, ok
+
+    def frame(self, columns):
+        return pd.DataFrame(columns, index=pd.RangeIndex(self.count))
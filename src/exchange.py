@@ -0,0 +1,185 @@
+# Coordinate exchange search for D and I optimal designs, used by design.optimal
+
+import concurrent.futures
+import numpy as np
+import model
+
+# A swap has to improve the criterion by at least this fraction to be made, which stops the
+# search going round in circles on rounding errors
+_TOLERANCE = 1e-9
+
+
+def search(candidate_levels, level_counts, terms, runs, criterion='D', starts=10, seed=None, processes=None,
+           allowed=None, moments=None, max_passes=100):
+    """
+    Returns the best design found by coordinate exchange from several random starts.
+
+    Parameters:
+        candidate_levels: For each factor the coded values (numeric) or level indexes (categorical) it can take.
+
+        level_counts: The number of levels of each categorical factor and None for numeric factors.
+
+        terms: The model terms from model.model_terms.
+
+        runs: The number of runs.
+
+        criterion: 'D' maximises the determinant of the information matrix, 'I' minimises the average
+        prediction variance over the design region (which needs moments).
+
+        starts: The number of random starting designs.
+
+        seed: Seed for the random starts.
+
+        processes: The number of processes to share the starts between, None or 1 runs them here.
+
+        allowed: Optional function taking an array of candidate runs (the index into candidate_levels of
+        each factor, one row per run) and returning a boolean array of which are allowed.
+
+        moments: The moment matrix of the model over the design region, from model.moment_matrix.
+
+        max_passes: The most passes through every coordinate of the design in each start.
+
+    Returns:
+        value: The log determinant (D) or average prediction variance (I) of the best design.
+
+        indexes: The index into candidate_levels of each factor in each run of the best design.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(starts)
+    arguments = [(candidate_levels, level_counts, terms, runs, criterion, s, allowed, moments, max_passes)
+                 for s in seeds]
+    if processes is not None and processes > 1:
+        with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+            results = list(executor.map(_start, arguments))
+    else:
+        results = [_start(argument) for argument in arguments]
+    results = [result for result in results if result is not None]
+    if not results:
+        raise ValueError('No starting design could be found with a non-singular information matrix, '
+                         'try more runs or a smaller model')
+    if criterion == 'D':
+        return max(results, key=lambda result: result[0])
+    return min(results, key=lambda result: result[0])
+
+
+def _start(argument):
+    candidate_levels, level_counts, terms, runs, criterion, seed, allowed, moments, max_passes = argument
+    return _ExchangeSearch(candidate_levels, level_counts, terms, runs, criterion, seed, allowed,
+                           moments).run(max_passes)
+
+
+class _ExchangeSearch:
+    """
+    One coordinate exchange search. Changing one coordinate of run i replaces the row x of the model
+    matrix with a new row u, so the information matrix M changes by u u^T - x x^T. The determinant
+    ratio of every candidate u comes from the matrix determinant lemma and the inverse of M is kept
+    up to date with two Sherman-Morrison steps, so M is never refactorised during a pass.
+    """
+
+    def __init__(self, candidate_levels, level_counts, terms, runs, criterion, seed, allowed, moments):
+        self.candidate_levels = [np.asarray(levels, dtype=float) for levels in candidate_levels]
+        self.level_counts = level_counts
+        self.terms = terms
+        self.runs = runs
+        self.criterion = criterion
+        self.rng = np.random.default_rng(seed)
+        self.allowed = allowed
+        self.moments = moments
+
+    def _random_runs(self, count):
+        indexes = np.column_stack([self.rng.integers(0, len(levels), size=count)
+                                   for levels in self.candidate_levels])
+        return indexes
+
+    def _coded(self, indexes):
+        return np.column_stack([self.candidate_levels[j][indexes[:, j]] for j in range(indexes.shape[1])])
+
+    def _start_design(self):
+        # Random runs are drawn until there are enough that are allowed
+        chosen = np.empty((0, len(self.candidate_levels)), dtype=np.int64)
+        for attempt in range(100):
+            batch = self._random_runs(max(4 * self.runs, 100))
+            if self.allowed is not None:
+                batch = batch[np.asarray(self.allowed(batch), dtype=bool)]
+            chosen = np.vstack([chosen, batch])
+            if len(chosen) >= self.runs:
+                return chosen[:self.runs]
+        raise ValueError('Too few runs are allowed by the constraint to make a starting design')
+
+    def run(self, max_passes):
+        indexes = self._start_design()
+        rows = model.model_matrix(self._coded(indexes), self.terms, self.level_counts)
+        p = rows.shape[1]
+        information = rows.T @ rows
+        if np.linalg.matrix_rank(information) < p:
+            # A small ridge lets a singular start be improved, it is removed when the inverse is refreshed
+            information = information + 1e-6 * np.trace(information) / p * np.eye(p)
+        inverse = np.linalg.inv(information)
+        for _ in range(max_passes):
+            improved = False
+            for i in range(self.runs):
+                for j in range(len(self.candidate_levels)):
+                    if self._exchange(indexes, rows, inverse, i, j):
+                        improved = True
+            # The inverse is refreshed once a pass to stop rounding errors building up
+            information = rows.T @ rows
+            if np.linalg.matrix_rank(information) < p:
+                information = information + 1e-6 * np.trace(information) / p * np.eye(p)
+            inverse[:] = np.linalg.inv(information)
+            if not improved:
+                break
+        information = rows.T @ rows
+        sign, log_determinant = np.linalg.slogdet(information)
+        if sign <= 0 or np.linalg.matrix_rank(information) < p:
+            return None
+        if self.criterion == 'D':
+            return log_determinant, indexes
+        return float(np.trace(np.linalg.solve(information, self.moments))), indexes
+
+    def _exchange(self, indexes, rows, inverse, i, j):
+        """
+        Tries every level of factor j in run i, makes the best change if it improves the criterion
+        and returns True if a change was made.
+        """
+        candidates = np.repeat(indexes[i:i + 1], len(self.candidate_levels[j]), axis=0)
+        candidates[:, j] = np.arange(len(self.candidate_levels[j]))
+        candidates = np.delete(candidates, indexes[i, j], axis=0)
+        if self.allowed is not None:
+            candidates = candidates[np.asarray(self.allowed(candidates), dtype=bool)]
+        if not len(candidates):
+            return False
+        new_rows = model.model_matrix(self._coded(candidates), self.terms, self.level_counts)
+        old_row = rows[i]
+        old_projection = inverse @ old_row
+        new_projection = new_rows @ inverse
+        d_old = old_row @ old_projection
+        d_new = (new_projection * new_rows).sum(axis=1)
+        cross = new_rows @ old_projection
+        if self.criterion == 'D':
+            # The determinant lemma for M + u u^T - x x^T gives the ratio of the new determinant to the old
+            ratio = (1 + d_new) * (1 - d_old) + cross ** 2
+            best = int(np.argmax(ratio))
+            if ratio[best] <= 1 + _TOLERANCE:
+                return False
+        else:
+            # The change in trace(M^-1 W) after adding u then removing x, for every candidate u at once
+            weighted = new_projection @ self.moments
+            added = np.einsum('ij,ij->i', weighted, new_projection) / (1 + d_new)
+            removed_row = old_projection[None, :] - new_projection * (cross / (1 + d_new))[:, None]
+            removed_d = d_old - cross ** 2 / (1 + d_new)
+            # A candidate that would leave the information matrix singular is never chosen
+            singular = removed_d >= 1 - _TOLERANCE
+            removed = (np.einsum('ij,ij->i', removed_row @ self.moments, removed_row)
+                       / np.where(singular, 1, 1 - removed_d))
+            change = np.where(singular, np.inf, removed - added)
+            best = int(np.argmin(change))
+            if change[best] >= -_TOLERANCE * abs(np.trace(inverse @ self.moments)):
+                return False
+        # Sherman-Morrison: add the new row then remove the old one
+        u = new_rows[best]
+        inverse_u = inverse @ u
+        inverse -= np.outer(inverse_u, inverse_u) / (1 + u @ inverse_u)
+        inverse_x = inverse @ old_row
+        inverse += np.outer(inverse_x, inverse_x) / (1 - old_row @ inverse_x)
+        rows[i] = u
+        indexes[i] = candidates[best]
+        return True
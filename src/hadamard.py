@@ -0,0 +1,302 @@
+# Construction of the Hadamard matrices that Plackett-Burman designs are made from
+
+import functools
+import numpy as np
+import cache
+
+# Hadamard matrices of these orders cannot be made from the Sylvester and Paley constructions
+# (or Kronecker products of them), so they are built with the Goethals-Seidel array from four
+# circulant matrices. The first rows of the circulants were found by computer search.
+# Orders 184 and 232 follow from these by doubling.
+_GOETHALS_SEIDEL_TABLE = {
+    92: ('++-+-+++--++++-+++-+++-',
+         '+-+--+-+--++-++++++----',
+         '+++++---+---+++-++-++--',
+         '----+++-+-+++-+--+-++--'),
+    116: ('-+----+-----+--+++-+---+---++',
+          '--+-++-++-+----+-+-+---++++--',
+          '++++--++--+++-+-++--+-+++-+--',
+          '--+++-++++++--+-------++--+-+'),
+    156: ('-+-+++--+-+--++-++++-+++-+---++--+++-+-',
+          '++--+-+--------+++-+++-+--++--+++----++',
+          '----++--+-+-+--+-+--+--+-+++-+-+-+++++-',
+          '++---+--+------+-----++-+-----++-++++--'),
+    172: ('------++-++--+++-++----++++-++++--+-+-+-+--',
+          '---+-++--++-++++-+-++--+++-----+-+--+++-+--',
+          '---+-++--++-++++-+-++--+++-----+-+--+++-+--',
+          '--++-++-+++-++++-+-++-++++-+---+++--+++++-+'),
+}
+
+# Turyn type sequences (lengths n, n, n and n - 1) give T-sequences of length 3n - 1
+# and so a Hadamard matrix of order 4(3n - 1), these cover the remaining orders below 256.
+_TURYN_TABLE = {
+    188: ('-+++++-+----+-+-',
+          '+---+++---+++-++',
+          '+--+-+-++-------',
+          '+-+--++-++--+++'),
+    236: ('+++-+-+-+--+-+--+-++',
+          '----+-+++-+---++--+-',
+          '+++-----++--++-+-++-',
+          '---+++-+++++-++-+++'),
+}
+
+# The matrices could previously only be downloaded, this is kept as a last resort for orders
+# that have no construction here. Downloaded matrices are kept in the on-disk cache.
+_SLOANE_URL = "http://neilsloane.com/hadamard/had.{}.txt"
+
+
+def hadamard(order, allow_download=False):
+    """
+    Returns a normalised Hadamard matrix of the order given, that is a square matrix of +1 and -1
+    whose rows are orthogonal, with the first row and column all +1. Matrices are built locally
+    for every multiple of four up to 256 (and many beyond), once built they are kept in memory
+    and, if a cache directory has been set, on disk.
+
+    Parameters:
+        order: The size of the matrix, must be 1, 2 or a multiple of four.
+
+        allow_download: If no construction is known for the order, try to download the matrix
+        from Neil Sloane's library of Hadamard matrices.
+
+    Returns:
+        matrix: A read-only int8 numpy array of shape (order, order).
+
+    Example:
+        >>> import hadamard
+        >>> hadamard.hadamard(4)
+        array([[ 1,  1,  1,  1],
+               [ 1, -1,  1, -1],
+               [ 1,  1, -1, -1],
+               [ 1, -1, -1,  1]], dtype=int8)
+    """
+    return _cached_hadamard(int(order), allow_download)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_hadamard(order, allow_download):
+    if order < 1 or (order > 2 and order % 4 != 0):
+        raise ValueError('Hadamard matrices only exist for orders 1, 2 and multiples of four, not {}'.format(order))
+    name = 'hadamard_{}'.format(order)
+    matrix = cache.load_array(name)
+    if matrix is None or matrix.shape != (order, order) or not _is_hadamard(matrix):
+        matrix = _construct(order)
+        if matrix is None and allow_download:
+            matrix = _download(order)
+        if matrix is None:
+            raise ValueError('No construction is known here for a Hadamard matrix of order {}'.format(order))
+        matrix = _normalise(matrix)
+        cache.save_array(name, matrix)
+    matrix = np.ascontiguousarray(matrix, dtype=np.int8)
+    # The same array is handed out on every call, so it is made read-only to protect the cache
+    matrix.flags.writeable = False
+    return matrix
+
+
+def _construct(order):
+    """
+    Tries each construction in turn and returns the first matrix made, or None.
+    """
+    if order == 1:
+        return np.ones((1, 1), dtype=np.int8)
+    if order & (order - 1) == 0:
+        return _sylvester(order)
+    if _prime_power(order - 1) and (order - 1) % 4 == 3:
+        return _paley_one(order - 1)
+    if order % 2 == 0 and _prime_power(order // 2 - 1) and (order // 2 - 1) % 4 == 1:
+        return _paley_two(order // 2 - 1)
+    if order in _GOETHALS_SEIDEL_TABLE:
+        return _goethals_seidel(*[_sequence(row) for row in _GOETHALS_SEIDEL_TABLE[order]])
+    if order in _TURYN_TABLE:
+        return _goethals_seidel(*_turyn_to_sequences(*[_sequence(row) for row in _TURYN_TABLE[order]]))
+    # Otherwise the order is split into two smaller orders, trying the smallest factor first
+    for small in range(2, int(order ** 0.5) + 1):
+        if order % small == 0 and (small <= 2 or small % 4 == 0) and (order // small) % 4 == 0:
+            first = _construct(small)
+            second = _construct(order // small) if first is not None else None
+            if second is not None:
+                return np.kron(first, second)
+    return None
+
+
+def _sylvester(order):
+    matrix = np.ones((1, 1), dtype=np.int8)
+    while len(matrix) < order:
+        matrix = np.block([[matrix, matrix], [matrix, -matrix]])
+    return matrix
+
+
+def _paley_one(q):
+    # q + 1 sized matrix from the quadratic character of GF(q), q = 3 mod 4
+    jacobsthal = _jacobsthal(q)
+    skew = np.zeros((q + 1, q + 1), dtype=np.int8)
+    skew[0, 1:] = 1
+    skew[1:, 0] = -1
+    skew[1:, 1:] = jacobsthal
+    return skew + np.eye(q + 1, dtype=np.int8)
+
+
+def _paley_two(q):
+    # 2(q + 1) sized matrix from the quadratic character of GF(q), q = 1 mod 4
+    conference = np.zeros((q + 1, q + 1), dtype=np.int8)
+    conference[0, 1:] = 1
+    conference[1:, 0] = 1
+    conference[1:, 1:] = _jacobsthal(q)
+    zero_block = np.array([[1, -1], [-1, -1]], dtype=np.int8)
+    sign_block = np.array([[1, 1], [1, -1]], dtype=np.int8)
+    return np.kron(conference, sign_block) + np.kron(conference == 0, zero_block).astype(np.int8)
+
+
+def _jacobsthal(q):
+    """
+    Returns the q by q matrix whose (a, b) entry is the quadratic character of a - b in GF(q).
+    """
+    p, m = _prime_power(q)
+    # Field elements are numbered by the base p digits of their polynomial coefficients
+    digits = (np.arange(q)[:, None] // p ** np.arange(m)) % p
+    difference = (digits[:, None, :] - digits[None, :, :]) % p
+    difference = (difference * p ** np.arange(m)).sum(axis=2)
+    character = -np.ones(q, dtype=np.int8)
+    character[0] = 0
+    character[[_field_square(x, p, m) for x in range(1, q)]] = 1
+    return character[difference]
+
+
+@functools.lru_cache(maxsize=None)
+def _field_modulus(p, m):
+    """
+    Returns the coefficients (lowest first, without the leading 1) of a monic irreducible polynomial
+    of degree m over the integers mod p, found by checking that every non-zero element is a unit.
+    """
+    if m == 1:
+        return (0,)
+    q = p ** m
+    for candidate in range(q):
+        modulus = tuple((candidate // p ** i) % p for i in range(m))
+        if modulus[0] == 0:
+            continue
+        if all(_field_power(x, q - 1, p, modulus) == 1 for x in range(1, q)):
+            return modulus
+    raise ValueError('No irreducible polynomial of degree {} mod {}'.format(m, p))
+
+
+def _field_multiply(a, b, p, modulus):
+    m = len(modulus)
+    a_coefficients = [(a // p ** i) % p for i in range(m)]
+    b_coefficients = [(b // p ** i) % p for i in range(m)]
+    product = [0] * (2 * m - 1)
+    for i in range(m):
+        for j in range(m):
+            product[i + j] += a_coefficients[i] * b_coefficients[j]
+    # x^m is replaced by -(modulus) working down from the highest power
+    for power in range(2 * m - 2, m - 1, -1):
+        carry = product[power] % p
+        product[power] = 0
+        for i in range(m):
+            product[power - m + i] -= carry * modulus[i]
+    return sum((product[i] % p) * p ** i for i in range(m))
+
+
+def _field_power(x, exponent, p, modulus):
+    result = 1
+    while exponent:
+        if exponent & 1:
+            result = _field_multiply(result, x, p, modulus)
+        x = _field_multiply(x, x, p, modulus)
+        exponent >>= 1
+    return result
+
+
+def _field_square(x, p, m):
+    return _field_multiply(x, x, p, _field_modulus(p, m))
+
+
+def _prime_power(q):
+    """
+    Returns (p, m) if q = p^m for a prime p, otherwise None.
+    """
+    if q < 2:
+        return None
+    p = 2
+    while p * p <= q and q % p:
+        p += 1
+    if q % p:
+        p = q
+    m = 0
+    while q % p == 0:
+        q //= p
+        m += 1
+    return (p, m) if q == 1 else None
+
+
+def _sequence(row):
+    return np.array([1 if symbol == '+' else -1 for symbol in row], dtype=np.int8)
+
+
+def _circulant(sequence):
+    n = len(sequence)
+    return sequence[(np.arange(n)[None, :] - np.arange(n)[:, None]) % n]
+
+
+def _goethals_seidel(a, b, c, d):
+    """
+    Returns the Hadamard matrix of order 4n made by placing the circulant matrices of four
+    length n sequences in the Goethals-Seidel array, which works whenever the periodic
+    autocorrelations of the sequences add up to zero at every non-zero shift.
+    """
+    a, b, c, d = [_circulant(np.asarray(x, dtype=np.int8)) for x in (a, b, c, d)]
+    # back_diagonal is the back-circulant identity R of the array
+    back_diagonal = np.eye(len(a), dtype=np.int8)[::-1]
+    br, cr, dr = b @ back_diagonal, c @ back_diagonal, d @ back_diagonal
+    return np.block([[a, br, cr, dr],
+                     [-br, a, d.T @ back_diagonal, -c.T @ back_diagonal],
+                     [-cr, -d.T @ back_diagonal, a, b.T @ back_diagonal],
+                     [-dr, c.T @ back_diagonal, -b.T @ back_diagonal, a]]).astype(np.int8)
+
+
+def _turyn_to_sequences(x, y, z, w):
+    """
+    Turns Turyn type sequences into four +-1 sequences of length 3n - 1 for the Goethals-Seidel array,
+    going through base sequences of lengths 2n - 1, 2n - 1, n, n and then T-sequences.
+    """
+    first, second = np.concatenate([z, w]), np.concatenate([z, -w])
+    long, short = len(first), len(x)
+    t = np.zeros((4, long + short), dtype=np.int8)
+    t[0, :long] = (first + second) // 2
+    t[1, :long] = (first - second) // 2
+    t[2, long:] = (x + y) // 2
+    t[3, long:] = (x - y) // 2
+    # The T-sequences never overlap, so combining them with the signs of a Hadamard matrix of
+    # order four gives +-1 sequences whose autocorrelations still add up to zero
+    return _sylvester(4) @ t
+
+
+def _normalise(matrix):
+    # Rows and then columns are negated so that the first column and first row are all +1
+    matrix = matrix * matrix[:, :1]
+    return (matrix * matrix[:1, :]).astype(np.int8)
+
+
+def _is_hadamard(matrix):
+    matrix = np.asarray(matrix, dtype=np.int64)
+    return bool((matrix @ matrix.T == len(matrix) * np.eye(len(matrix), dtype=np.int64)).all())
+
+
+def _download(order):
+    # The network code is only imported on the rare occasions a matrix is downloaded
+    import urllib.request
+    try:
+        file = urllib.request.urlopen(_SLOANE_URL.format(order), timeout=30)
+    except OSError:
+        return None
+    array = []
+    # This for loop takes the lines of the hadamard matrix and places them into the array variable
+    for line in file:
+        decoded_line = line.decode("utf-8").strip()
+        # Conditional breaks the for loop when the table has been read completely
+        if not decoded_line or decoded_line[0] not in '+-':
+            break
+        array.append([1 if symbol == '+' else -1 for symbol in decoded_line])
+    matrix = np.array(array, dtype=np.int8)
+    if matrix.shape != (order, order) or not _is_hadamard(matrix):
+        return None
+    return matrix
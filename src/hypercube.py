@@ -0,0 +1,178 @@
+# Latin hypercube sampling on [0, 1) used by design.latin_hypercube
+
+import concurrent.futures
+import numpy as np
+
+# The power used in the Morris-Mitchell criterion for maximin designs, high enough that the
+# closest pairs of runs dominate
+_MAXIMIN_POWER = 15
+
+
+def sample(runs, n_factors, method='random', seed=None, iterations=None, restarts=1, processes=None):
+    """
+    Returns a Latin hypercube of runs points in [0, 1)^n_factors, every factor having exactly one run
+    in each of the runs equal width strata.
+
+    Parameters:
+        runs: The number of runs (rows) in the hypercube.
+
+        n_factors: The number of factors (columns) in the hypercube.
+
+        method: 'random' places each run at a random point within its strata, 'centred' at the centre of
+        its strata. 'maximin' starts from a centred hypercube and swaps levels within columns to spread the
+        runs apart, and 'orthogonal' is built from an orthogonal array so that every pair of factors is also
+        balanced over a coarser grid, this needs runs to be the square of a prime and at most that prime
+        plus one factors.
+
+        seed: Seed for the random number generator, the same seed always gives the same hypercube.
+
+        iterations: The number of swaps tried by 'maximin'. If None it is up to 20000 for small designs and
+        ten swaps per run for large ones, each swap takes one pass over the design so large designs then
+        take a time that grows with the square of the runs. A smaller number gives a quicker but less
+        spread out design.
+
+        restarts: The number of independent 'maximin' searches, the most spread out result is kept.
+
+        processes: The number of processes to run the restarts over, None or 1 runs them in this process.
+
+    Returns:
+        array: A numpy array of shape (runs, n_factors).
+
+    Example:
+        >>> import hypercube
+        >>> hypercube.sample(4, 2, method='centred', seed=1)
+        array([[0.375, 0.875],
+               [0.625, 0.625],
+               [0.125, 0.375],
+               [0.875, 0.125]])
+    """
+    if runs < 1:
+        raise ValueError('A Latin hypercube needs at least one run')
+    if method == 'random':
+        rng = np.random.default_rng(seed)
+        return (_random_strata(rng, runs, n_factors) + rng.random((runs, n_factors))) / runs
+    if method == 'centred':
+        rng = np.random.default_rng(seed)
+        return (_random_strata(rng, runs, n_factors) + 0.5) / runs
+    if method == 'maximin':
+        if iterations is None:
+            # About 10^8 operations in total, each swap costs one pass over the design, but never fewer
+            # than ten swaps per run as fewer leave a large design little better than a random one
+            iterations = int(max(10 * runs, min(20000, max(100, 10 ** 8 // (runs * max(n_factors, 1))))))
+        seeds = np.random.SeedSequence(seed).spawn(restarts)
+        if restarts == 1:
+            return (_maximin(runs, n_factors, iterations, seeds[0])[1] + 0.5) / runs
+        if processes is not None and processes > 1:
+            with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+                results = list(executor.map(_maximin_restart, [runs] * restarts, [n_factors] * restarts,
+                                            [iterations] * restarts, seeds))
+        else:
+            results = [_maximin_restart(runs, n_factors, iterations, s) for s in seeds]
+        best = min(results, key=lambda result: result[0])
+        return (best[1] + 0.5) / runs
+    if method == 'orthogonal':
+        rng = np.random.default_rng(seed)
+        return (_orthogonal_strata(rng, runs, n_factors) + rng.random((runs, n_factors))) / runs
+    raise ValueError("method must be one of 'random', 'centred', 'maximin' or 'orthogonal', not {}".format(method))
+
+
+def _random_strata(rng, runs, n_factors):
+    # Each column is an independent random permutation of the strata 0 to runs - 1
+    return np.argsort(rng.random((runs, n_factors)), axis=0).astype(np.int64)
+
+
+def _maximin_restart(runs, n_factors, iterations, seed_sequence):
+    # The result of a restart is compared on its full Morris-Mitchell criterion
+    strata = _maximin(runs, n_factors, iterations, seed_sequence)[1]
+    return _inverse_distance_sum(strata), strata
+
+
+def _maximin(runs, n_factors, iterations, seed_sequence):
+    """
+    Simulated annealing on the Morris-Mitchell criterion, the sum over pairs of runs of
+    distance^-_MAXIMIN_POWER. A swap of two levels within a column only changes the distances
+    from the two runs swapped, so each swap is scored in one pass over the design rather than
+    recomputing every pairwise distance.
+
+    Returns:
+        change: How much the criterion went down.
+
+        strata: The integer strata of the hypercube found.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    strata = _random_strata(rng, runs, n_factors)
+    if runs < 3 or n_factors == 0:
+        return 0.0, strata
+    exponent = -_MAXIMIN_POWER / 2
+    rows = rng.integers(0, runs, size=(iterations, 2))
+    columns = rng.integers(0, n_factors, size=iterations)
+    uniforms = rng.random(iterations)
+    temperature = None
+    total_change = 0.0
+    for t in range(iterations):
+        i, j = rows[t]
+        if i == j:
+            continue
+        c = columns[t]
+        # Squared distances from runs i and j to every run, before and after swapping column c
+        square_i = ((strata - strata[i]) ** 2).sum(axis=1).astype(float)
+        square_j = ((strata - strata[j]) ** 2).sum(axis=1).astype(float)
+        column = strata[:, c]
+        new_square_i = square_i - (column - strata[i, c]) ** 2 + (column - strata[j, c]) ** 2
+        new_square_j = square_j - (column - strata[j, c]) ** 2 + (column - strata[i, c]) ** 2
+        others = np.ones(runs, dtype=bool)
+        others[[i, j]] = False
+        change = (new_square_i[others] ** exponent + new_square_j[others] ** exponent
+                  - square_i[others] ** exponent - square_j[others] ** exponent).sum()
+        if temperature is None:
+            # The starting temperature accepts a typical worsening about half the time
+            temperature = max(abs(change), 1e-300) / np.log(2)
+            cooling = (1e-3) ** (1 / iterations)
+        if change < 0 or uniforms[t] < np.exp(-change / temperature):
+            strata[[i, j], c] = strata[[j, i], c]
+            total_change -= change
+        temperature *= cooling
+    return total_change, strata
+
+
+def _inverse_distance_sum(strata, block_size=2048):
+    # The Morris-Mitchell sum over all pairs, in blocks of rows to bound the memory used
+    points = strata.astype(float)
+    norms = (points ** 2).sum(axis=1)
+    total = 0.0
+    for start in range(0, len(points), block_size):
+        block = points[start:start + block_size]
+        squares = norms[start:start + block_size, None] + norms[None, :] - 2 * block @ points.T
+        # Only pairs with the second run later than the first are counted
+        later = np.arange(len(points))[None, :] > np.arange(start, start + len(block))[:, None]
+        total += (np.maximum(squares[later], 1) ** (-_MAXIMIN_POWER / 2)).sum()
+    return total
+
+
+def _orthogonal_strata(rng, runs, n_factors):
+    """
+    Returns the strata of an orthogonal array based Latin hypercube (Tang, 1993). A strength two
+    orthogonal array with s levels is made by the Bose construction, then each of the s runs at a
+    level of a column is given a different one of the s strata within that level at random.
+    """
+    s = int(round(runs ** 0.5))
+    if s * s != runs or not _is_prime(s):
+        raise ValueError('Orthogonal Latin hypercubes need runs to be the square of a prime, not {}'.format(runs))
+    if n_factors > s + 1:
+        raise ValueError('Orthogonal Latin hypercubes with {} runs can have at most {} factors'.format(runs, s + 1))
+    a, b = np.divmod(np.arange(runs), s)
+    array = np.empty((runs, s + 1), dtype=np.int64)
+    array[:, 0] = a
+    array[:, 1:] = (a[:, None] * np.arange(s)[None, :] + b[:, None]) % s
+    array = array[:, rng.permutation(s + 1)[:n_factors]]
+    # Sorting by level (randomly within a level) then numbering within each level gives each run at
+    # that level a different sub-stratum
+    strata = np.empty_like(array)
+    for c in range(n_factors):
+        order = np.lexsort((rng.random(runs), array[:, c]))
+        strata[order, c] = array[order, c] * s + np.tile(np.arange(s), s)
+    return strata
+
+
+def _is_prime(n):
+    return n > 1 and all(n % d for d in range(2, int(n ** 0.5) + 1))
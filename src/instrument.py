@@ -0,0 +1,271 @@
+# Opt-in timing and memory records of the stages of each call into design and analysis
+
+import functools
+import json
+import logging
+import threading
+import time
+import tracemalloc
+
+# Recordings currently open (each only takes calls from the thread that opened it) and callbacks
+# registered, nothing is measured while both are empty
+_recordings = []
+_callbacks = []
+_state = {'enabled': False}
+# Each thread keeps the stack of calls it is inside, so nested calls become children of their caller
+_local = threading.local()
+# The stages open while memory is traced, tracemalloc has only one peak so each keeps its own maximum
+_traced_stages = []
+_logger = logging.getLogger(__name__)
+
+
+class Recording:
+    """
+    The calls recorded by record(). Each call is a dictionary with its name, start time, duration in
+    seconds, details (such as rows and columns), the stages it went through and the calls made inside it.
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.calls = []
+        # The thread that opened the recording, set by record()
+        self.thread = None
+
+    def to_dict(self):
+        return {'calls': self.calls}
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), default=_to_builtin, **kwargs)
+
+    def summary(self):
+        """
+        Returns a dictionary of the total seconds spent in each (call, stage) over every recorded call.
+        """
+        totals = {}
+        for call in self.calls:
+            _add_totals(call, totals)
+        return totals
+
+
+def record(trace_memory=False):
+    """
+    Returns a context manager that records every call into design and analysis made inside it, by the
+    thread that opened it. Calls made by other threads at the same time are not recorded, callbacks
+    registered with add_callback get the calls of every thread.
+
+    Parameters:
+        trace_memory: If True the peak memory allocated in each stage is recorded too, using tracemalloc,
+        which slows the calls down noticeably.
+
+    Returns:
+        recording: A Recording, whose calls are filled in as they finish.
+
+    Example:
+        >>> import instrument
+        >>> import design
+        >>> with instrument.record() as recording:
+        ...     df = design.frac_fact_2level({'A':[0,1],'B':[0,1],'C':[0,1],'D':[0,1]}, 8)
+        >>> [stage['name'] for stage in recording.calls[0]['stages']]
+        ['structure', 'dataframe']
+    """
+    return _RecordContext(Recording(trace_memory))
+
+
+class _RecordContext:
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.started_tracing = False
+
+    def __enter__(self):
+        if self.recording.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        self.recording.thread = threading.get_ident()
+        _recordings.append(self.recording)
+        _update_enabled()
+        return self.recording
+
+    def __exit__(self, *exc):
+        _recordings.remove(self.recording)
+        _update_enabled()
+        if self.started_tracing:
+            tracemalloc.stop()
+        return False
+
+
+def add_callback(callback):
+    """
+    Registers a function that is called with the dictionary of every finished top level call,
+    for sending the records on to a metrics system. Memory is not traced for callbacks. An error
+    raised by a callback is logged rather than passed on to the caller of the recorded call.
+    """
+    _callbacks.append(callback)
+    _update_enabled()
+
+
+def remove_callback(callback):
+    _callbacks.remove(callback)
+    _update_enabled()
+
+
+def enabled():
+    """
+    Returns True if anything is recording, for skipping work that is only needed for the records.
+    """
+    return _state['enabled']
+
+
+def _update_enabled():
+    _state['enabled'] = bool(_recordings or _callbacks)
+
+
+def instrumented(function):
+    """
+    Decorator that records each call of function when recording is on, when it is off the only cost
+    is checking a flag.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _state['enabled']:
+            return function(*args, **kwargs)
+        with _Call(function.__name__):
+            return function(*args, **kwargs)
+    return wrapper
+
+
+class _Null:
+    # Returned by stage() when nothing is recording so the with statement costs next to nothing
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _Null()
+
+
+def stage(name):
+    """
+    Returns a context manager timing one stage of the current call, such as 'hadamard' or 'dataframe'.
+    """
+    if not _state['enabled'] or not getattr(_local, 'stack', None):
+        return _NULL
+    return _Stage(name)
+
+
+def note(**details):
+    """
+    Adds details such as rows=, columns= or nbytes= to the current stage, or to the current call
+    if no stage is open. Does nothing when nothing is recording.
+    """
+    if not _state['enabled'] or not getattr(_local, 'stack', None):
+        return
+    call = _local.stack[-1]
+    target = call['_open_stage'] if call.get('_open_stage') is not None else call
+    target['details'].update(details)
+
+
+def _tracing():
+    thread = threading.get_ident()
+    return tracemalloc.is_tracing() and any(recording.trace_memory and recording.thread == thread
+                                            for recording in _recordings)
+
+
+class _Call:
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        if not hasattr(_local, 'stack'):
+            _local.stack = []
+        self.record = {'name': self.name, 'start': time.time(), 'duration': None, 'details': {},
+                       'stages': [], 'calls': [], '_open_stage': None}
+        _local.stack.append(self.record)
+        self.started = time.perf_counter()
+        return self.record
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.record['duration'] = time.perf_counter() - self.started
+        if exc_type is not None:
+            self.record['details']['error'] = exc_type.__name__
+        del self.record['_open_stage']
+        _local.stack.pop()
+        if _local.stack:
+            _local.stack[-1]['calls'].append(self.record)
+        else:
+            thread = threading.get_ident()
+            for recording in list(_recordings):
+                if recording.thread == thread:
+                    recording.calls.append(self.record)
+            for callback in list(_callbacks):
+                try:
+                    callback(self.record)
+                except Exception:
+                    _logger.exception('Instrument callback %r failed on the record of %s', callback, self.name)
+        return False
+
+
+class _Stage:
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.call = _local.stack[-1]
+        self.parent = self.call['_open_stage']
+        self.record = {'name': self.name, 'duration': None, 'details': {}}
+        self.call['_open_stage'] = self.record
+        self.tracing = _tracing()
+        if self.tracing:
+            self.memory_before = tracemalloc.get_traced_memory()[0]
+            # The peak so far is kept by the stages already open before it is reset for this one
+            if hasattr(tracemalloc, 'reset_peak'):
+                _update_peaks()
+                tracemalloc.reset_peak()
+            self.peak = self.memory_before
+            _traced_stages.append(self)
+        self.started = time.perf_counter()
+        return self.record
+
+    def __exit__(self, *exc):
+        self.record['duration'] = time.perf_counter() - self.started
+        if self.tracing:
+            _update_peaks()
+            _traced_stages.remove(self)
+            current = tracemalloc.get_traced_memory()[0]
+            self.record['details']['peak_memory'] = self.peak - self.memory_before
+            self.record['details']['memory_change'] = current - self.memory_before
+        # Stages inside stages are kept inside their parent
+        if self.parent is None:
+            self.call['stages'].append(self.record)
+        else:
+            self.parent.setdefault('stages', []).append(self.record)
+        self.call['_open_stage'] = self.parent
+        return False
+
+
+def _update_peaks():
+    # Every open stage's maximum takes in the peak since tracemalloc's peak was last reset
+    peak = tracemalloc.get_traced_memory()[1]
+    for open_stage in _traced_stages:
+        open_stage.peak = max(open_stage.peak, peak)
+
+
+def _add_totals(call, totals):
+    totals[call['name']] = totals.get(call['name'], 0) + call['duration']
+    for stage_record in call['stages']:
+        key = call['name'] + '.' + stage_record['name']
+        totals[key] = totals.get(key, 0) + stage_record['duration']
+    for child in call['calls']:
+        _add_totals(child, totals)
+
+
+def _to_builtin(value):
+    # numpy numbers in the details are written as plain numbers
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError('{} cannot be written as JSON'.format(type(value).__name__))
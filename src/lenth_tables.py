@@ -0,0 +1,901 @@
+# Reference distributions of Lenth t-ratios that come with the package, see analysis.lenth_reference.
+# Each table was simulated with analysis._simulate_lenth_reference(n_contrasts, n_simulations,
+# seed=n_contrasts), n_simulations being 10 ** 6 up to 200 contrasts and 2 * 10 ** 8 // n_contrasts
+# past that as in lenth_reference, and holds the individual and simultaneous quantiles at each of the
+# probabilities below.
+
+PROBABILITIES = [
+    0, 0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.1, 0.11, 0.12, 0.13, 0.14, 0.15,
+    0.16, 0.17, 0.18, 0.19, 0.2, 0.21, 0.22, 0.23, 0.24, 0.25, 0.26, 0.27, 0.28, 0.29, 0.3, 0.31,
+    0.32, 0.33, 0.34, 0.35, 0.36, 0.37, 0.38, 0.39, 0.4, 0.41, 0.42, 0.43, 0.44, 0.45, 0.46, 0.47,
+    0.48, 0.49, 0.5, 0.51, 0.52, 0.53, 0.54, 0.55, 0.56, 0.57, 0.58, 0.59, 0.6, 0.61, 0.62, 0.63,
+    0.64, 0.65, 0.66, 0.67, 0.68, 0.69, 0.7, 0.71, 0.72, 0.73, 0.74, 0.75, 0.76, 0.77, 0.78, 0.79,
+    0.8, 0.81, 0.82, 0.83, 0.84, 0.85, 0.86, 0.87, 0.88, 0.89, 0.9, 0.901, 0.902, 0.903, 0.904,
+    0.905, 0.906, 0.907, 0.908, 0.909, 0.91, 0.911, 0.912, 0.913, 0.914, 0.915, 0.916, 0.917,
+    0.918, 0.919, 0.92, 0.921, 0.922, 0.923, 0.924, 0.925, 0.926, 0.927, 0.928, 0.929, 0.93, 0.931,
+    0.932, 0.933, 0.934, 0.935, 0.936, 0.937, 0.938, 0.939, 0.94, 0.941, 0.942, 0.943, 0.944,
+    0.945, 0.946, 0.947, 0.948, 0.949, 0.95, 0.951, 0.952, 0.953, 0.954, 0.955, 0.956, 0.957,
+    0.958, 0.959, 0.96, 0.961, 0.962, 0.963, 0.964, 0.965, 0.966, 0.967, 0.968, 0.969, 0.97, 0.971,
+    0.972, 0.973, 0.974, 0.975, 0.976, 0.977, 0.978, 0.979, 0.98, 0.981, 0.982, 0.983, 0.984,
+    0.985, 0.986, 0.987, 0.988, 0.989, 0.99, 0.9901, 0.9902, 0.9903, 0.9904, 0.9905, 0.9906,
+    0.9907, 0.9908, 0.9909, 0.991, 0.9911, 0.9912, 0.9913, 0.9914, 0.9915, 0.9916, 0.9917, 0.9918,
+    0.9919, 0.992, 0.9921, 0.9922, 0.9923, 0.9924, 0.9925, 0.9926, 0.9927, 0.9928, 0.9929, 0.993,
+    0.9931, 0.9932, 0.9933, 0.9934, 0.9935, 0.9936, 0.9937, 0.9938, 0.9939, 0.994, 0.9941, 0.9942,
+    0.9943, 0.9944, 0.9945, 0.9946, 0.9947, 0.9948, 0.9949, 0.995, 0.9951, 0.9952, 0.9953, 0.9954,
+    0.9955, 0.9956, 0.9957, 0.9958, 0.9959, 0.996, 0.9961, 0.9962, 0.9963, 0.9964, 0.9965, 0.9966,
+    0.9967, 0.9968, 0.9969, 0.997, 0.9971, 0.9972, 0.9973, 0.9974, 0.9975, 0.9976, 0.9977, 0.9978,
+    0.9979, 0.998, 0.9981, 0.9982, 0.9983, 0.9984, 0.9985, 0.9986, 0.9987, 0.9988, 0.9989, 0.999,
+    0.99905, 0.9991, 0.99915, 0.9992, 0.99925, 0.9993, 0.99935, 0.9994, 0.99945, 0.9995, 0.99955,
+    0.9996, 0.99965, 0.9997, 0.99975, 0.9998, 0.99985, 0.9999]
+
+TABLES = {
+    7: ([0, 0.01492, 0.02967, 0.04402, 0.0587, 0.07332, 0.08809, 0.10294, 0.1179, 0.13284, 0.14782,
+         0.16278, 0.17808, 0.19343, 0.2087, 0.22383, 0.23908, 0.25442, 0.27007, 0.28552, 0.30092,
+         0.31659, 0.33223, 0.34791, 0.36384, 0.37978, 0.39566, 0.41179, 0.42816, 0.44472, 0.46166,
+         0.4786, 0.4955, 0.51244, 0.5292, 0.54627, 0.56365, 0.58048, 0.59761, 0.61414, 0.63093,
+         0.64763, 0.66414, 0.66667, 0.66667, 0.66667, 0.66667, 0.66667, 0.66667, 0.66667, 0.66667,
+         0.66667, 0.66667, 0.66667, 0.66667, 0.67454, 0.68787, 0.70174, 0.71614, 0.7306, 0.74588,
+         0.76137, 0.77736, 0.79402, 0.81135, 0.82962, 0.84806, 0.86707, 0.88706, 0.90751, 0.92881,
+         0.95127, 0.97474, 0.99923, 1.02522, 1.05122, 1.07845, 1.10752, 1.13793, 1.1703, 1.20416,
+         1.23988, 1.27762, 1.31868, 1.3617, 1.40792, 1.45892, 1.5135, 1.57302, 1.63831, 1.70994,
+         1.71809, 1.72618, 1.7342, 1.74274, 1.75062, 1.75914, 1.76718, 1.77602, 1.78483, 1.79311,
+         1.80231, 1.81104, 1.82007, 1.82927, 1.83854, 1.84795, 1.8575, 1.86723, 1.87765, 1.88799,
+         1.89809, 1.90886, 1.91963, 1.93103, 1.94223, 1.9532, 1.96417, 1.97509, 1.98726, 1.99893,
+         2.01144, 2.02333, 2.03549, 2.0483, 2.06183, 2.0752, 2.08895, 2.10281, 2.11717, 2.13076,
+         2.14541, 2.16037, 2.17592, 2.19208, 2.20824, 2.22519, 2.2419, 2.25852, 2.27789, 2.29542,
+         2.31348, 2.3333, 2.35193, 2.37236, 2.39445, 2.41672, 2.439, 2.46152, 2.48578, 2.53078,
+         2.59668, 2.65609, 2.7129, 2.76937, 2.82294, 2.87486, 2.92642, 2.98048, 3.03095, 3.08533,
+         3.14163, 3.19826, 3.25717, 3.3207, 3.38355, 3.45014, 3.52068, 3.59441, 3.67044, 3.75066,
+         3.83799, 3.93369, 4.03366, 4.14317, 4.26351, 4.39746, 4.54397, 4.71606, 4.9001, 5.10136,
+         5.12325, 5.14104, 5.16151, 5.18361, 5.2086, 5.23202, 5.25435, 5.28246, 5.3028, 5.32873,
+         5.35631, 5.37838, 5.40624, 5.43094, 5.45811, 5.48653, 5.51514, 5.5421, 5.57247, 5.59946,
+         5.63411, 5.66556, 5.69561, 5.73033, 5.76618, 5.79475, 5.82649, 5.85865, 5.90084, 5.94069,
+         5.97742, 6.01974, 6.05213, 6.09318, 6.1302, 6.17407, 6.21318, 6.2552, 6.30419, 6.34448,
+         6.39006, 6.43766, 6.48976, 6.53452, 6.58128, 6.62893, 6.67755, 6.73781, 6.80083, 6.86386,
+         6.92313, 6.97556, 7.0495, 7.10987, 7.18409, 7.26585, 7.34813, 7.41884, 7.49882, 7.57299,
+         7.65142, 7.74598, 7.83318, 7.91927, 8.02003, 8.12358, 8.22042, 8.34889, 8.46426, 8.58516,
+         8.69603, 8.82769, 8.95839, 9.09262, 9.24182, 9.40685, 9.61267, 9.79951, 9.98231, 10.2213,
+         10.4059, 10.6596, 10.9206, 11.1494, 11.4802, 11.7892, 12.1463, 12.5445, 12.9511, 13.3898,
+         13.7452, 14.0255, 14.3381, 14.7195, 15.0889, 15.5266, 15.9352, 16.4623, 16.9256, 17.3988,
+         17.9751, 18.716, 19.4742, 20.5352, 22.2496, 23.9091, 26.2189, 29.4327],
+        [0.67337, 0.79491, 0.83524, 0.86575, 0.89168, 0.9146, 0.93529, 0.95492, 0.9736, 0.9912,
+         1.00839, 1.02479, 1.04078, 1.05628, 1.07135, 1.08644, 1.10102, 1.11564, 1.13003, 1.14452,
+         1.15888, 1.17306, 1.18709, 1.2011, 1.21532, 1.22944, 1.24332, 1.25703, 1.271, 1.28507,
+         1.29919, 1.31345, 1.32785, 1.34214, 1.35683, 1.37122, 1.38589, 1.40077, 1.41563, 1.43073,
+         1.44604, 1.46166, 1.47717, 1.49284, 1.50868, 1.5249, 1.54136, 1.5579, 1.57478, 1.59202,
+         1.60938, 1.62728, 1.64539, 1.66393, 1.68309, 1.70218, 1.72211, 1.74267, 1.76324, 1.78417,
+         1.80587, 1.82814, 1.85051, 1.87345, 1.89702, 1.92162, 1.94674, 1.97316, 1.99975, 2.02796,
+         2.0569, 2.08683, 2.11742, 2.14896, 2.18323, 2.21837, 2.2541, 2.29233, 2.33357, 2.37562,
+         2.42009, 2.46721, 2.64055, 2.80417, 2.93037, 3.04656, 3.1624, 3.27944, 3.40462, 3.53945,
+         3.68337, 3.69935, 3.7152, 3.73087, 3.74754, 3.7639, 3.78039, 3.79774, 3.8145, 3.83089,
+         3.84816, 3.86592, 3.88282, 3.9013, 3.91919, 3.93734, 3.95659, 3.97589, 3.99486, 4.01465,
+         4.03428, 4.05441, 4.07541, 4.09517, 4.11698, 4.13932, 4.16223, 4.18514, 4.20848, 4.23216,
+         4.25539, 4.28038, 4.30634, 4.33316, 4.35881, 4.3854, 4.41244, 4.441, 4.46772, 4.49668,
+         4.52547, 4.55863, 4.59275, 4.62487, 4.65828, 4.69404, 4.72893, 4.76559, 4.80429, 4.84099,
+         4.87812, 4.91865, 4.9605, 5.00373, 5.04898, 5.0937, 5.13945, 5.18826, 5.24171, 5.2928,
+         5.34403, 5.40115, 5.45837, 5.51723, 5.5776, 5.64231, 5.71164, 5.78305, 5.8542, 5.93561,
+         6.01459, 6.10148, 6.19177, 6.28794, 6.38765, 6.49356, 6.60936, 6.7288, 6.86569, 7.00307,
+         7.15317, 7.31066, 7.48235, 7.67423, 7.88814, 8.11572, 8.37531, 8.64798, 8.96324, 9.30035,
+         9.68247, 9.72421, 9.76877, 9.81073, 9.86119, 9.9087, 9.94801, 9.99814, 10.0496, 10.1107,
+         10.161, 10.2013, 10.2429, 10.2888, 10.3378, 10.3959, 10.454, 10.505, 10.564, 10.6235,
+         10.6873, 10.7349, 10.7934, 10.849, 10.9055, 10.9605, 11.0265, 11.0785, 11.1532, 11.2112,
+         11.2897, 11.363, 11.4342, 11.5053, 11.5778, 11.6496, 11.7225, 11.8031, 11.878, 11.9472,
+         12.0297, 12.1107, 12.1859, 12.2566, 12.3472, 12.4356, 12.5366, 12.6362, 12.7318, 12.8306,
+         12.9159, 13.0114, 13.1085, 13.2319, 13.335, 13.4547, 13.6013, 13.7296, 13.85, 14.0089,
+         14.1271, 14.2823, 14.4115, 14.5768, 14.7321, 14.8994, 15.0889, 15.3038, 15.4799, 15.6623,
+         15.8467, 16.0591, 16.3419, 16.6017, 16.8311, 17.1301, 17.4199, 17.6734, 17.9844, 18.3125,
+         18.6532, 19.0218, 19.3577, 19.7503, 20.2703, 20.8352, 21.4084, 22.0906, 22.8001, 23.5648,
+         24.4948, 24.9772, 25.2697, 25.7855, 26.445, 27.1608, 27.9529, 28.7434, 29.4006, 30.0337,
+         31.0211, 32.0934, 33.4121, 35.1876, 37.3039, 39.0823, 42.624, 45.644, 50.7957]),
+    11: ([0, 0.01381, 0.02778, 0.04162, 0.0556, 0.06954, 0.08323, 0.09696, 0.11078, 0.1249, 0.13894,
+         0.15316, 0.16728, 0.18127, 0.19558, 0.20993, 0.22423, 0.23855, 0.25318, 0.26773, 0.2823,
+         0.29692, 0.31163, 0.32619, 0.34109, 0.35572, 0.37084, 0.38594, 0.4013, 0.41669, 0.43226,
+         0.44766, 0.463, 0.47872, 0.49457, 0.51033, 0.52624, 0.54226, 0.55838, 0.57452, 0.59061,
+         0.60644, 0.62234, 0.63821, 0.65371, 0.66667, 0.66667, 0.66667, 0.66667, 0.66667, 0.66667,
+         0.66667, 0.66667, 0.67415, 0.68698, 0.70025, 0.71418, 0.72893, 0.74379, 0.75915, 0.77532,
+         0.79197, 0.80906, 0.82679, 0.84526, 0.8641, 0.88365, 0.90375, 0.92441, 0.94539, 0.96729,
+         0.99003, 1.01362, 1.03799, 1.06336, 1.08921, 1.11616, 1.14434, 1.17453, 1.20604, 1.23822,
+         1.27252, 1.30879, 1.34706, 1.38748, 1.43081, 1.4771, 1.52747, 1.58163, 1.64153, 1.70793,
+         1.7149, 1.72204, 1.72895, 1.73581, 1.74286, 1.75023, 1.75774, 1.76548, 1.77322, 1.7814,
+         1.78954, 1.79778, 1.80586, 1.81414, 1.82238, 1.8309, 1.83905, 1.8475, 1.85633, 1.86505,
+         1.87451, 1.88287, 1.89228, 1.90126, 1.9108, 1.92031, 1.93022, 1.94024, 1.95022, 1.96053,
+         1.9714, 1.98189, 1.99247, 2.0033, 2.01389, 2.02451, 2.03629, 2.04819, 2.06031, 2.07162,
+         2.08408, 2.09657, 2.10972, 2.12335, 2.13792, 2.15171, 2.16547, 2.17985, 2.19472, 2.20995,
+         2.22511, 2.24075, 2.25646, 2.27343, 2.28964, 2.30764, 2.32423, 2.34319, 2.36239, 2.38114,
+         2.40192, 2.42231, 2.44472, 2.46571, 2.48817, 2.52976, 2.58415, 2.63072, 2.67537, 2.7207,
+         2.76737, 2.81202, 2.85673, 2.90275, 2.9476, 2.99903, 3.046, 3.09764, 3.1533, 3.20897,
+         3.27059, 3.33588, 3.40206, 3.47675, 3.55485, 3.639, 3.72554, 3.82246, 3.93511, 4.06042,
+         4.07359, 4.08852, 4.10272, 4.11635, 4.13075, 4.14664, 4.16289, 4.1768, 4.18955, 4.20383,
+         4.2178, 4.2371, 4.25232, 4.26763, 4.28537, 4.3031, 4.32101, 4.33674, 4.35489, 4.37276,
+         4.39374, 4.41186, 4.4299, 4.44509, 4.46232, 4.48458, 4.50381, 4.52557, 4.54861, 4.57386,
+         4.59674, 4.61622, 4.63962, 4.66355, 4.68412, 4.70565, 4.72856, 4.75222, 4.77951, 4.80479,
+         4.83153, 4.86231, 4.89281, 4.92395, 4.95255, 4.97878, 5.01036, 5.04337, 5.07558, 5.11189,
+         5.14601, 5.17678, 5.21501, 5.25065, 5.28856, 5.32996, 5.37138, 5.41163, 5.45371, 5.50271,
+         5.54891, 5.59985, 5.6394, 5.68333, 5.73364, 5.78851, 5.84206, 5.89623, 5.94625, 6.01656,
+         6.07701, 6.14187, 6.21205, 6.29476, 6.36935, 6.44024, 6.52772, 6.61238, 6.70278, 6.8028,
+         6.92259, 7.05993, 7.18386, 7.30725, 7.43565, 7.5978, 7.78893, 7.95731, 8.14369, 8.36208,
+         8.52627, 8.66498, 8.79475, 8.94663, 9.14222, 9.36492, 9.55408, 9.75726, 10.0155, 10.3581,
+         10.6512, 11.0313, 11.384, 11.8695, 12.5248, 13.3605, 14.5064, 16.1521],
+        [0.68489, 0.92794, 0.98336, 1.02364, 1.0561, 1.08415, 1.10999, 1.13341, 1.1554, 1.1761,
+         1.19581, 1.21511, 1.23331, 1.25097, 1.26843, 1.28523, 1.3016, 1.31779, 1.33378, 1.34912,
+         1.36448, 1.37996, 1.39528, 1.41036, 1.42552, 1.44015, 1.45488, 1.46977, 1.48492, 1.49972,
+         1.51463, 1.52954, 1.54425, 1.55909, 1.57408, 1.58903, 1.60418, 1.61905, 1.63434, 1.64957,
+         1.66516, 1.68068, 1.69612, 1.71173, 1.72787, 1.74395, 1.76021, 1.77669, 1.79353, 1.81046,
+         1.82764, 1.84488, 1.86246, 1.88031, 1.89845, 1.91683, 1.93558, 1.95468, 1.9739, 1.99397,
+         2.01458, 2.03514, 2.05628, 2.07779, 2.1002, 2.12299, 2.14628, 2.17052, 2.19493, 2.22029,
+         2.24654, 2.27404, 2.30179, 2.3315, 2.36165, 2.39282, 2.42494, 2.4595, 2.49501, 2.65122,
+         2.73912, 2.8155, 2.88796, 2.95885, 3.03104, 3.10592, 3.18341, 3.26699, 3.35604, 3.45514,
+         3.56409, 3.57585, 3.58745, 3.59911, 3.61112, 3.62308, 3.63572, 3.6476, 3.66079, 3.67308,
+         3.68602, 3.69887, 3.71086, 3.72359, 3.73776, 3.752, 3.76614, 3.77967, 3.79541, 3.80982,
+         3.82452, 3.83993, 3.85643, 3.87193, 3.88783, 3.90453, 3.92265, 3.93939, 3.95591, 3.9736,
+         3.99202, 4.01007, 4.03025, 4.04962, 4.06904, 4.08922, 4.1114, 4.13291, 4.15313, 4.17383,
+         4.19522, 4.21779, 4.24051, 4.26367, 4.28714, 4.3125, 4.33879, 4.36357, 4.39107, 4.419,
+         4.44912, 4.47701, 4.50515, 4.53613, 4.56774, 4.59946, 4.63338, 4.66803, 4.70451, 4.74265,
+         4.78099, 4.81805, 4.85886, 4.90256, 4.94316, 4.98833, 5.03501, 5.08495, 5.13476, 5.18703,
+         5.24252, 5.30125, 5.36235, 5.42588, 5.49619, 5.56862, 5.64303, 5.72102, 5.80204, 5.89029,
+         5.98148, 6.08475, 6.19101, 6.30601, 6.42558, 6.55118, 6.6922, 6.85131, 7.01924, 7.21828,
+         7.44139, 7.47015, 7.49476, 7.51761, 7.54213, 7.56818, 7.59423, 7.62327, 7.64956, 7.66998,
+         7.69365, 7.72048, 7.74609, 7.76704, 7.79612, 7.8222, 7.85021, 7.87923, 7.91078, 7.94214,
+         7.96942, 8.00279, 8.03299, 8.06357, 8.09332, 8.12456, 8.1617, 8.18831, 8.21805, 8.24895,
+         8.27973, 8.31554, 8.35534, 8.38623, 8.42286, 8.46031, 8.50374, 8.54142, 8.57727, 8.62397,
+         8.67638, 8.72034, 8.77049, 8.81218, 8.86053, 8.89787, 8.94241, 8.99535, 9.04044, 9.08707,
+         9.14698, 9.21171, 9.27763, 9.3358, 9.39754, 9.45829, 9.52487, 9.58919, 9.65216, 9.70819,
+         9.7777, 9.85552, 9.92401, 9.99528, 10.0924, 10.1851, 10.2816, 10.3672, 10.4534, 10.5515,
+         10.6511, 10.7557, 10.8946, 11.0129, 11.1198, 11.231, 11.3763, 11.5037, 11.6675, 11.8718,
+         12.0648, 12.2204, 12.4499, 12.6955, 12.9147, 13.1299, 13.3684, 13.6789, 13.9937, 14.3363,
+         14.7137, 15.023, 15.2361, 15.5466, 15.8217, 16.1348, 16.456, 16.8053, 17.216, 17.6029,
+         18.1241, 18.8451, 19.4586, 20.3445, 21.2236, 22.5364, 24.0686, 26.3002, 28.7988]),
+    15: ([0, 0.01316, 0.02685, 0.04053, 0.0543, 0.06794, 0.08139, 0.09507, 0.1088, 0.12219, 0.13602,
+         0.14961, 0.16334, 0.17708, 0.19092, 0.20499, 0.21892, 0.23301, 0.24678, 0.26077, 0.27478,
+         0.28912, 0.30325, 0.31746, 0.33162, 0.34607, 0.36104, 0.37554, 0.39032, 0.40494, 0.41985,
+         0.43469, 0.44967, 0.46478, 0.48012, 0.49547, 0.51086, 0.52651, 0.54253, 0.55842, 0.57397,
+         0.58989, 0.6054, 0.62076, 0.63611, 0.65105, 0.66551, 0.66667, 0.66667, 0.66667, 0.66667,
+         0.66667, 0.67261, 0.68546, 0.69904, 0.71294, 0.72749, 0.74244, 0.75786, 0.77403, 0.79083,
+         0.80825, 0.82607, 0.8444, 0.86306, 0.88248, 0.9022, 0.92239, 0.94341, 0.96449, 0.98657,
+         1.00941, 1.03275, 1.0569, 1.08171, 1.10752, 1.13426, 1.16206, 1.19095, 1.22141, 1.25257,
+         1.28593, 1.32144, 1.35874, 1.39696, 1.43847, 1.48277, 1.5295, 1.58061, 1.63769, 1.69904,
+         1.70562, 1.71224, 1.7184, 1.72471, 1.73124, 1.73793, 1.74489, 1.75182, 1.7586, 1.76572,
+         1.7733, 1.78024, 1.78759, 1.79519, 1.80308, 1.81079, 1.81857, 1.82605, 1.83364, 1.84221,
+         1.85036, 1.85851, 1.86718, 1.8762, 1.88496, 1.89394, 1.90308, 1.91211, 1.92195, 1.93114,
+         1.94089, 1.95046, 1.9602, 1.97003, 1.97964, 1.98926, 1.99985, 2.01083, 2.02168, 2.03287,
+         2.0442, 2.05564, 2.06744, 2.07972, 2.09169, 2.10391, 2.11638, 2.12941, 2.14221, 2.15516,
+         2.16934, 2.18411, 2.19757, 2.21198, 2.22672, 2.24191, 2.25643, 2.27274, 2.29008, 2.30603,
+         2.32336, 2.34104, 2.35941, 2.37799, 2.39728, 2.41696, 2.43731, 2.45854, 2.48111, 2.50711,
+         2.5512, 2.59704, 2.63958, 2.68292, 2.72612, 2.76924, 2.812, 2.85768, 2.90323, 2.9481,
+         2.99677, 3.05011, 3.10455, 3.16263, 3.22461, 3.29024, 3.36561, 3.4425, 3.52752, 3.62219,
+         3.63114, 3.64194, 3.65407, 3.66424, 3.67393, 3.68656, 3.69864, 3.71088, 3.72131, 3.73404,
+         3.74702, 3.75964, 3.77117, 3.78363, 3.79259, 3.80448, 3.81468, 3.82608, 3.83859, 3.85101,
+         3.8643, 3.87781, 3.89179, 3.90718, 3.92222, 3.93435, 3.94816, 3.9616, 3.97617, 3.9926,
+         4.00731, 4.02243, 4.03955, 4.05698, 4.07383, 4.09406, 4.11194, 4.13444, 4.15698, 4.17676,
+         4.19577, 4.21704, 4.23497, 4.25213, 4.27481, 4.29914, 4.32151, 4.344, 4.3659, 4.38826,
+         4.4111, 4.43565, 4.4631, 4.48252, 4.50737, 4.5339, 4.55993, 4.5949, 4.62269, 4.64888,
+         4.67854, 4.70694, 4.74124, 4.77875, 4.81308, 4.84217, 4.87915, 4.91514, 4.96146, 5.00901,
+         5.05712, 5.0989, 5.14056, 5.19, 5.23878, 5.2907, 5.34435, 5.40584, 5.46824, 5.53145,
+         5.61153, 5.68445, 5.77229, 5.86177, 5.96145, 6.07636, 6.21594, 6.32868, 6.47425, 6.62862,
+         6.69877, 6.7839, 6.89516, 6.9912, 7.07789, 7.17054, 7.3117, 7.43145, 7.58639, 7.7657,
+         8.01364, 8.26371, 8.58787, 8.89375, 9.26093, 9.74553, 10.3392, 11.3824],
+        [0.72181, 1.03911, 1.10187, 1.14644, 1.1824, 1.21362, 1.24136, 1.26638, 1.29008, 1.31209,
+         1.33278, 1.35263, 1.37179, 1.39084, 1.40878, 1.42632, 1.44367, 1.46057, 1.47697, 1.49319,
+         1.50905, 1.52487, 1.54015, 1.55554, 1.57092, 1.58589, 1.60083, 1.61572, 1.6306, 1.64548,
+         1.66039, 1.67543, 1.68978, 1.70465, 1.71921, 1.73392, 1.74903, 1.7639, 1.7788, 1.79399,
+         1.80945, 1.82456, 1.8398, 1.85498, 1.87051, 1.88632, 1.9022, 1.91828, 1.93437, 1.95073,
+         1.96735, 1.98371, 2.00054, 2.01768, 2.03501, 2.05265, 2.07076, 2.08908, 2.10749, 2.1264,
+         2.1452, 2.16506, 2.18503, 2.20524, 2.22585, 2.24726, 2.26901, 2.29148, 2.31442, 2.33793,
+         2.36193, 2.38695, 2.41281, 2.43942, 2.46709, 2.49558, 2.61264, 2.67867, 2.73507, 2.78786,
+         2.84005, 2.89174, 2.94489, 2.99956, 3.05717, 3.11742, 3.1823, 3.25306, 3.32953, 3.41167,
+         3.5059, 3.51555, 3.52592, 3.536, 3.54611, 3.55632, 3.56642, 3.57673, 3.58743, 3.59775,
+         3.60927, 3.62084, 3.63247, 3.6437, 3.65572, 3.66731, 3.67946, 3.69171, 3.70329, 3.71636,
+         3.72901, 3.74142, 3.7545, 3.768, 3.78214, 3.79564, 3.8101, 3.82427, 3.83758, 3.85258,
+         3.86789, 3.88369, 3.89892, 3.9135, 3.9299, 3.94616, 3.96332, 3.98044, 3.99695, 4.01402,
+         4.03269, 4.05125, 4.06976, 4.08935, 4.109, 4.13011, 4.15156, 4.17342, 4.1943, 4.21555,
+         4.23614, 4.25859, 4.28157, 4.30565, 4.32993, 4.3563, 4.3826, 4.40956, 4.43792, 4.46621,
+         4.49375, 4.52259, 4.55509, 4.58692, 4.62092, 4.65543, 4.6902, 4.72859, 4.76626, 4.80655,
+         4.84897, 4.89131, 4.9367, 4.98376, 5.03247, 5.08351, 5.13583, 5.19503, 5.25645, 5.32006,
+         5.38677, 5.45735, 5.53381, 5.6129, 5.69949, 5.7945, 5.90105, 6.00945, 6.13156, 6.27321,
+         6.42367, 6.43998, 6.46159, 6.47659, 6.49139, 6.50793, 6.52383, 6.54056, 6.5608, 6.57447,
+         6.59268, 6.60979, 6.63186, 6.65169, 6.67071, 6.68624, 6.70297, 6.72574, 6.74517, 6.76748,
+         6.79376, 6.81994, 6.83932, 6.86054, 6.88501, 6.90607, 6.93348, 6.96096, 6.98141, 7.00447,
+         7.02623, 7.05309, 7.07759, 7.10321, 7.13316, 7.16128, 7.18946, 7.21981, 7.25014, 7.27663,
+         7.30609, 7.32967, 7.35756, 7.38905, 7.4205, 7.45179, 7.48603, 7.52208, 7.55828, 7.59161,
+         7.63638, 7.67756, 7.71429, 7.75374, 7.79741, 7.83384, 7.88238, 7.92391, 7.97435, 8.01823,
+         8.06635, 8.11789, 8.17692, 8.22681, 8.28515, 8.34231, 8.40581, 8.46564, 8.53364, 8.59368,
+         8.67168, 8.73795, 8.82107, 8.89375, 8.96232, 9.05996, 9.13728, 9.21985, 9.3326, 9.42931,
+         9.52974, 9.65668, 9.75755, 9.88667, 10.0391, 10.1819, 10.3536, 10.5315, 10.7188, 10.9194,
+         11.18, 11.3148, 11.4666, 11.6205, 11.7683, 11.9132, 12.1446, 12.3687, 12.6071, 12.8357,
+         13.0607, 13.3425, 13.7949, 14.1653, 14.7357, 15.3708, 16.0273, 17.4928, 19.114]),
+    31: ([0, 0.0129, 0.02603, 0.03906, 0.0522, 0.06512, 0.07822, 0.09121, 0.10407, 0.11716, 0.13044,
+         0.1435, 0.15664, 0.16971, 0.183, 0.19637, 0.20966, 0.22295, 0.23635, 0.2498, 0.2633,
+         0.27699, 0.29065, 0.30412, 0.31781, 0.33172, 0.34564, 0.35968, 0.37356, 0.38757, 0.40164,
+         0.41588, 0.43017, 0.44423, 0.45885, 0.47324, 0.48803, 0.50296, 0.51794, 0.53308, 0.54827,
+         0.56334, 0.57871, 0.59426, 0.60949, 0.62496, 0.64002, 0.65489, 0.66667, 0.66667, 0.66667,
+         0.67534, 0.68836, 0.70244, 0.71745, 0.73293, 0.74913, 0.76529, 0.78225, 0.79968, 0.81735,
+         0.8351, 0.85346, 0.87238, 0.89113, 0.91061, 0.9303, 0.95055, 0.97128, 0.99278, 1.01476,
+         1.03674, 1.0598, 1.08357, 1.1079, 1.13334, 1.15908, 1.1862, 1.21408, 1.24319, 1.2734,
+         1.30477, 1.33785, 1.37236, 1.40836, 1.44621, 1.4862, 1.52927, 1.57561, 1.62495, 1.67937,
+         1.68475, 1.6905, 1.69626, 1.70193, 1.70798, 1.71391, 1.72008, 1.72607, 1.73217, 1.73832,
+         1.74471, 1.75113, 1.75744, 1.76414, 1.77038, 1.77713, 1.78401, 1.79072, 1.79749, 1.80451,
+         1.81166, 1.81848, 1.82586, 1.83316, 1.84036, 1.84786, 1.85535, 1.8631, 1.87065, 1.87856,
+         1.88654, 1.8947, 1.90274, 1.91164, 1.9204, 1.92908, 1.93728, 1.94588, 1.95479, 1.964,
+         1.9732, 1.98258, 1.99238, 2.00192, 2.01213, 2.02218, 2.03266, 2.04336, 2.05372, 2.0647,
+         2.07617, 2.08719, 2.09825, 2.11003, 2.12253, 2.13486, 2.14714, 2.16003, 2.17286, 2.18588,
+         2.19946, 2.21438, 2.22886, 2.24336, 2.25848, 2.27453, 2.29138, 2.30772, 2.32591, 2.34381,
+         2.36258, 2.38104, 2.40167, 2.42184, 2.44234, 2.46549, 2.48986, 2.52284, 2.56204, 2.59883,
+         2.63703, 2.67611, 2.71411, 2.75407, 2.79395, 2.83857, 2.88484, 2.93478, 2.99094, 3.04883,
+         3.05438, 3.06151, 3.06819, 3.0744, 3.08211, 3.08788, 3.09435, 3.09998, 3.1062, 3.11351,
+         3.11966, 3.12716, 3.13328, 3.14083, 3.14673, 3.15516, 3.16286, 3.17033, 3.17808, 3.18555,
+         3.1936, 3.20255, 3.21119, 3.21914, 3.22724, 3.23501, 3.24364, 3.25199, 3.26082, 3.26969,
+         3.27845, 3.2875, 3.29647, 3.30762, 3.31776, 3.32699, 3.33756, 3.34675, 3.35625, 3.36719,
+         3.37789, 3.38861, 3.39952, 3.41081, 3.4214, 3.43265, 3.44452, 3.45723, 3.46769, 3.48074,
+         3.49205, 3.50397, 3.51477, 3.52806, 3.54067, 3.55616, 3.5706, 3.58562, 3.6006, 3.6176,
+         3.63323, 3.64938, 3.66309, 3.67879, 3.69475, 3.71251, 3.73167, 3.74864, 3.76987, 3.7891,
+         3.80889, 3.82842, 3.85165, 3.87395, 3.89761, 3.92349, 3.95101, 3.98127, 4.01293, 4.04616,
+         4.08282, 4.12067, 4.16788, 4.21483, 4.26471, 4.31469, 4.36787, 4.42116, 4.47835, 4.54251,
+         4.57179, 4.61357, 4.66674, 4.69952, 4.74017, 4.78385, 4.83966, 4.89071, 4.94339, 5.00683,
+         5.08489, 5.19054, 5.32136, 5.44769, 5.59043, 5.72284, 5.93724, 6.27017],
+        [0.8815, 1.33535, 1.40984, 1.46004, 1.49967, 1.53297, 1.563, 1.58974, 1.6146, 1.63781,
+         1.65973, 1.68009, 1.69976, 1.71865, 1.73701, 1.75469, 1.77182, 1.78823, 1.80478, 1.82079,
+         1.83659, 1.85178, 1.8667, 1.88169, 1.89639, 1.91099, 1.92543, 1.93987, 1.95422, 1.96829,
+         1.98231, 1.99619, 2.01033, 2.02425, 2.03801, 2.05183, 2.06559, 2.07938, 2.09328, 2.10725,
+         2.12098, 2.13487, 2.1489, 2.16293, 2.17711, 2.19117, 2.2054, 2.21955, 2.23377, 2.24817,
+         2.26271, 2.2775, 2.29229, 2.30757, 2.32289, 2.33819, 2.35398, 2.36995, 2.38604, 2.40216,
+         2.4189, 2.4356, 2.45263, 2.47033, 2.4882, 2.5379, 2.5801, 2.61195, 2.6405, 2.66747,
+         2.69318, 2.71957, 2.74556, 2.77222, 2.79961, 2.82715, 2.85552, 2.88538, 2.9155, 2.94726,
+         2.98091, 3.01564, 3.05214, 3.09062, 3.13137, 3.17461, 3.22099, 3.27049, 3.32521, 3.38338,
+         3.44682, 3.4536, 3.46081, 3.46754, 3.47479, 3.48217, 3.48941, 3.49626, 3.50342, 3.51064,
+         3.51795, 3.52563, 3.53324, 3.54092, 3.54872, 3.55656, 3.5642, 3.57197, 3.58043, 3.58891,
+         3.59752, 3.60609, 3.61512, 3.62354, 3.63235, 3.64198, 3.65103, 3.66013, 3.66976, 3.679,
+         3.68866, 3.69872, 3.7089, 3.71863, 3.72868, 3.73914, 3.74992, 3.76043, 3.77097, 3.78248,
+         3.79395, 3.80501, 3.81596, 3.82756, 3.83934, 3.85128, 3.86365, 3.87619, 3.88978, 3.90328,
+         3.9173, 3.93215, 3.94606, 3.96006, 3.97581, 3.99075, 4.006, 4.02117, 4.03722, 4.05301,
+         4.07036, 4.0881, 4.10621, 4.12474, 4.14408, 4.16406, 4.18446, 4.20557, 4.228, 4.25103,
+         4.27361, 4.29864, 4.3249, 4.35191, 4.38073, 4.40837, 4.4371, 4.46829, 4.50153, 4.53419,
+         4.5682, 4.60389, 4.64236, 4.68456, 4.73045, 4.77866, 4.83009, 4.8849, 4.94624, 5.00872,
+         5.0802, 5.08768, 5.09471, 5.10272, 5.11122, 5.11895, 5.12672, 5.13541, 5.14229, 5.15046,
+         5.15845, 5.16737, 5.17754, 5.1865, 5.19551, 5.20499, 5.21351, 5.222, 5.23305, 5.24344,
+         5.25403, 5.2658, 5.27461, 5.28524, 5.29466, 5.30605, 5.31601, 5.32683, 5.33979, 5.35081,
+         5.36138, 5.37204, 5.38397, 5.39589, 5.4065, 5.4185, 5.43057, 5.44271, 5.45893, 5.47234,
+         5.48438, 5.49723, 5.50954, 5.52134, 5.53711, 5.55175, 5.56777, 5.58172, 5.59764, 5.61448,
+         5.63065, 5.64798, 5.66294, 5.68032, 5.69785, 5.71582, 5.73196, 5.74897, 5.76918, 5.78852,
+         5.80769, 5.82848, 5.84786, 5.86955, 5.89563, 5.91368, 5.93903, 5.96312, 5.98688, 6.01346,
+         6.04118, 6.06728, 6.09626, 6.12601, 6.1643, 6.19791, 6.23396, 6.26879, 6.30797, 6.34811,
+         6.39407, 6.43918, 6.49812, 6.54513, 6.60957, 6.67618, 6.73785, 6.79988, 6.88254, 6.95982,
+         7.04991, 7.09505, 7.14952, 7.2009, 7.26655, 7.35103, 7.41569, 7.48742, 7.57951, 7.69391,
+         7.84167, 7.96505, 8.09855, 8.23161, 8.37128, 8.54779, 8.77862, 9.10742, 9.51488]),
+    63: ([0, 0.01285, 0.02578, 0.03849, 0.05137, 0.06415, 0.07703, 0.08997, 0.10271, 0.11545,
+         0.12837, 0.14143, 0.15426, 0.16709, 0.18001, 0.19303, 0.20601, 0.21909, 0.23226, 0.24552,
+         0.25888, 0.2723, 0.28562, 0.29908, 0.31247, 0.32601, 0.33968, 0.3533, 0.36705, 0.38072,
+         0.39478, 0.40861, 0.42264, 0.4367, 0.45078, 0.46503, 0.47934, 0.4935, 0.50809, 0.5231,
+         0.53793, 0.55278, 0.56795, 0.58316, 0.59836, 0.61375, 0.62908, 0.64452, 0.65881, 0.66667,
+         0.6707, 0.68378, 0.69855, 0.71409, 0.73011, 0.74638, 0.76315, 0.78013, 0.79759, 0.81471,
+         0.83256, 0.85042, 0.86895, 0.88753, 0.9063, 0.92545, 0.94551, 0.96579, 0.98621, 1.00749,
+         1.02915, 1.0513, 1.07372, 1.0967, 1.12058, 1.14535, 1.17086, 1.19683, 1.22411, 1.25225,
+         1.28096, 1.31111, 1.34219, 1.37495, 1.40932, 1.44609, 1.48434, 1.52516, 1.5691, 1.61623,
+         1.66704, 1.67269, 1.67805, 1.68346, 1.6888, 1.69396, 1.6996, 1.70512, 1.71089, 1.71642,
+         1.72194, 1.72771, 1.73357, 1.73951, 1.74534, 1.75132, 1.7575, 1.76378, 1.76999, 1.77628,
+         1.78263, 1.78887, 1.79539, 1.80203, 1.80848, 1.81486, 1.82187, 1.82876, 1.83568, 1.84297,
+         1.84996, 1.8572, 1.86445, 1.87188, 1.87949, 1.88731, 1.89578, 1.90354, 1.9114, 1.9195,
+         1.92737, 1.93568, 1.94439, 1.95271, 1.9614, 1.97008, 1.97905, 1.98793, 1.99765, 2.00681,
+         2.01589, 2.02498, 2.03455, 2.04472, 2.05529, 2.06549, 2.07598, 2.08709, 2.09804, 2.10959,
+         2.12134, 2.13363, 2.14583, 2.15788, 2.17076, 2.18408, 2.19857, 2.21243, 2.22758, 2.24229,
+         2.2572, 2.27334, 2.28955, 2.30607, 2.32294, 2.34204, 2.3609, 2.38074, 2.40098, 2.42066,
+         2.44232, 2.46473, 2.48888, 2.51988, 2.55699, 2.59621, 2.63377, 2.6708, 2.71105, 2.7534,
+         2.79949, 2.80462, 2.8089, 2.81367, 2.81863, 2.82324, 2.82861, 2.83349, 2.8393, 2.84484,
+         2.84959, 2.85523, 2.86033, 2.86508, 2.87048, 2.87512, 2.8807, 2.88629, 2.89262, 2.89825,
+         2.9026, 2.90901, 2.91412, 2.92001, 2.92613, 2.93194, 2.9376, 2.94395, 2.95026, 2.95595,
+         2.96241, 2.96943, 2.97567, 2.98286, 2.98915, 2.99637, 3.00382, 3.01029, 3.01628, 3.02326,
+         3.03014, 3.03755, 3.04428, 3.05168, 3.05891, 3.06608, 3.07343, 3.08271, 3.09226, 3.10244,
+         3.11307, 3.12123, 3.12971, 3.13777, 3.1496, 3.15934, 3.17041, 3.18166, 3.19213, 3.20356,
+         3.21405, 3.22459, 3.23574, 3.24901, 3.26042, 3.27432, 3.28471, 3.29728, 3.30969, 3.32189,
+         3.33794, 3.35143, 3.3652, 3.37951, 3.39806, 3.4148, 3.4307, 3.4483, 3.47032, 3.48842,
+         3.50753, 3.53112, 3.5551, 3.57766, 3.60584, 3.63312, 3.66781, 3.70131, 3.73488, 3.77339,
+         3.8125, 3.83089, 3.85377, 3.87634, 3.8974, 3.92446, 3.96009, 3.99446, 4.0349, 4.0697,
+         4.10519, 4.14967, 4.19961, 4.2491, 4.3169, 4.40407, 4.48089, 4.61825, 4.84628],
+        [1.14521, 1.6455, 1.72193, 1.77382, 1.81378, 1.8477, 1.87655, 1.90292, 1.92733, 1.94994,
+         1.97053, 1.99038, 2.00952, 2.02733, 2.04453, 2.06115, 2.07757, 2.09301, 2.10839, 2.12328,
+         2.1379, 2.15196, 2.16587, 2.17976, 2.19341, 2.2069, 2.22041, 2.23343, 2.24657, 2.25956,
+         2.27237, 2.28491, 2.29756, 2.31013, 2.32272, 2.33522, 2.34766, 2.36006, 2.37248, 2.38484,
+         2.39716, 2.40958, 2.42194, 2.43446, 2.44703, 2.45938, 2.47192, 2.48466, 2.49743, 2.53512,
+         2.55637, 2.5744, 2.59125, 2.6071, 2.62267, 2.63827, 2.65357, 2.66918, 2.68474, 2.70028,
+         2.71641, 2.73239, 2.74903, 2.76542, 2.78212, 2.7995, 2.81692, 2.83491, 2.85315, 2.87193,
+         2.89146, 2.91143, 2.93165, 2.95259, 2.97407, 2.99633, 3.01883, 3.04191, 3.06613, 3.09158,
+         3.11762, 3.14489, 3.17294, 3.20311, 3.23482, 3.2684, 3.30446, 3.34238, 3.38276, 3.42664,
+         3.47362, 3.47866, 3.48361, 3.48891, 3.494, 3.4993, 3.5044, 3.50973, 3.51524, 3.52019,
+         3.52561, 3.53117, 3.53655, 3.54212, 3.54779, 3.55337, 3.55922, 3.56501, 3.57092, 3.57683,
+         3.58287, 3.5888, 3.59482, 3.60156, 3.60758, 3.61403, 3.6204, 3.62671, 3.6334, 3.64006,
+         3.64689, 3.65405, 3.66122, 3.66783, 3.67512, 3.68273, 3.69057, 3.6981, 3.70555, 3.71339,
+         3.72108, 3.72904, 3.73701, 3.74555, 3.75397, 3.76207, 3.77082, 3.78013, 3.78949, 3.799,
+         3.80864, 3.81797, 3.82764, 3.83757, 3.8474, 3.85808, 3.8682, 3.87901, 3.89009, 3.90162,
+         3.91334, 3.92459, 3.9368, 3.94982, 3.96243, 3.97563, 3.99027, 4.00391, 4.01718, 4.03301,
+         4.04788, 4.06398, 4.08009, 4.09745, 4.11487, 4.13333, 4.15227, 4.17229, 4.1925, 4.21416,
+         4.23653, 4.26134, 4.28708, 4.31384, 4.34129, 4.37018, 4.40234, 4.43606, 4.47401, 4.51588,
+         4.55979, 4.56353, 4.56808, 4.57295, 4.57708, 4.58209, 4.58753, 4.59268, 4.59731, 4.60209,
+         4.60748, 4.61272, 4.61814, 4.62361, 4.62986, 4.63533, 4.64066, 4.64657, 4.65207, 4.65847,
+         4.66474, 4.6708, 4.67608, 4.68246, 4.6891, 4.69499, 4.70099, 4.70636, 4.71265, 4.71904,
+         4.72565, 4.7324, 4.73985, 4.74634, 4.75484, 4.76174, 4.76855, 4.77758, 4.78528, 4.79236,
+         4.80013, 4.8075, 4.81558, 4.82405, 4.83255, 4.84137, 4.84846, 4.85719, 4.86647, 4.8766,
+         4.88713, 4.89824, 4.90845, 4.9192, 4.93094, 4.94236, 4.95361, 4.96394, 4.97262, 4.98404,
+         4.99645, 5.00564, 5.01786, 5.03051, 5.04387, 5.05786, 5.07123, 5.08657, 5.1008, 5.11868,
+         5.13322, 5.14549, 5.16266, 5.18249, 5.20236, 5.22123, 5.24068, 5.26532, 5.28492, 5.30846,
+         5.3304, 5.35668, 5.38201, 5.41097, 5.44673, 5.47292, 5.50661, 5.54044, 5.58516, 5.62564,
+         5.67179, 5.7005, 5.72277, 5.74827, 5.7774, 5.80873, 5.84067, 5.88312, 5.93202, 5.97394,
+         6.02434, 6.08226, 6.14604, 6.21681, 6.29293, 6.37771, 6.49863, 6.64052, 6.86192]),
+    127: ([0, 0.01284, 0.02551, 0.03816, 0.0509, 0.06351, 0.07602, 0.08877, 0.10163, 0.11419,
+         0.12697, 0.1397, 0.15266, 0.16518, 0.17801, 0.19086, 0.20362, 0.21683, 0.22985, 0.24289,
+         0.25589, 0.26899, 0.28206, 0.2952, 0.30853, 0.32189, 0.33522, 0.34837, 0.36204, 0.37553,
+         0.38938, 0.40302, 0.41676, 0.43061, 0.44464, 0.45867, 0.47285, 0.48704, 0.50137, 0.51558,
+         0.53011, 0.54466, 0.55938, 0.57445, 0.58936, 0.60476, 0.62035, 0.6357, 0.65117, 0.66502,
+         0.67145, 0.68555, 0.70105, 0.71712, 0.73344, 0.74988, 0.7668, 0.78374, 0.80129, 0.8191,
+         0.83699, 0.85535, 0.87417, 0.89266, 0.91176, 0.9314, 0.95072, 0.97092, 0.99133, 1.01218,
+         1.03361, 1.05545, 1.07817, 1.10091, 1.12482, 1.14903, 1.17391, 1.19927, 1.226, 1.25327,
+         1.28139, 1.31078, 1.34148, 1.37364, 1.40694, 1.44247, 1.47987, 1.51887, 1.56123, 1.60697,
+         1.65536, 1.66068, 1.66614, 1.67145, 1.67647, 1.6817, 1.68714, 1.69261, 1.69816, 1.70355,
+         1.70913, 1.7146, 1.72019, 1.72593, 1.73138, 1.73727, 1.74336, 1.74963, 1.75562, 1.76142,
+         1.76761, 1.77381, 1.77996, 1.78625, 1.79261, 1.79916, 1.80555, 1.81206, 1.81892, 1.82548,
+         1.8324, 1.83919, 1.84575, 1.85291, 1.86033, 1.86791, 1.87526, 1.88277, 1.89078, 1.89855,
+         1.9058, 1.91353, 1.92139, 1.92962, 1.93778, 1.94613, 1.95435, 1.96301, 1.97181, 1.98067,
+         1.98989, 1.99931, 2.00873, 2.01861, 2.0284, 2.03823, 2.04833, 2.05874, 2.06921, 2.0794,
+         2.09046, 2.10161, 2.11308, 2.12476, 2.13681, 2.1491, 2.1622, 2.17466, 2.18746, 2.20147,
+         2.21533, 2.22878, 2.24326, 2.25854, 2.27495, 2.29204, 2.30818, 2.326, 2.34544, 2.36491,
+         2.38489, 2.40631, 2.42839, 2.45094, 2.47607, 2.50165, 2.53821, 2.57377, 2.61084, 2.64771,
+         2.68638, 2.69119, 2.69497, 2.69863, 2.70246, 2.70689, 2.7114, 2.71539, 2.72005, 2.72388,
+         2.72766, 2.7321, 2.73683, 2.74217, 2.74545, 2.75056, 2.75506, 2.75987, 2.76482, 2.76962,
+         2.77439, 2.77878, 2.78411, 2.78798, 2.79357, 2.79835, 2.80385, 2.80934, 2.81499, 2.82039,
+         2.82601, 2.83103, 2.83791, 2.8442, 2.85083, 2.85536, 2.86108, 2.86637, 2.87178, 2.87919,
+         2.88545, 2.89147, 2.89789, 2.90399, 2.91051, 2.91834, 2.92563, 2.93249, 2.9392, 2.9466,
+         2.95438, 2.96244, 2.96958, 2.97739, 2.98556, 2.99264, 3.00244, 3.01091, 3.01941, 3.02812,
+         3.03759, 3.04798, 3.05725, 3.06692, 3.07749, 3.08883, 3.1, 3.11031, 3.12195, 3.13155,
+         3.147, 3.16063, 3.17301, 3.18473, 3.19766, 3.21204, 3.22939, 3.245, 3.26132, 3.27774,
+         3.2977, 3.3139, 3.33246, 3.35218, 3.3741, 3.39972, 3.42344, 3.44712, 3.47697, 3.50519,
+         3.54809, 3.56391, 3.58297, 3.60196, 3.62349, 3.64715, 3.67049, 3.69319, 3.71884, 3.75075,
+         3.78241, 3.81856, 3.85908, 3.89825, 3.9501, 4.01537, 4.09113, 4.18325, 4.33678],
+        [1.44091, 1.95281, 2.02587, 2.07422, 2.11253, 2.14411, 2.17213, 2.19647, 2.21888, 2.23995,
+         2.25908, 2.2775, 2.29504, 2.3114, 2.32744, 2.34294, 2.35756, 2.37179, 2.38568, 2.39939,
+         2.41248, 2.42527, 2.43816, 2.45077, 2.46289, 2.47476, 2.48679, 2.49882, 2.52674, 2.54215,
+         2.55582, 2.56859, 2.58097, 2.59339, 2.60553, 2.61753, 2.62956, 2.64143, 2.65332, 2.6654,
+         2.67743, 2.6895, 2.70153, 2.71378, 2.72552, 2.73753, 2.74948, 2.76155, 2.77362, 2.78578,
+         2.79853, 2.81107, 2.82352, 2.83594, 2.84869, 2.86141, 2.87434, 2.88735, 2.90029, 2.91356,
+         2.92676, 2.94045, 2.95452, 2.96855, 2.98283, 2.99721, 3.01212, 3.02709, 3.04279, 3.05837,
+         3.0744, 3.09082, 3.10758, 3.12458, 3.1423, 3.16071, 3.17931, 3.19878, 3.21873, 3.23937,
+         3.26083, 3.28266, 3.30579, 3.33039, 3.3561, 3.3829, 3.41129, 3.44143, 3.47349, 3.50815,
+         3.54552, 3.54956, 3.55356, 3.55765, 3.56174, 3.566, 3.57018, 3.57432, 3.5784, 3.58274,
+         3.58699, 3.59143, 3.5957, 3.6001, 3.60469, 3.60921, 3.61368, 3.6181, 3.62258, 3.62725,
+         3.63191, 3.6367, 3.64149, 3.64656, 3.65128, 3.65642, 3.66133, 3.66647, 3.67132, 3.6766,
+         3.68218, 3.68763, 3.69321, 3.69849, 3.70429, 3.71007, 3.71615, 3.72182, 3.72788, 3.73392,
+         3.74009, 3.74639, 3.75273, 3.7593, 3.76583, 3.77241, 3.77894, 3.78569, 3.79262, 3.7998,
+         3.80709, 3.81467, 3.82242, 3.83014, 3.8381, 3.8465, 3.85487, 3.86311, 3.87203, 3.88064,
+         3.88963, 3.89907, 3.90868, 3.91856, 3.92795, 3.93831, 3.94843, 3.95943, 3.97, 3.98176,
+         3.99303, 4.00479, 4.01726, 4.03007, 4.04278, 4.05705, 4.07127, 4.0857, 4.10174, 4.11747,
+         4.13407, 4.15114, 4.16879, 4.18956, 4.21046, 4.23304, 4.25699, 4.28205, 4.31019, 4.34127,
+         4.3732, 4.37616, 4.37958, 4.38332, 4.38703, 4.39078, 4.39376, 4.3976, 4.40143, 4.40471,
+         4.40895, 4.41272, 4.41578, 4.42045, 4.42522, 4.42908, 4.43328, 4.43743, 4.44159, 4.44614,
+         4.45006, 4.45416, 4.4587, 4.46299, 4.46821, 4.47297, 4.47793, 4.48227, 4.48704, 4.49175,
+         4.49618, 4.50134, 4.50649, 4.51088, 4.516, 4.52079, 4.52595, 4.53115, 4.53642, 4.54193,
+         4.54689, 4.55201, 4.55699, 4.56359, 4.56841, 4.57438, 4.58013, 4.58649, 4.59281, 4.5984,
+         4.60433, 4.61065, 4.61684, 4.62381, 4.63075, 4.6384, 4.64455, 4.65189, 4.6597, 4.66757,
+         4.67705, 4.68541, 4.69379, 4.70274, 4.71222, 4.72272, 4.73148, 4.74071, 4.75013, 4.76014,
+         4.77034, 4.78056, 4.79186, 4.80464, 4.81701, 4.82936, 4.8421, 4.8575, 4.87066, 4.88566,
+         4.90047, 4.91707, 4.93595, 4.95675, 4.97513, 4.99256, 5.01834, 5.03792, 5.06622, 5.09764,
+         5.13283, 5.14911, 5.17355, 5.18723, 5.20706, 5.22757, 5.24717, 5.27595, 5.29767, 5.32659,
+         5.35898, 5.39999, 5.44122, 5.49111, 5.54247, 5.59166, 5.67272, 5.77776, 5.93524]),
+    255: ([0, 0.01269, 0.02527, 0.03791, 0.0507, 0.06333, 0.07596, 0.08872, 0.10147, 0.11431, 0.12692,
+           0.13975, 0.15239, 0.165, 0.17776, 0.19052, 0.2035, 0.21638, 0.22916, 0.24218, 0.25536, 0.26847,
+           0.28162, 0.29465, 0.30797, 0.32113, 0.33445, 0.34792, 0.36143, 0.375, 0.38838, 0.40208,
+           0.41569, 0.42962, 0.44342, 0.4574, 0.47139, 0.48558, 0.49969, 0.5139, 0.52829, 0.54278,
+           0.55759, 0.57244, 0.58742, 0.60267, 0.61805, 0.63326, 0.64886, 0.66383, 0.67403, 0.68937,
+           0.70513, 0.7211, 0.73743, 0.7537, 0.7703, 0.78702, 0.80409, 0.82159, 0.83938, 0.85738, 0.87571,
+           0.89442, 0.91316, 0.93255, 0.95208, 0.97212, 0.99289, 1.01417, 1.03533, 1.05716, 1.07947,
+           1.10238, 1.12561, 1.14966, 1.17462, 1.2, 1.2265, 1.25376, 1.28167, 1.31139, 1.34173, 1.37359,
+           1.40665, 1.44163, 1.4788, 1.5175, 1.55864, 1.60243, 1.65063, 1.65545, 1.6606, 1.66557, 1.67074,
+           1.67619, 1.68119, 1.68645, 1.69176, 1.69701, 1.70234, 1.70766, 1.71305, 1.71853, 1.72409,
+           1.72992, 1.73567, 1.74114, 1.74719, 1.75323, 1.75908, 1.76501, 1.77119, 1.77716, 1.78328,
+           1.78955, 1.79582, 1.80228, 1.80871, 1.81541, 1.82212, 1.82847, 1.83534, 1.8425, 1.84952,
+           1.85642, 1.86332, 1.87035, 1.8776, 1.88472, 1.89239, 1.89999, 1.90746, 1.91539, 1.9235,
+           1.93138, 1.93954, 1.94806, 1.95657, 1.96492, 1.97353, 1.98207, 1.99128, 2.00057, 2.00997,
+           2.01926, 2.02875, 2.03856, 2.04838, 2.05878, 2.06982, 2.08056, 2.09165, 2.1027, 2.11411,
+           2.12578, 2.13828, 2.1512, 2.1645, 2.17757, 2.19125, 2.20557, 2.21972, 2.23528, 2.24981, 2.2656,
+           2.28215, 2.29829, 2.31661, 2.33461, 2.35397, 2.37473, 2.3957, 2.4181, 2.44127, 2.46613,
+           2.49293, 2.52256, 2.55644, 2.5925, 2.63113, 2.63495, 2.639, 2.64306, 2.64725, 2.65094, 2.65508,
+           2.65905, 2.66318, 2.66747, 2.67162, 2.67553, 2.67994, 2.68454, 2.6883, 2.69272, 2.6972,
+           2.70137, 2.70561, 2.70951, 2.71395, 2.7185, 2.7238, 2.72788, 2.73291, 2.73736, 2.7425, 2.74732,
+           2.75189, 2.75709, 2.76141, 2.7665, 2.77197, 2.7764, 2.78214, 2.7882, 2.79399, 2.80004, 2.8056,
+           2.81128, 2.81759, 2.82297, 2.82896, 2.83523, 2.84066, 2.84748, 2.85389, 2.85996, 2.86624,
+           2.87265, 2.87967, 2.88735, 2.89412, 2.90177, 2.90909, 2.91667, 2.92334, 2.93034, 2.93821,
+           2.94641, 2.95639, 2.96549, 2.97453, 2.98339, 2.9938, 3.00203, 3.01165, 3.02193, 3.03304,
+           3.04427, 3.05334, 3.0649, 3.07537, 3.08737, 3.10024, 3.11346, 3.12637, 3.13882, 3.15522,
+           3.16958, 3.18472, 3.19841, 3.21732, 3.23661, 3.25586, 3.27743, 3.29563, 3.31925, 3.34272,
+           3.36959, 3.40203, 3.41702, 3.434, 3.45297, 3.47217, 3.49084, 3.51182, 3.53411, 3.55983,
+           3.58498, 3.61466, 3.6498, 3.68595, 3.72804, 3.77616, 3.82425, 3.88744, 3.97479, 4.10111],
+          [1.78351, 2.24435, 2.31235, 2.35726, 2.3919, 2.4216, 2.44694, 2.46968, 2.49034, 2.51874,
+           2.53897, 2.55678, 2.57342, 2.58987, 2.60549, 2.62018, 2.63452, 2.64835, 2.66179, 2.67493,
+           2.68771, 2.70065, 2.71284, 2.72469, 2.73649, 2.74808, 2.7593, 2.77048, 2.78158, 2.79274,
+           2.8036, 2.81441, 2.82516, 2.83602, 2.84677, 2.85749, 2.86815, 2.87877, 2.88941, 2.89991,
+           2.91036, 2.92068, 2.93111, 2.94149, 2.95192, 2.96242, 2.97295, 2.98346, 2.99403, 3.00475,
+           3.01557, 3.02623, 3.03712, 3.04827, 3.05932, 3.0701, 3.08127, 3.09247, 3.10404, 3.11581,
+           3.12765, 3.13939, 3.15138, 3.16333, 3.17562, 3.18788, 3.20074, 3.2138, 3.2269, 3.24039,
+           3.25396, 3.26791, 3.28247, 3.29714, 3.31206, 3.32756, 3.34361, 3.36016, 3.37733, 3.39515,
+           3.41363, 3.43282, 3.45218, 3.47285, 3.49421, 3.5175, 3.54174, 3.56728, 3.59421, 3.62373,
+           3.6559, 3.65918, 3.66248, 3.66586, 3.66922, 3.67288, 3.67637, 3.67974, 3.68331, 3.68694,
+           3.69062, 3.6945, 3.6983, 3.70216, 3.70598, 3.7097, 3.71358, 3.71735, 3.72124, 3.72519, 3.72902,
+           3.73305, 3.73706, 3.74131, 3.74538, 3.7495, 3.7539, 3.75818, 3.76277, 3.76727, 3.77158,
+           3.77625, 3.78083, 3.78543, 3.79023, 3.79518, 3.7998, 3.80483, 3.80982, 3.81502, 3.8202,
+           3.82543, 3.83051, 3.83589, 3.84136, 3.84695, 3.85271, 3.85867, 3.86473, 3.87053, 3.8766,
+           3.88277, 3.88929, 3.89637, 3.9026, 3.90919, 3.91603, 3.92343, 3.93041, 3.93718, 3.94485,
+           3.95183, 3.95921, 3.96687, 3.97517, 3.98319, 3.99141, 4.00037, 4.00975, 4.01899, 4.02881,
+           4.03908, 4.04951, 4.06003, 4.07192, 4.08321, 4.09466, 4.10648, 4.11941, 4.13277, 4.14676,
+           4.1614, 4.17672, 4.19216, 4.21009, 4.22829, 4.24869, 4.26938, 4.29262, 4.31597, 4.3435,
+           4.34674, 4.35012, 4.35253, 4.35601, 4.35913, 4.36204, 4.36504, 4.36812, 4.37133, 4.3742,
+           4.3776, 4.38083, 4.38375, 4.38681, 4.39036, 4.39397, 4.3973, 4.40077, 4.40345, 4.40692,
+           4.41008, 4.41382, 4.41692, 4.42012, 4.42346, 4.42697, 4.43089, 4.43443, 4.43867, 4.44294,
+           4.44615, 4.45094, 4.45569, 4.46055, 4.46492, 4.46958, 4.47369, 4.47751, 4.48151, 4.48671,
+           4.49066, 4.49542, 4.50044, 4.50521, 4.51053, 4.51605, 4.52053, 4.52527, 4.53081, 4.53588,
+           4.54176, 4.54779, 4.55277, 4.55701, 4.56285, 4.56966, 4.57573, 4.58224, 4.58862, 4.59457,
+           4.60058, 4.60731, 4.61525, 4.62206, 4.6282, 4.63496, 4.64369, 4.65174, 4.65953, 4.66602,
+           4.67468, 4.68299, 4.6934, 4.70476, 4.71511, 4.72554, 4.73775, 4.75029, 4.76348, 4.77477,
+           4.7895, 4.80486, 4.81846, 4.83175, 4.8479, 4.86197, 4.88393, 4.90263, 4.92199, 4.94744,
+           4.96176, 4.97422, 4.99046, 5.00531, 5.01734, 5.03688, 5.05719, 5.07728, 5.09751, 5.12249,
+           5.14751, 5.17525, 5.21871, 5.25524, 5.29581, 5.35815, 5.45228, 5.55396]),
+    511: ([0, 0.01263, 0.02528, 0.03807, 0.05073, 0.06328, 0.07571, 0.08828, 0.10098, 0.11364, 0.12624,
+           0.13902, 0.15157, 0.16434, 0.17724, 0.19002, 0.20289, 0.2158, 0.2288, 0.24165, 0.25456,
+           0.26773, 0.28091, 0.29395, 0.30722, 0.32028, 0.33366, 0.34699, 0.36035, 0.3739, 0.3874,
+           0.40091, 0.41446, 0.4282, 0.44204, 0.45575, 0.46989, 0.48386, 0.49815, 0.51224, 0.52641,
+           0.54119, 0.55579, 0.57059, 0.58543, 0.60047, 0.6156, 0.63093, 0.6462, 0.66187, 0.67439,
+           0.69008, 0.70609, 0.7221, 0.73849, 0.75496, 0.77176, 0.78892, 0.80599, 0.82357, 0.84146,
+           0.85922, 0.8775, 0.8961, 0.9151, 0.9341, 0.95371, 0.97364, 0.9941, 1.01471, 1.03616, 1.05786,
+           1.08044, 1.10351, 1.12708, 1.15153, 1.176, 1.20146, 1.22785, 1.25469, 1.28316, 1.31235,
+           1.34267, 1.37436, 1.40754, 1.44223, 1.47894, 1.51721, 1.55912, 1.60267, 1.64997, 1.65481,
+           1.65977, 1.66477, 1.66987, 1.67487, 1.67996, 1.685, 1.69044, 1.6958, 1.70115, 1.70632, 1.71171,
+           1.71699, 1.7225, 1.72826, 1.73396, 1.73931, 1.7453, 1.75105, 1.75697, 1.76294, 1.76919,
+           1.77529, 1.78139, 1.78748, 1.79375, 1.8002, 1.80669, 1.81298, 1.81963, 1.82611, 1.83304,
+           1.83976, 1.8463, 1.8534, 1.8609, 1.86814, 1.87533, 1.88272, 1.88999, 1.89768, 1.90545, 1.91326,
+           1.92156, 1.92942, 1.93739, 1.94512, 1.95349, 1.96171, 1.97024, 1.97918, 1.98838, 1.99769,
+           2.00699, 2.01621, 2.02603, 2.03583, 2.04553, 2.05583, 2.06621, 2.07682, 2.08777, 2.09925,
+           2.11034, 2.12199, 2.13392, 2.14586, 2.1583, 2.17132, 2.18479, 2.19857, 2.21378, 2.22833,
+           2.24316, 2.25845, 2.27381, 2.29078, 2.30908, 2.32759, 2.34578, 2.36469, 2.38526, 2.40629,
+           2.42973, 2.45358, 2.47743, 2.5066, 2.53873, 2.57208, 2.60676, 2.61041, 2.61422, 2.61794,
+           2.62134, 2.62452, 2.62844, 2.63278, 2.63633, 2.63999, 2.64458, 2.64854, 2.65306, 2.65751,
+           2.66103, 2.66475, 2.6688, 2.67281, 2.6769, 2.6814, 2.68508, 2.68932, 2.6936, 2.69794, 2.70251,
+           2.70685, 2.71156, 2.71605, 2.72148, 2.72546, 2.73065, 2.73581, 2.74093, 2.74591, 2.75149,
+           2.75694, 2.76183, 2.76669, 2.77154, 2.77736, 2.78345, 2.79036, 2.79655, 2.80218, 2.80813,
+           2.81294, 2.81938, 2.82642, 2.83329, 2.8398, 2.84577, 2.85329, 2.86048, 2.86734, 2.87422,
+           2.88137, 2.88981, 2.89878, 2.90653, 2.91507, 2.92187, 2.92994, 2.93847, 2.94747, 2.95701,
+           2.9678, 2.9784, 2.9869, 2.99697, 3.00778, 3.01923, 3.03018, 3.04201, 3.05409, 3.0666, 3.07961,
+           3.09463, 3.10868, 3.12109, 3.13184, 3.14741, 3.16431, 3.18343, 3.19951, 3.21872, 3.23899,
+           3.26293, 3.28466, 3.30836, 3.3335, 3.3642, 3.37609, 3.3892, 3.4069, 3.42313, 3.44352, 3.46265,
+           3.48465, 3.50765, 3.53104, 3.55877, 3.58893, 3.62084, 3.66723, 3.71045, 3.76376, 3.82313,
+           3.90476, 4.00963],
+          [2.10019, 2.5191, 2.58633, 2.63009, 2.66388, 2.69223, 2.71754, 2.73915, 2.75917, 2.77715,
+           2.79401, 2.80992, 2.82478, 2.8393, 2.85309, 2.86626, 2.87906, 2.89133, 2.90344, 2.91522,
+           2.92666, 2.9376, 2.9487, 2.95941, 2.97005, 2.98068, 2.99087, 3.00111, 3.011, 3.02078, 3.03032,
+           3.03988, 3.04935, 3.05909, 3.06876, 3.07823, 3.0872, 3.09658, 3.10577, 3.11491, 3.12446,
+           3.13387, 3.14305, 3.1523, 3.16145, 3.17074, 3.17997, 3.18938, 3.19881, 3.20841, 3.21805,
+           3.22751, 3.23717, 3.24663, 3.25643, 3.26628, 3.27636, 3.28637, 3.29669, 3.307, 3.31732,
+           3.32782, 3.33865, 3.34936, 3.36044, 3.37135, 3.38266, 3.39432, 3.40622, 3.41815, 3.43033,
+           3.44285, 3.45536, 3.46897, 3.48267, 3.49662, 3.51086, 3.52576, 3.54075, 3.55616, 3.57256,
+           3.58961, 3.60711, 3.62506, 3.64484, 3.66462, 3.68652, 3.70979, 3.73422, 3.76006, 3.78828,
+           3.79104, 3.79437, 3.79726, 3.80017, 3.80318, 3.80614, 3.80935, 3.81243, 3.81583, 3.81914,
+           3.82202, 3.82508, 3.82827, 3.83155, 3.83494, 3.83842, 3.84166, 3.84494, 3.84882, 3.85236,
+           3.85582, 3.85905, 3.86281, 3.86661, 3.87043, 3.87421, 3.87799, 3.88185, 3.88577, 3.89019,
+           3.89415, 3.89815, 3.90233, 3.90694, 3.91132, 3.91549, 3.91968, 3.92439, 3.92886, 3.93364,
+           3.93826, 3.94274, 3.9476, 3.95217, 3.95711, 3.96206, 3.96705, 3.97234, 3.97743, 3.98288,
+           3.98852, 3.99365, 3.99969, 4.00536, 4.01122, 4.01752, 4.02403, 4.0305, 4.03744, 4.04398,
+           4.05078, 4.05811, 4.06467, 4.07201, 4.07925, 4.08643, 4.09416, 4.10226, 4.10991, 4.11814,
+           4.12687, 4.13625, 4.14597, 4.15468, 4.16515, 4.17607, 4.18725, 4.19876, 4.20986, 4.22232,
+           4.23581, 4.24946, 4.26366, 4.27978, 4.29577, 4.31319, 4.33286, 4.35176, 4.37331, 4.39538,
+           4.3981, 4.40035, 4.40298, 4.4049, 4.40804, 4.41043, 4.41347, 4.41683, 4.41953, 4.42229,
+           4.42454, 4.42743, 4.43035, 4.43326, 4.43577, 4.43842, 4.44141, 4.44363, 4.44646, 4.44895,
+           4.45182, 4.45525, 4.45724, 4.46084, 4.46396, 4.46675, 4.47037, 4.47285, 4.47611, 4.47964,
+           4.48252, 4.48609, 4.48952, 4.49261, 4.49587, 4.49967, 4.50326, 4.50705, 4.51044, 4.51521,
+           4.52007, 4.524, 4.52772, 4.53283, 4.53713, 4.54171, 4.54595, 4.55007, 4.55368, 4.55875,
+           4.56272, 4.56731, 4.57273, 4.57793, 4.58366, 4.58822, 4.59443, 4.59961, 4.60472, 4.61121,
+           4.61765, 4.62343, 4.63038, 4.63527, 4.64152, 4.64675, 4.65424, 4.66156, 4.6672, 4.67479,
+           4.68241, 4.69177, 4.7025, 4.71272, 4.72162, 4.73131, 4.73952, 4.75342, 4.76763, 4.78053,
+           4.79306, 4.80499, 4.8158, 4.82892, 4.84426, 4.86168, 4.87825, 4.89551, 4.91214, 4.93348,
+           4.9439, 4.96382, 4.98112, 4.99155, 5.01161, 5.02788, 5.04362, 5.06331, 5.09055, 5.11047,
+           5.12651, 5.15384, 5.1887, 5.21894, 5.25167, 5.30151, 5.35134, 5.41618]),
+    1023: ([0, 0.0124, 0.02502, 0.03756, 0.05008, 0.06267, 0.07532, 0.08783, 0.10036, 0.11286, 0.1256,
+            0.13833, 0.15098, 0.16377, 0.17643, 0.18936, 0.20208, 0.21505, 0.22799, 0.24098, 0.25388,
+            0.26705, 0.27992, 0.29302, 0.3061, 0.31952, 0.33273, 0.34612, 0.35945, 0.37271, 0.38616,
+            0.3998, 0.41333, 0.42685, 0.44071, 0.45462, 0.46884, 0.48291, 0.49693, 0.51098, 0.52541,
+            0.54005, 0.55495, 0.56974, 0.58459, 0.59962, 0.61503, 0.63007, 0.64549, 0.66105, 0.67504,
+            0.69103, 0.70696, 0.72301, 0.73946, 0.75584, 0.77253, 0.78977, 0.80718, 0.82478, 0.84243,
+            0.86041, 0.87856, 0.89704, 0.91595, 0.9353, 0.95498, 0.9751, 0.99584, 1.01654, 1.03775,
+            1.0595, 1.08189, 1.10462, 1.12804, 1.15222, 1.17699, 1.20198, 1.22848, 1.25538, 1.28308,
+            1.31231, 1.34207, 1.37349, 1.4063, 1.44059, 1.47703, 1.5155, 1.55714, 1.60133, 1.64861,
+            1.65354, 1.65872, 1.6638, 1.66871, 1.67365, 1.67877, 1.68419, 1.68942, 1.69488, 1.70023,
+            1.70562, 1.71096, 1.71624, 1.72181, 1.72721, 1.73301, 1.73868, 1.74429, 1.74978, 1.75554,
+            1.76132, 1.76728, 1.77312, 1.77929, 1.78547, 1.79199, 1.7982, 1.80438, 1.81081, 1.81711,
+            1.82366, 1.83015, 1.83704, 1.84413, 1.85107, 1.8584, 1.86572, 1.87281, 1.87995, 1.88753,
+            1.89492, 1.90263, 1.91036, 1.91805, 1.92635, 1.93473, 1.94279, 1.95075, 1.95927, 1.96808,
+            1.97719, 1.98574, 1.99501, 2.00418, 2.014, 2.02369, 2.03375, 2.04393, 2.05418, 2.06431,
+            2.07503, 2.08547, 2.09668, 2.10791, 2.11889, 2.13044, 2.14239, 2.15498, 2.1681, 2.18067,
+            2.19386, 2.20792, 2.22182, 2.23625, 2.25093, 2.26682, 2.28329, 2.30006, 2.31813, 2.33722,
+            2.35676, 2.37614, 2.39666, 2.41976, 2.44423, 2.46888, 2.49687, 2.52602, 2.55972, 2.59301,
+            2.5962, 2.5996, 2.60401, 2.60813, 2.61203, 2.61597, 2.61944, 2.62361, 2.6273, 2.63052,
+            2.63534, 2.6396, 2.64376, 2.64772, 2.65155, 2.65623, 2.65988, 2.66406, 2.66906, 2.67332,
+            2.67823, 2.68247, 2.68616, 2.69131, 2.69607, 2.70079, 2.70523, 2.70949, 2.71423, 2.7193,
+            2.72441, 2.7291, 2.73462, 2.73933, 2.74389, 2.74881, 2.75388, 2.76007, 2.76644, 2.77177,
+            2.77668, 2.78221, 2.78769, 2.79256, 2.79806, 2.80447, 2.8103, 2.81626, 2.82337, 2.82949,
+            2.83584, 2.84149, 2.84814, 2.85514, 2.86317, 2.87109, 2.87762, 2.88466, 2.89179, 2.90121,
+            2.90999, 2.91747, 2.92577, 2.93353, 2.94193, 2.95182, 2.96175, 2.97228, 2.98303, 2.99302,
+            3.00401, 3.01716, 3.02755, 3.03891, 3.04963, 3.05943, 3.07029, 3.08597, 3.10116, 3.11774,
+            3.13119, 3.14623, 3.16267, 3.18199, 3.20041, 3.21823, 3.23797, 3.26495, 3.28985, 3.31607,
+            3.33056, 3.34626, 3.36113, 3.37972, 3.39628, 3.41822, 3.43635, 3.46512, 3.48472, 3.51344,
+            3.53928, 3.56628, 3.60696, 3.64857, 3.69541, 3.76452, 3.82916, 3.93845],
+           [2.40151, 2.77939, 2.84149, 2.88077, 2.91133, 2.93678, 2.95854, 2.97782, 2.99547, 3.01159,
+            3.02675, 3.04125, 3.05516, 3.0679, 3.08031, 3.0924, 3.10326, 3.11394, 3.12475, 3.13542,
+            3.14596, 3.15603, 3.16623, 3.17572, 3.1853, 3.19468, 3.20399, 3.21316, 3.22225, 3.23141,
+            3.24001, 3.24841, 3.25709, 3.26565, 3.27445, 3.28337, 3.29211, 3.3007, 3.30916, 3.31756,
+            3.32605, 3.33447, 3.34295, 3.35163, 3.36, 3.36814, 3.37644, 3.38488, 3.39328, 3.40184,
+            3.41018, 3.41923, 3.42847, 3.43752, 3.44628, 3.45551, 3.46478, 3.47417, 3.4827, 3.4922,
+            3.50177, 3.51095, 3.52044, 3.52993, 3.5402, 3.55064, 3.56091, 3.57131, 3.58208, 3.59289,
+            3.60392, 3.61516, 3.62694, 3.63908, 3.65164, 3.66432, 3.67747, 3.69049, 3.7042, 3.71819,
+            3.73296, 3.74868, 3.76483, 3.78208, 3.80021, 3.81895, 3.83713, 3.85749, 3.88001, 3.90424,
+            3.93082, 3.93341, 3.93613, 3.93896, 3.94173, 3.94467, 3.94752, 3.95017, 3.95294, 3.95591,
+            3.95906, 3.96201, 3.965, 3.96796, 3.97101, 3.97415, 3.97737, 3.98061, 3.98349, 3.98666,
+            3.98996, 3.99333, 3.9971, 4.00051, 4.00374, 4.00713, 4.0108, 4.01407, 4.01777, 4.02128,
+            4.0247, 4.02846, 4.03209, 4.03572, 4.03959, 4.04369, 4.04752, 4.05213, 4.05616, 4.06009,
+            4.06414, 4.06884, 4.07291, 4.07702, 4.08165, 4.08597, 4.09039, 4.09506, 4.09964, 4.10463,
+            4.10949, 4.11455, 4.12, 4.12531, 4.13102, 4.13703, 4.14281, 4.14906, 4.15425, 4.15996,
+            4.16567, 4.17206, 4.1784, 4.18545, 4.19177, 4.19934, 4.20646, 4.21411, 4.22192, 4.22892,
+            4.23628, 4.24445, 4.25332, 4.26243, 4.26996, 4.27969, 4.2912, 4.30119, 4.31082, 4.32268,
+            4.33396, 4.34617, 4.3583, 4.37278, 4.38726, 4.40251, 4.41979, 4.4375, 4.45717, 4.47927,
+            4.50074, 4.50381, 4.50657, 4.5083, 4.51084, 4.51351, 4.51588, 4.5181, 4.52013, 4.52397,
+            4.52682, 4.53, 4.53224, 4.53461, 4.53685, 4.53924, 4.54229, 4.54445, 4.54719, 4.54913,
+            4.55214, 4.55557, 4.55834, 4.56264, 4.56514, 4.56763, 4.57048, 4.57432, 4.57749, 4.58114,
+            4.58498, 4.58835, 4.59136, 4.59519, 4.59862, 4.60213, 4.60694, 4.61057, 4.61357, 4.61642,
+            4.62037, 4.62309, 4.62529, 4.62916, 4.63154, 4.6374, 4.63972, 4.64388, 4.64915, 4.65357,
+            4.65766, 4.6613, 4.66948, 4.67525, 4.67827, 4.68194, 4.6895, 4.69271, 4.69692, 4.70139,
+            4.70504, 4.70936, 4.71505, 4.72416, 4.72863, 4.73418, 4.74135, 4.74755, 4.75484, 4.76026,
+            4.76717, 4.77392, 4.78246, 4.79057, 4.7992, 4.80462, 4.81376, 4.8201, 4.82771, 4.83512,
+            4.84437, 4.85642, 4.86522, 4.87546, 4.88911, 4.90114, 4.91576, 4.92968, 4.94447, 4.96025,
+            4.98236, 4.99185, 4.99722, 5.00918, 5.02133, 5.03428, 5.04875, 5.05799, 5.06976, 5.08997,
+            5.11655, 5.15652, 5.17934, 5.212, 5.23609, 5.28277, 5.33564, 5.39912, 5.47384]),
+    2047: ([0, 0.01271, 0.0254, 0.03795, 0.05055, 0.06319, 0.07597, 0.08848, 0.10083, 0.11335, 0.12599,
+            0.13847, 0.15118, 0.16399, 0.17688, 0.18967, 0.20245, 0.21518, 0.22793, 0.24088, 0.25372,
+            0.26655, 0.27974, 0.29273, 0.30559, 0.31859, 0.33176, 0.34495, 0.35828, 0.37163, 0.3854,
+            0.39892, 0.41258, 0.42624, 0.44038, 0.45414, 0.46803, 0.48213, 0.49623, 0.51051, 0.52502,
+            0.53976, 0.55432, 0.56891, 0.58355, 0.59875, 0.61387, 0.62903, 0.6444, 0.65987, 0.67468,
+            0.69066, 0.70684, 0.72301, 0.73913, 0.75582, 0.77238, 0.78955, 0.80665, 0.82404, 0.84205,
+            0.86023, 0.8786, 0.8971, 0.91587, 0.93535, 0.95524, 0.97535, 0.99556, 1.01657, 1.03823,
+            1.06002, 1.08235, 1.10458, 1.12806, 1.15202, 1.17675, 1.20231, 1.22847, 1.25601, 1.28412,
+            1.31324, 1.34351, 1.37467, 1.40776, 1.44227, 1.4787, 1.51752, 1.55809, 1.60166, 1.64828,
+            1.65326, 1.65811, 1.66286, 1.66791, 1.67287, 1.67795, 1.68304, 1.68833, 1.69358, 1.6987,
+            1.70385, 1.70926, 1.71458, 1.72022, 1.72553, 1.73094, 1.73665, 1.74214, 1.74766, 1.75341,
+            1.75936, 1.76511, 1.77084, 1.77693, 1.78295, 1.78898, 1.79527, 1.80178, 1.8079, 1.81431,
+            1.82087, 1.82752, 1.83401, 1.84097, 1.84778, 1.8543, 1.86126, 1.86796, 1.87513, 1.88229,
+            1.88974, 1.89697, 1.90477, 1.91275, 1.9206, 1.92866, 1.93661, 1.94412, 1.95233, 1.96091,
+            1.96944, 1.97866, 1.98763, 1.99653, 2.0053, 2.01488, 2.02406, 2.03388, 2.04372, 2.05347,
+            2.06433, 2.07473, 2.08557, 2.09645, 2.1078, 2.12001, 2.1323, 2.14553, 2.15858, 2.17128,
+            2.18447, 2.19842, 2.21282, 2.22739, 2.24356, 2.25945, 2.27609, 2.2928, 2.31078, 2.3296,
+            2.3492, 2.36973, 2.39052, 2.41287, 2.4369, 2.46236, 2.48926, 2.51759, 2.54824, 2.58266,
+            2.58673, 2.58993, 2.59282, 2.59697, 2.60053, 2.60446, 2.60834, 2.61164, 2.61541, 2.61938,
+            2.62367, 2.62729, 2.63081, 2.63476, 2.63815, 2.64193, 2.64572, 2.64993, 2.65375, 2.6578,
+            2.66202, 2.66632, 2.67016, 2.67424, 2.67956, 2.68395, 2.68826, 2.69305, 2.69776, 2.70322,
+            2.70853, 2.71282, 2.71789, 2.72329, 2.72847, 2.73414, 2.73926, 2.74375, 2.74966, 2.75532,
+            2.76113, 2.76694, 2.77267, 2.77773, 2.78259, 2.78844, 2.79418, 2.80022, 2.80614, 2.81219,
+            2.81817, 2.82448, 2.83188, 2.83864, 2.84517, 2.85242, 2.85968, 2.86758, 2.87646, 2.88535,
+            2.89334, 2.90219, 2.91062, 2.91988, 2.92783, 2.93716, 2.94595, 2.95461, 2.96265, 2.97128,
+            2.98065, 2.99061, 3.00394, 3.01556, 3.02655, 3.03926, 3.05298, 3.06611, 3.08367, 3.09703,
+            3.11509, 3.13134, 3.14904, 3.16723, 3.18709, 3.20931, 3.23025, 3.25154, 3.2777, 3.30445,
+            3.32019, 3.33649, 3.35437, 3.37208, 3.39004, 3.41219, 3.43513, 3.45448, 3.4795, 3.51067,
+            3.54921, 3.58583, 3.62396, 3.65887, 3.70857, 3.76643, 3.8389, 3.94567],
+           [2.68821, 3.02166, 3.0739, 3.10871, 3.13701, 3.16049, 3.18029, 3.19805, 3.21404, 3.22825,
+            3.24328, 3.25653, 3.26831, 3.28004, 3.2916, 3.30251, 3.31299, 3.32321, 3.33279, 3.34222,
+            3.35221, 3.36099, 3.37019, 3.37908, 3.38744, 3.39628, 3.40495, 3.41285, 3.42062, 3.42886,
+            3.43683, 3.4451, 3.45348, 3.46105, 3.46881, 3.47664, 3.48438, 3.49209, 3.49973, 3.5072,
+            3.51509, 3.52267, 3.53043, 3.53863, 3.5463, 3.55404, 3.56195, 3.57023, 3.57796, 3.5859,
+            3.59355, 3.60148, 3.60944, 3.61728, 3.62568, 3.63383, 3.64196, 3.65043, 3.65907, 3.66751,
+            3.67593, 3.6842, 3.69324, 3.70265, 3.71197, 3.72191, 3.73111, 3.74026, 3.75017, 3.76004,
+            3.77035, 3.78122, 3.79221, 3.80386, 3.8157, 3.82747, 3.83948, 3.85233, 3.866, 3.87922,
+            3.89323, 3.9082, 3.92331, 3.93877, 3.95568, 3.97217, 3.99123, 4.01058, 4.0328, 4.05605,
+            4.08131, 4.08431, 4.08677, 4.08947, 4.09212, 4.09476, 4.09733, 4.09981, 4.10283, 4.10541,
+            4.10842, 4.11126, 4.11405, 4.11678, 4.11949, 4.12245, 4.12534, 4.12848, 4.13131, 4.13419,
+            4.13762, 4.14051, 4.14374, 4.14675, 4.15062, 4.15384, 4.1567, 4.15961, 4.16324, 4.16681,
+            4.17018, 4.17325, 4.17741, 4.18135, 4.18555, 4.18829, 4.19212, 4.19601, 4.19935, 4.20359,
+            4.20767, 4.21206, 4.21574, 4.22026, 4.22478, 4.22978, 4.23482, 4.23987, 4.24372, 4.2483,
+            4.25219, 4.2562, 4.26116, 4.26688, 4.27158, 4.27831, 4.28258, 4.28815, 4.29325, 4.2989,
+            4.30464, 4.31098, 4.31671, 4.32304, 4.32859, 4.33459, 4.34199, 4.34907, 4.35641, 4.3641,
+            4.37134, 4.37795, 4.38597, 4.39462, 4.40213, 4.41142, 4.41901, 4.42771, 4.43827, 4.44776,
+            4.45893, 4.46885, 4.48118, 4.493, 4.50727, 4.5216, 4.53603, 4.55123, 4.57032, 4.59201,
+            4.61047, 4.61298, 4.61461, 4.61781, 4.62041, 4.62338, 4.62544, 4.62753, 4.62939, 4.63226,
+            4.63365, 4.63597, 4.63862, 4.6407, 4.64315, 4.64563, 4.64703, 4.64833, 4.65091, 4.65234,
+            4.65379, 4.65833, 4.6592, 4.662, 4.66663, 4.67015, 4.67444, 4.67742, 4.68201, 4.68483,
+            4.68696, 4.69008, 4.69203, 4.69503, 4.69975, 4.70124, 4.70317, 4.70791, 4.71231, 4.71658,
+            4.72024, 4.72309, 4.72579, 4.73011, 4.73504, 4.73888, 4.74118, 4.74477, 4.74717, 4.7521,
+            4.75574, 4.76047, 4.76624, 4.76947, 4.77366, 4.77739, 4.78047, 4.78477, 4.78911, 4.7924,
+            4.79954, 4.80336, 4.80573, 4.81292, 4.81908, 4.82659, 4.83405, 4.83857, 4.84268, 4.85052,
+            4.85466, 4.86129, 4.87035, 4.88149, 4.89161, 4.90124, 4.90911, 4.91845, 4.93105, 4.94115,
+            4.9503, 4.96608, 4.9818, 4.99181, 5.00641, 5.01966, 5.02835, 5.04346, 5.06284, 5.07398,
+            5.09712, 5.10603, 5.11678, 5.13629, 5.14877, 5.16273, 5.17686, 5.18592, 5.20325, 5.21149,
+            5.22046, 5.23881, 5.25099, 5.28787, 5.31394, 5.36451, 5.38549, 5.47906, 5.56644]),
+    4095: ([0, 0.01263, 0.02508, 0.03763, 0.04992, 0.06256, 0.07507, 0.08754, 0.10038, 0.11289, 0.12551,
+            0.13825, 0.15094, 0.16351, 0.17628, 0.18929, 0.20209, 0.21489, 0.22778, 0.24051, 0.25355,
+            0.26639, 0.27941, 0.29239, 0.30547, 0.31871, 0.33196, 0.3454, 0.35867, 0.37192, 0.38536,
+            0.39913, 0.41292, 0.42671, 0.44053, 0.45417, 0.46821, 0.48235, 0.49639, 0.51091, 0.52519,
+            0.53976, 0.55428, 0.56902, 0.58429, 0.59913, 0.61426, 0.62944, 0.64474, 0.66002, 0.67535,
+            0.69121, 0.70723, 0.72354, 0.73968, 0.75641, 0.77322, 0.79013, 0.80736, 0.82488, 0.8426,
+            0.86077, 0.8793, 0.89804, 0.91712, 0.93639, 0.95609, 0.97578, 0.99647, 1.01729, 1.03827,
+            1.0601, 1.08228, 1.10487, 1.1284, 1.1529, 1.17785, 1.20297, 1.22957, 1.25724, 1.28503,
+            1.31382, 1.34459, 1.37623, 1.40884, 1.44289, 1.47893, 1.51714, 1.55797, 1.60152, 1.64837,
+            1.65297, 1.6579, 1.6631, 1.66806, 1.67297, 1.67795, 1.68301, 1.68817, 1.6935, 1.69876,
+            1.70401, 1.7091, 1.71435, 1.71995, 1.72553, 1.73102, 1.73675, 1.74273, 1.74853, 1.7544,
+            1.76051, 1.76617, 1.77233, 1.7783, 1.78438, 1.79066, 1.79695, 1.8032, 1.80966, 1.81611,
+            1.82233, 1.8289, 1.83533, 1.84195, 1.84881, 1.85613, 1.86316, 1.87015, 1.87738, 1.88452,
+            1.89185, 1.89931, 1.90718, 1.91492, 1.92284, 1.9307, 1.93895, 1.94735, 1.9558, 1.96413,
+            1.97296, 1.98165, 1.99096, 2.0002, 2.00954, 2.0189, 2.02848, 2.03834, 2.04813, 2.05833,
+            2.06924, 2.07964, 2.09064, 2.10216, 2.11336, 2.12466, 2.13714, 2.14978, 2.16258, 2.17653,
+            2.19025, 2.20403, 2.21855, 2.23358, 2.24895, 2.26458, 2.28079, 2.29806, 2.3153, 2.33363,
+            2.35223, 2.37303, 2.39477, 2.41645, 2.44035, 2.46491, 2.49138, 2.51907, 2.54813, 2.58093,
+            2.58444, 2.58755, 2.59085, 2.59445, 2.59812, 2.60143, 2.60531, 2.60876, 2.61287, 2.61715,
+            2.62054, 2.6244, 2.62804, 2.63151, 2.63547, 2.63932, 2.64312, 2.64668, 2.65092, 2.65532,
+            2.65923, 2.66346, 2.6681, 2.67362, 2.67824, 2.68266, 2.68782, 2.69208, 2.69676, 2.70133,
+            2.70622, 2.71071, 2.71507, 2.72005, 2.72437, 2.73019, 2.73584, 2.74118, 2.74672, 2.75186,
+            2.75677, 2.76235, 2.76883, 2.77489, 2.78113, 2.78607, 2.79201, 2.79756, 2.80442, 2.81016,
+            2.81658, 2.82312, 2.82948, 2.83644, 2.84349, 2.85169, 2.85881, 2.86734, 2.87523, 2.88379,
+            2.89169, 2.89963, 2.90819, 2.91603, 2.92544, 2.93433, 2.94225, 2.95049, 2.96159, 2.97197,
+            2.98226, 2.99142, 3.001, 3.01261, 3.02291, 3.03705, 3.05087, 3.06403, 3.07957, 3.09318,
+            3.10804, 3.12703, 3.14206, 3.16085, 3.17749, 3.1987, 3.22229, 3.2466, 3.26887, 3.29413,
+            3.30921, 3.32242, 3.34344, 3.35907, 3.3758, 3.39163, 3.40995, 3.42984, 3.46205, 3.48337,
+            3.51145, 3.54189, 3.57506, 3.61729, 3.66108, 3.72125, 3.78157, 3.8945],
+           [2.98742, 3.23912, 3.28956, 3.32222, 3.34735, 3.36776, 3.385, 3.40147, 3.41652, 3.43089,
+            3.44393, 3.45606, 3.46709, 3.47858, 3.4887, 3.49968, 3.5092, 3.51904, 3.52787, 3.53689,
+            3.54482, 3.55277, 3.56067, 3.56896, 3.5766, 3.58441, 3.59256, 3.60077, 3.6086, 3.61685,
+            3.62445, 3.63197, 3.64013, 3.64722, 3.65562, 3.66282, 3.6697, 3.67685, 3.68404, 3.69166,
+            3.69846, 3.70539, 3.71295, 3.71967, 3.72709, 3.73435, 3.74216, 3.74972, 3.75694, 3.76461,
+            3.77226, 3.77985, 3.78767, 3.79623, 3.80369, 3.81111, 3.81878, 3.8264, 3.83441, 3.84181,
+            3.84959, 3.85704, 3.86584, 3.87436, 3.88311, 3.89245, 3.9022, 3.91155, 3.92065, 3.92935,
+            3.93905, 3.95001, 3.96002, 3.97082, 3.98102, 3.99078, 4.0028, 4.01431, 4.026, 4.03933,
+            4.05337, 4.06633, 4.07954, 4.09417, 4.10926, 4.12512, 4.14365, 4.16165, 4.18175, 4.20343,
+            4.22607, 4.22846, 4.23122, 4.23364, 4.23636, 4.23911, 4.2422, 4.24458, 4.24781, 4.25048,
+            4.25358, 4.25578, 4.2581, 4.26098, 4.26367, 4.26653, 4.26951, 4.27273, 4.27525, 4.27776,
+            4.28054, 4.2834, 4.28674, 4.2899, 4.29293, 4.29626, 4.29942, 4.30258, 4.30578, 4.30992,
+            4.31274, 4.31567, 4.31918, 4.32339, 4.3266, 4.33025, 4.33312, 4.33665, 4.34135, 4.3438,
+            4.34807, 4.35103, 4.35464, 4.35854, 4.36212, 4.36702, 4.37014, 4.37458, 4.3789, 4.384,
+            4.38813, 4.39294, 4.39805, 4.40198, 4.40842, 4.41552, 4.42055, 4.42595, 4.43134, 4.43754,
+            4.44292, 4.44874, 4.45471, 4.46114, 4.46702, 4.47311, 4.47835, 4.48614, 4.4923, 4.49918,
+            4.50662, 4.51538, 4.52287, 4.53023, 4.53839, 4.548, 4.55701, 4.56768, 4.57659, 4.58526,
+            4.5936, 4.60622, 4.61791, 4.62814, 4.64082, 4.65214, 4.66783, 4.684, 4.70167, 4.72114,
+            4.73926, 4.74148, 4.74302, 4.74558, 4.74774, 4.74897, 4.75234, 4.75667, 4.75919, 4.76065,
+            4.76346, 4.76622, 4.76827, 4.76886, 4.76994, 4.77342, 4.77582, 4.77775, 4.78182, 4.78432,
+            4.78583, 4.78775, 4.79257, 4.79531, 4.79625, 4.80167, 4.80378, 4.80628, 4.80878, 4.81104,
+            4.81293, 4.81684, 4.8219, 4.82309, 4.82535, 4.82926, 4.83162, 4.83823, 4.83947, 4.84172,
+            4.84562, 4.84997, 4.85696, 4.86073, 4.86502, 4.8709, 4.87241, 4.87724, 4.87881, 4.88201,
+            4.8843, 4.88738, 4.89122, 4.89398, 4.89856, 4.90116, 4.90576, 4.90928, 4.91834, 4.9222,
+            4.92529, 4.92864, 4.93329, 4.93857, 4.94319, 4.95113, 4.95612, 4.96341, 4.9698, 4.97789,
+            4.98153, 4.98825, 4.99679, 4.99876, 5.00778, 5.01131, 5.02255, 5.02753, 5.03581, 5.041,
+            5.05869, 5.07358, 5.07773, 5.08909, 5.10043, 5.10691, 5.12481, 5.13509, 5.13844, 5.15596,
+            5.175, 5.1802, 5.20137, 5.20608, 5.23209, 5.24856, 5.26093, 5.26454, 5.29737, 5.31962,
+            5.33352, 5.34986, 5.36897, 5.39148, 5.40678, 5.43561, 5.51904, 5.60007, 5.72332]),
+    8191: ([0, 0.01257, 0.0252, 0.03794, 0.0504, 0.06293, 0.07546, 0.08804, 0.10045, 0.11287, 0.12563,
+            0.13851, 0.15139, 0.16418, 0.17705, 0.18985, 0.2026, 0.21533, 0.22808, 0.2408, 0.25359,
+            0.26642, 0.27922, 0.29217, 0.30524, 0.31879, 0.33174, 0.345, 0.35851, 0.37192, 0.38537,
+            0.39884, 0.41263, 0.42638, 0.44007, 0.45415, 0.46813, 0.48214, 0.49605, 0.51031, 0.52487,
+            0.53902, 0.55353, 0.56823, 0.58304, 0.59791, 0.61333, 0.62847, 0.64368, 0.65925, 0.67452,
+            0.69035, 0.70634, 0.72238, 0.73856, 0.75511, 0.77208, 0.78918, 0.80651, 0.82394, 0.8418, 0.86,
+            0.87834, 0.8969, 0.91599, 0.9354, 0.95487, 0.97479, 0.99493, 1.01535, 1.03639, 1.0582,
+            1.08062, 1.1037, 1.12693, 1.15077, 1.17523, 1.20067, 1.22707, 1.25377, 1.28184, 1.31083,
+            1.34046, 1.37154, 1.40477, 1.43907, 1.4759, 1.51474, 1.55556, 1.59952, 1.64679, 1.65195,
+            1.65697, 1.66218, 1.66729, 1.67251, 1.67755, 1.6826, 1.68763, 1.69299, 1.69821, 1.70371,
+            1.70926, 1.7145, 1.71973, 1.72535, 1.73079, 1.73623, 1.74205, 1.74793, 1.7538, 1.75949,
+            1.76557, 1.77178, 1.77792, 1.78417, 1.79007, 1.7966, 1.80306, 1.80906, 1.81585, 1.82247,
+            1.82907, 1.83553, 1.84232, 1.84946, 1.85663, 1.86379, 1.87079, 1.87786, 1.8854, 1.89283,
+            1.90007, 1.90788, 1.91557, 1.92357, 1.93151, 1.93991, 1.94816, 1.95638, 1.96505, 1.97346,
+            1.98158, 1.99, 1.99937, 2.00808, 2.01718, 2.02669, 2.03638, 2.0463, 2.05627, 2.06686, 2.0771,
+            2.08827, 2.09966, 2.11108, 2.12328, 2.13523, 2.14777, 2.16099, 2.17407, 2.18798, 2.2016,
+            2.21538, 2.23118, 2.24601, 2.26147, 2.27757, 2.29479, 2.31239, 2.32999, 2.34925, 2.37076,
+            2.39137, 2.41326, 2.43698, 2.46198, 2.48975, 2.51778, 2.54898, 2.58411, 2.58793, 2.59149,
+            2.59435, 2.59816, 2.60172, 2.60544, 2.60936, 2.61318, 2.61671, 2.62018, 2.62442, 2.6281,
+            2.63171, 2.63628, 2.64021, 2.6438, 2.64789, 2.65153, 2.65579, 2.66044, 2.66488, 2.66891,
+            2.67394, 2.67802, 2.68283, 2.68813, 2.69271, 2.69694, 2.7012, 2.70672, 2.7116, 2.71575,
+            2.72043, 2.72471, 2.72975, 2.7349, 2.73967, 2.74496, 2.75084, 2.7553, 2.75994, 2.76569,
+            2.77139, 2.77708, 2.78252, 2.78929, 2.7948, 2.80178, 2.80856, 2.81381, 2.82098, 2.82836,
+            2.83531, 2.84151, 2.84785, 2.85572, 2.86215, 2.8692, 2.87607, 2.88373, 2.89144, 2.90032,
+            2.90817, 2.91813, 2.92616, 2.9357, 2.94487, 2.95587, 2.96567, 2.97609, 2.98916, 3.00072,
+            3.01297, 3.02308, 3.03541, 3.04582, 3.06015, 3.07331, 3.08835, 3.10234, 3.11786, 3.13406,
+            3.1529, 3.16974, 3.19025, 3.21063, 3.2312, 3.25375, 3.28625, 3.31092, 3.32376, 3.34112,
+            3.35649, 3.37332, 3.39133, 3.40915, 3.42736, 3.45086, 3.47665, 3.50561, 3.53836, 3.56871,
+            3.60682, 3.64494, 3.69308, 3.74465, 3.79922, 3.87187],
+           [3.16027, 3.43623, 3.48567, 3.51545, 3.53895, 3.55825, 3.57546, 3.59022, 3.60502, 3.61835,
+            3.63032, 3.64038, 3.65195, 3.66089, 3.67099, 3.67927, 3.68871, 3.69781, 3.70602, 3.71529,
+            3.72326, 3.73071, 3.73776, 3.74547, 3.75385, 3.7613, 3.76848, 3.77623, 3.78355, 3.79071,
+            3.79806, 3.80561, 3.81317, 3.82066, 3.82801, 3.83464, 3.84211, 3.84816, 3.85431, 3.86104,
+            3.86773, 3.87453, 3.88186, 3.88931, 3.89565, 3.90222, 3.9095, 3.91673, 3.92361, 3.93062,
+            3.93784, 3.94477, 3.9516, 3.9587, 3.96565, 3.97236, 3.98001, 3.98756, 3.99668, 4.00419,
+            4.01158, 4.01906, 4.02644, 4.03374, 4.0423, 4.05026, 4.05843, 4.06729, 4.07533, 4.0847,
+            4.09447, 4.10313, 4.11229, 4.12256, 4.13223, 4.14293, 4.15453, 4.16632, 4.17855, 4.19059,
+            4.20276, 4.21701, 4.22969, 4.2443, 4.25855, 4.27363, 4.29111, 4.30833, 4.32767, 4.34661,
+            4.36965, 4.37216, 4.37386, 4.37685, 4.37972, 4.38161, 4.38419, 4.3867, 4.38917, 4.39278,
+            4.39634, 4.39855, 4.40144, 4.40365, 4.40656, 4.40942, 4.41322, 4.41608, 4.41856, 4.42125,
+            4.42431, 4.42623, 4.43029, 4.43319, 4.43682, 4.43875, 4.44167, 4.44548, 4.44769, 4.45054,
+            4.45294, 4.45655, 4.45919, 4.46259, 4.46641, 4.47046, 4.47393, 4.4777, 4.48051, 4.48288,
+            4.48553, 4.48902, 4.49203, 4.49623, 4.50034, 4.50461, 4.50888, 4.51269, 4.51914, 4.52434,
+            4.52867, 4.53359, 4.53728, 4.54101, 4.54458, 4.54993, 4.55484, 4.56177, 4.56636, 4.57226,
+            4.57673, 4.5826, 4.58982, 4.59443, 4.59923, 4.6056, 4.61161, 4.61996, 4.6264, 4.63224,
+            4.63585, 4.64118, 4.65034, 4.65829, 4.66738, 4.67645, 4.68439, 4.69295, 4.70046, 4.70914,
+            4.71832, 4.73124, 4.7422, 4.75063, 4.76031, 4.77646, 4.79024, 4.80218, 4.8236, 4.83892,
+            4.86302, 4.86484, 4.86659, 4.87089, 4.87177, 4.8728, 4.87327, 4.87407, 4.87622, 4.87824,
+            4.87925, 4.88074, 4.88456, 4.88758, 4.89213, 4.89413, 4.89833, 4.90086, 4.90214, 4.90352,
+            4.90636, 4.90854, 4.9098, 4.91102, 4.91141, 4.91227, 4.91635, 4.9193, 4.92124, 4.9235,
+            4.92567, 4.92634, 4.92792, 4.93251, 4.93358, 4.93576, 4.93936, 4.94282, 4.9456, 4.94869,
+            4.95017, 4.95111, 4.95442, 4.9624, 4.96354, 4.96571, 4.9698, 4.97512, 4.9767, 4.97875,
+            4.98257, 4.987, 4.98989, 4.99331, 4.99509, 5.00009, 5.00283, 5.0052, 5.00664, 5.00988,
+            5.01368, 5.01971, 5.02752, 5.03082, 5.0343, 5.03876, 5.04092, 5.04606, 5.05062, 5.05408,
+            5.05762, 5.06111, 5.067, 5.07923, 5.08372, 5.08885, 5.09185, 5.09816, 5.10026, 5.10838,
+            5.11296, 5.12049, 5.1237, 5.13449, 5.14877, 5.15636, 5.15961, 5.17568, 5.19437, 5.22574,
+            5.23839, 5.25374, 5.25832, 5.26919, 5.29105, 5.30439, 5.31163, 5.31615, 5.33738, 5.34985,
+            5.3532, 5.35838, 5.42449, 5.45113, 5.49487, 5.56353, 5.57659, 5.63925, 5.7055]),
+    16383: ([0, 0.01248, 0.02517, 0.03779, 0.05049, 0.06326, 0.07589, 0.08831, 0.10091, 0.11341, 0.12603,
+             0.1385, 0.15132, 0.16409, 0.17693, 0.18976, 0.20267, 0.21547, 0.22834, 0.24131, 0.25395,
+             0.26699, 0.27987, 0.29301, 0.30618, 0.3193, 0.33277, 0.34607, 0.35937, 0.37276, 0.38628,
+             0.39988, 0.41358, 0.42728, 0.44133, 0.4551, 0.4689, 0.48306, 0.49708, 0.51119, 0.52544,
+             0.53967, 0.55405, 0.56887, 0.58373, 0.59867, 0.6137, 0.62901, 0.6446, 0.66024, 0.67603,
+             0.69205, 0.70819, 0.72443, 0.74121, 0.75791, 0.77457, 0.79145, 0.80839, 0.82573, 0.84348,
+             0.86142, 0.87973, 0.89854, 0.91734, 0.93667, 0.95635, 0.97606, 0.99639, 1.0174, 1.03871,
+             1.06066, 1.08306, 1.10566, 1.12887, 1.15258, 1.17734, 1.20242, 1.22869, 1.25609, 1.28387,
+             1.3132, 1.34375, 1.37509, 1.40758, 1.4423, 1.47876, 1.51779, 1.55842, 1.60169, 1.64889,
+             1.65381, 1.65835, 1.66296, 1.66758, 1.67274, 1.67787, 1.68289, 1.68794, 1.69303, 1.69857,
+             1.70394, 1.70936, 1.7149, 1.72027, 1.72586, 1.73142, 1.73719, 1.74313, 1.74892, 1.75459,
+             1.76046, 1.76644, 1.77211, 1.77818, 1.78423, 1.7905, 1.7969, 1.80322, 1.80924, 1.81573,
+             1.82226, 1.82897, 1.83558, 1.84225, 1.84935, 1.85591, 1.86322, 1.87043, 1.8777, 1.88493,
+             1.89232, 1.89969, 1.90772, 1.91542, 1.92384, 1.93196, 1.93994, 1.94767, 1.95543, 1.96361,
+             1.97243, 1.98119, 1.98973, 1.99891, 2.00841, 2.01792, 2.02711, 2.03731, 2.04724, 2.05813,
+             2.06882, 2.07956, 2.09034, 2.10104, 2.11296, 2.12463, 2.13623, 2.1489, 2.16115, 2.17453,
+             2.18819, 2.20312, 2.21858, 2.23263, 2.24833, 2.26349, 2.28034, 2.29755, 2.31561, 2.33518,
+             2.35451, 2.37514, 2.39645, 2.41863, 2.44208, 2.46734, 2.49497, 2.52288, 2.55449, 2.5868,
+             2.58967, 2.59304, 2.59683, 2.60077, 2.60425, 2.60772, 2.61122, 2.6152, 2.61924, 2.62277,
+             2.62638, 2.63048, 2.63441, 2.63898, 2.64293, 2.64741, 2.65099, 2.65506, 2.65928, 2.66293,
+             2.66769, 2.67171, 2.67642, 2.68071, 2.68556, 2.69034, 2.69445, 2.69896, 2.70413, 2.71018,
+             2.71543, 2.72024, 2.72494, 2.72993, 2.73468, 2.73965, 2.74509, 2.7501, 2.75563, 2.76067,
+             2.76629, 2.77235, 2.77946, 2.78511, 2.79109, 2.79639, 2.80263, 2.80854, 2.81531, 2.82065,
+             2.82655, 2.83288, 2.84004, 2.84666, 2.8537, 2.86158, 2.86874, 2.87596, 2.88375, 2.8914,
+             2.89869, 2.90736, 2.9152, 2.92412, 2.93215, 2.94206, 2.95204, 2.96318, 2.97353, 2.9837,
+             2.99393, 3.00558, 3.01629, 3.02551, 3.03828, 3.04858, 3.06003, 3.07515, 3.08905, 3.10355,
+             3.11992, 3.13754, 3.15277, 3.16984, 3.19118, 3.21341, 3.23157, 3.25597, 3.28555, 3.31695,
+             3.33041, 3.3424, 3.36282, 3.38115, 3.39855, 3.41946, 3.43728, 3.45928, 3.47796, 3.50307,
+             3.52675, 3.55238, 3.58055, 3.62541, 3.68359, 3.74365, 3.82652, 3.93853],
+            [3.39394, 3.62501, 3.66812, 3.69807, 3.72144, 3.73998, 3.75591, 3.7693, 3.78322, 3.79545,
+             3.80585, 3.81626, 3.82623, 3.83504, 3.84361, 3.85285, 3.86094, 3.87051, 3.87878, 3.88765,
+             3.89681, 3.90404, 3.91356, 3.92219, 3.92938, 3.9374, 3.94494, 3.95147, 3.9582, 3.96465,
+             3.97185, 3.97851, 3.98466, 3.99119, 3.99708, 4.00301, 4.00906, 4.01464, 4.02102, 4.0278,
+             4.03367, 4.04003, 4.04653, 4.05307, 4.05996, 4.0663, 4.07353, 4.08098, 4.08805, 4.09515,
+             4.10166, 4.11044, 4.11815, 4.12513, 4.132, 4.13974, 4.14762, 4.15494, 4.16146, 4.16987,
+             4.17775, 4.18584, 4.19292, 4.19978, 4.20762, 4.216, 4.22481, 4.2341, 4.2419, 4.25006,
+             4.25883, 4.26921, 4.27807, 4.28821, 4.2987, 4.3095, 4.32098, 4.33195, 4.34215, 4.3533,
+             4.36575, 4.37847, 4.39058, 4.40587, 4.42124, 4.43926, 4.45753, 4.47777, 4.49539, 4.51358,
+             4.5375, 4.53914, 4.54294, 4.54432, 4.54686, 4.5491, 4.55112, 4.55344, 4.55563, 4.55797,
+             4.56066, 4.56265, 4.5653, 4.56647, 4.57031, 4.5721, 4.57401, 4.57631, 4.57931, 4.58218,
+             4.58485, 4.58692, 4.58984, 4.59206, 4.5953, 4.59726, 4.60008, 4.60412, 4.60725, 4.61053,
+             4.61304, 4.61643, 4.61885, 4.62313, 4.62687, 4.62963, 4.63297, 4.6377, 4.64235, 4.64511,
+             4.65013, 4.65365, 4.65851, 4.6624, 4.66547, 4.66868, 4.67288, 4.67682, 4.68031, 4.68505,
+             4.68848, 4.69205, 4.69604, 4.69949, 4.70381, 4.70817, 4.71419, 4.71675, 4.7224, 4.72549,
+             4.72973, 4.73635, 4.74356, 4.74802, 4.75353, 4.76095, 4.76723, 4.7731, 4.7814, 4.78781,
+             4.79476, 4.80463, 4.81335, 4.81903, 4.82347, 4.83323, 4.84246, 4.84805, 4.8562, 4.861,
+             4.87156, 4.88189, 4.89631, 4.90631, 4.91823, 4.92761, 4.94018, 4.95476, 4.97009, 4.98941,
+             5.00832, 5.01076, 5.01238, 5.01697, 5.02057, 5.02144, 5.02392, 5.02647, 5.02826, 5.02977,
+             5.03427, 5.04207, 5.04888, 5.05112, 5.05314, 5.0552, 5.05652, 5.06305, 5.06618, 5.06921,
+             5.07831, 5.08202, 5.08593, 5.09095, 5.09166, 5.09392, 5.09502, 5.09703, 5.09992, 5.10113,
+             5.10154, 5.1038, 5.10858, 5.11166, 5.1141, 5.1164, 5.12134, 5.12291, 5.12509, 5.12758,
+             5.12838, 5.12951, 5.13274, 5.13431, 5.13487, 5.13518, 5.13799, 5.14389, 5.15256, 5.16115,
+             5.1629, 5.16448, 5.16846, 5.17772, 5.18302, 5.18631, 5.1919, 5.19961, 5.20336, 5.2056,
+             5.20797, 5.21239, 5.21367, 5.2177, 5.22194, 5.22274, 5.22672, 5.23247, 5.23461, 5.24746,
+             5.25951, 5.26524, 5.26972, 5.27192, 5.27784, 5.29422, 5.3019, 5.30259, 5.31479, 5.3209,
+             5.33136, 5.34098, 5.35303, 5.37013, 5.39015, 5.39666, 5.4044, 5.41337, 5.42754, 5.44504,
+             5.46646, 5.47356, 5.47877, 5.49528, 5.50548, 5.50563, 5.51757, 5.53409, 5.5555, 5.56944,
+             5.57494, 5.57946, 5.58359, 5.58698, 5.59095, 5.59539, 5.62163, 5.6731, 5.78517]),
+    32767: ([0, 0.01256, 0.02504, 0.03748, 0.05006, 0.06262, 0.07513, 0.08783, 0.10045, 0.11297, 0.12563,
+             0.13826, 0.151, 0.16367, 0.17631, 0.18914, 0.20221, 0.21489, 0.22774, 0.24047, 0.25359,
+             0.2666, 0.27952, 0.29261, 0.30585, 0.31917, 0.33234, 0.34583, 0.35923, 0.3726, 0.38633,
+             0.39969, 0.4133, 0.42712, 0.44109, 0.455, 0.46875, 0.48299, 0.49702, 0.51143, 0.52558,
+             0.54018, 0.55456, 0.56904, 0.58374, 0.59863, 0.61393, 0.62913, 0.64417, 0.65968, 0.67561,
+             0.69127, 0.70725, 0.72376, 0.74008, 0.75643, 0.77305, 0.79001, 0.80719, 0.82498, 0.84263,
+             0.86083, 0.87883, 0.89739, 0.91638, 0.93586, 0.95561, 0.97533, 0.99584, 1.01686, 1.03799,
+             1.05982, 1.08188, 1.10465, 1.12829, 1.15277, 1.17729, 1.20266, 1.2288, 1.25617, 1.28427,
+             1.31324, 1.34323, 1.37479, 1.40749, 1.44194, 1.47865, 1.51761, 1.55824, 1.60086, 1.64767,
+             1.6525, 1.6576, 1.66248, 1.66745, 1.67245, 1.67762, 1.68254, 1.68735, 1.69273, 1.69799,
+             1.70311, 1.70866, 1.71419, 1.71987, 1.72563, 1.73092, 1.73649, 1.74214, 1.7481, 1.75384,
+             1.75964, 1.76575, 1.7719, 1.77814, 1.78417, 1.79025, 1.79661, 1.80279, 1.80931, 1.81573,
+             1.82286, 1.82949, 1.83643, 1.84292, 1.84967, 1.85664, 1.86368, 1.87081, 1.8785, 1.88579,
+             1.89364, 1.9012, 1.90903, 1.91693, 1.92439, 1.93209, 1.94038, 1.94895, 1.95732, 1.96557,
+             1.97428, 1.98277, 1.99193, 2.00067, 2.00999, 2.01895, 2.02843, 2.03861, 2.04788, 2.0581,
+             2.0685, 2.07927, 2.08991, 2.10126, 2.11234, 2.12424, 2.13665, 2.14821, 2.16022, 2.17329,
+             2.18689, 2.20035, 2.21435, 2.22962, 2.24497, 2.26075, 2.27601, 2.29213, 2.30988, 2.32817,
+             2.34742, 2.36704, 2.38818, 2.40998, 2.43275, 2.45718, 2.48257, 2.51035, 2.54041, 2.57278,
+             2.57654, 2.58022, 2.58389, 2.58742, 2.5906, 2.59427, 2.59799, 2.60168, 2.60521, 2.60985,
+             2.61369, 2.61806, 2.62179, 2.62582, 2.63003, 2.63457, 2.63809, 2.64195, 2.6459, 2.65025,
+             2.65518, 2.65962, 2.66376, 2.66885, 2.6738, 2.67843, 2.68336, 2.68686, 2.69188, 2.69666,
+             2.70141, 2.70712, 2.7132, 2.71743, 2.72231, 2.72743, 2.73254, 2.73825, 2.74355, 2.74975,
+             2.75456, 2.75998, 2.76544, 2.77241, 2.77783, 2.78545, 2.79088, 2.79663, 2.80341, 2.80938,
+             2.81496, 2.82155, 2.82704, 2.83307, 2.84009, 2.84797, 2.85565, 2.86494, 2.8722, 2.87871,
+             2.88714, 2.89457, 2.90322, 2.91265, 2.9216, 2.93156, 2.94137, 2.95189, 2.96037, 2.9698,
+             2.97955, 2.99016, 3.00079, 3.01295, 3.02424, 3.03736, 3.04919, 3.06255, 3.0759, 3.09274,
+             3.10704, 3.12489, 3.13997, 3.15927, 3.17924, 3.19969, 3.22195, 3.24241, 3.26851, 3.29383,
+             3.3066, 3.31786, 3.33269, 3.34996, 3.36907, 3.39161, 3.41077, 3.43299, 3.45562, 3.47652,
+             3.5041, 3.53308, 3.56563, 3.59903, 3.64716, 3.71656, 3.80423, 3.92434],
+            [3.63193, 3.80691, 3.85425, 3.87674, 3.89843, 3.91534, 3.93042, 3.94276, 3.95673, 3.96961,
+             3.97932, 3.98989, 3.99978, 4.00735, 4.01708, 4.02699, 4.03648, 4.04495, 4.05413, 4.06151,
+             4.06796, 4.07583, 4.08217, 4.08989, 4.09689, 4.1038, 4.10979, 4.11765, 4.12532, 4.13125,
+             4.13586, 4.14252, 4.14882, 4.15432, 4.16176, 4.16849, 4.17372, 4.17913, 4.18502, 4.19106,
+             4.19733, 4.20444, 4.21135, 4.21831, 4.22493, 4.23302, 4.23866, 4.24518, 4.25201, 4.2582,
+             4.26508, 4.27079, 4.27713, 4.28503, 4.29086, 4.29727, 4.30445, 4.31244, 4.31968, 4.32907,
+             4.33598, 4.34322, 4.35002, 4.35691, 4.36457, 4.37189, 4.37838, 4.3853, 4.39385, 4.40168,
+             4.41094, 4.42038, 4.42918, 4.4399, 4.45024, 4.45849, 4.4677, 4.47941, 4.48817, 4.50007,
+             4.51128, 4.52212, 4.53681, 4.55044, 4.56414, 4.57592, 4.59076, 4.60821, 4.6304, 4.65402,
+             4.67662, 4.67825, 4.6822, 4.68745, 4.68911, 4.69165, 4.6933, 4.69531, 4.69858, 4.69966,
+             4.70218, 4.70464, 4.70758, 4.70991, 4.71175, 4.71351, 4.71447, 4.71693, 4.71973, 4.72228,
+             4.72687, 4.72973, 4.73118, 4.73374, 4.73511, 4.7365, 4.73809, 4.74208, 4.74439, 4.74705,
+             4.75222, 4.75465, 4.76039, 4.7631, 4.76508, 4.76897, 4.77673, 4.77852, 4.78002, 4.78273,
+             4.78455, 4.78863, 4.79256, 4.79835, 4.79991, 4.80295, 4.80604, 4.81057, 4.81272, 4.81591,
+             4.8202, 4.82508, 4.82971, 4.83433, 4.83783, 4.84554, 4.84894, 4.85384, 4.86016, 4.86335,
+             4.86846, 4.87497, 4.87995, 4.88491, 4.89301, 4.89778, 4.90338, 4.90724, 4.91185, 4.91955,
+             4.92739, 4.93553, 4.94694, 4.95469, 4.96038, 4.96722, 4.9726, 4.98438, 4.99181, 4.99899,
+             5.00625, 5.01775, 5.0265, 5.04016, 5.04805, 5.05515, 5.06721, 5.08063, 5.10305, 5.11976,
+             5.14231, 5.14256, 5.14282, 5.14329, 5.14377, 5.14423, 5.14427, 5.14635, 5.15134, 5.15637,
+             5.16109, 5.16366, 5.16502, 5.16516, 5.16544, 5.16763, 5.17664, 5.18097, 5.1819, 5.18285,
+             5.18582, 5.19347, 5.19699, 5.19841, 5.20066, 5.20208, 5.20218, 5.20321, 5.20466, 5.2069,
+             5.20812, 5.2082, 5.21064, 5.21316, 5.21396, 5.2146, 5.21512, 5.21728, 5.21921, 5.22015,
+             5.22121, 5.22235, 5.22819, 5.2321, 5.23251, 5.23668, 5.24191, 5.24247, 5.24312, 5.24389,
+             5.24841, 5.25331, 5.25548, 5.26004, 5.26676, 5.26804, 5.2712, 5.28214, 5.28802, 5.29065,
+             5.29861, 5.30439, 5.30544, 5.31098, 5.31831, 5.3224, 5.32496, 5.32536, 5.33029, 5.33686,
+             5.34547, 5.35213, 5.35681, 5.36315, 5.36835, 5.3686, 5.3712, 5.37548, 5.37637, 5.37845,
+             5.38371, 5.38581, 5.38637, 5.38857, 5.39268, 5.3998, 5.40796, 5.41612, 5.42149, 5.42443,
+             5.42467, 5.43302, 5.44552, 5.45802, 5.47216, 5.48891, 5.50566, 5.52077, 5.52265, 5.52454,
+             5.52642, 5.52954, 5.53292, 5.5363, 5.54991, 5.57172, 5.59353, 5.61484, 5.63485]),
+    65535: ([0, 0.01269, 0.02535, 0.03804, 0.0504, 0.06299, 0.07565, 0.08815, 0.10074, 0.11326, 0.12584,
+             0.1384, 0.15101, 0.16372, 0.17647, 0.18914, 0.20184, 0.21457, 0.22757, 0.24046, 0.25346,
+             0.2664, 0.27935, 0.29239, 0.30538, 0.31859, 0.33172, 0.34504, 0.35843, 0.37158, 0.3851,
+             0.3988, 0.41257, 0.42631, 0.44028, 0.45417, 0.46804, 0.48233, 0.49651, 0.51068, 0.5251,
+             0.53959, 0.55432, 0.56886, 0.58379, 0.59851, 0.6135, 0.62877, 0.64449, 0.65996, 0.67554,
+             0.69156, 0.70771, 0.72396, 0.7402, 0.75634, 0.77305, 0.79001, 0.80716, 0.82446, 0.84201,
+             0.86031, 0.87898, 0.89782, 0.91663, 0.93555, 0.95492, 0.9747, 0.9954, 1.01583, 1.03695,
+             1.05874, 1.08072, 1.10317, 1.12658, 1.15057, 1.17469, 1.2005, 1.2266, 1.25382, 1.28154,
+             1.31101, 1.34103, 1.37279, 1.40595, 1.44048, 1.47715, 1.51594, 1.55667, 1.60011, 1.64642,
+             1.65139, 1.65632, 1.66111, 1.66626, 1.6716, 1.67681, 1.68189, 1.68698, 1.69206, 1.69712,
+             1.70261, 1.70798, 1.71344, 1.71871, 1.72392, 1.72993, 1.73535, 1.74082, 1.74641, 1.7524,
+             1.75803, 1.76381, 1.76988, 1.77594, 1.78205, 1.78833, 1.79451, 1.80129, 1.8079, 1.81474,
+             1.82136, 1.82824, 1.83486, 1.8418, 1.84872, 1.85581, 1.86263, 1.86986, 1.87706, 1.88438,
+             1.89202, 1.89931, 1.90715, 1.91462, 1.9227, 1.93042, 1.93846, 1.94724, 1.95549, 1.96345,
+             1.97227, 1.9812, 1.99027, 1.99961, 2.00909, 2.01862, 2.02818, 2.03788, 2.04803, 2.05772,
+             2.06826, 2.0794, 2.09039, 2.10171, 2.1134, 2.12504, 2.13684, 2.14855, 2.16074, 2.17349,
+             2.1865, 2.20081, 2.21484, 2.22923, 2.24431, 2.26073, 2.27786, 2.29524, 2.31347, 2.33092,
+             2.34945, 2.3688, 2.38955, 2.41259, 2.43546, 2.45973, 2.48556, 2.51144, 2.54168, 2.57452,
+             2.57847, 2.58199, 2.58599, 2.58925, 2.59261, 2.59576, 2.59954, 2.60276, 2.6064, 2.61001,
+             2.61492, 2.61845, 2.62239, 2.62635, 2.63052, 2.63471, 2.63948, 2.64262, 2.64682, 2.65115,
+             2.6557, 2.65985, 2.66419, 2.6684, 2.67379, 2.67841, 2.68242, 2.6863, 2.69093, 2.69491,
+             2.69985, 2.704, 2.70825, 2.7135, 2.71758, 2.72291, 2.72767, 2.73311, 2.7379, 2.74364, 2.7492,
+             2.75404, 2.75987, 2.76625, 2.77257, 2.7796, 2.78537, 2.79148, 2.79665, 2.801, 2.80797,
+             2.81425, 2.82116, 2.82712, 2.83377, 2.83985, 2.84691, 2.85367, 2.86164, 2.86933, 2.878,
+             2.88716, 2.89505, 2.90484, 2.91406, 2.92205, 2.93256, 2.94232, 2.95117, 2.96112, 2.97145,
+             2.98104, 2.99152, 3.00243, 3.01447, 3.02796, 3.04092, 3.05327, 3.06657, 3.07959, 3.09672,
+             3.1121, 3.12915, 3.14666, 3.16485, 3.18403, 3.20547, 3.22883, 3.25401, 3.27953, 3.29658,
+             3.31371, 3.32962, 3.34918, 3.3685, 3.38899, 3.41046, 3.42773, 3.44803, 3.47355, 3.5011,
+             3.5326, 3.56824, 3.60752, 3.65222, 3.71056, 3.76067, 3.87699],
+            [3.8053, 3.99019, 4.02827, 4.05638, 4.0722, 4.08516, 4.09767, 4.10655, 4.11842, 4.12927,
+             4.13738, 4.14654, 4.15593, 4.16474, 4.17535, 4.18159, 4.19155, 4.19958, 4.20781, 4.21373,
+             4.21956, 4.22773, 4.23606, 4.24255, 4.24997, 4.25586, 4.26172, 4.2689, 4.27529, 4.27996,
+             4.28693, 4.29357, 4.30037, 4.30727, 4.31242, 4.31784, 4.32496, 4.32984, 4.33736, 4.34335,
+             4.34902, 4.35731, 4.36399, 4.36948, 4.37423, 4.3813, 4.38843, 4.39329, 4.4017, 4.40791,
+             4.41438, 4.42061, 4.42568, 4.43086, 4.43727, 4.44327, 4.45025, 4.45717, 4.46178, 4.46792,
+             4.47324, 4.47803, 4.48493, 4.48998, 4.49523, 4.50472, 4.5131, 4.51942, 4.52591, 4.53617,
+             4.54801, 4.55777, 4.56636, 4.57698, 4.58405, 4.58985, 4.60087, 4.61039, 4.62034, 4.63164,
+             4.64452, 4.65936, 4.66846, 4.68066, 4.69253, 4.71492, 4.72811, 4.7437, 4.75788, 4.77541,
+             4.80177, 4.8038, 4.80605, 4.80691, 4.81085, 4.8134, 4.8146, 4.81577, 4.81677, 4.82204,
+             4.82355, 4.82769, 4.82961, 4.83261, 4.83598, 4.83942, 4.84379, 4.84589, 4.84923, 4.85233,
+             4.85408, 4.85813, 4.86108, 4.86454, 4.86684, 4.86892, 4.87002, 4.87221, 4.87712, 4.88122,
+             4.88381, 4.88695, 4.88833, 4.89269, 4.895, 4.89988, 4.90231, 4.90414, 4.90532, 4.90725,
+             4.91278, 4.91498, 4.91755, 4.9203, 4.93213, 4.93709, 4.94473, 4.95373, 4.95946, 4.96621,
+             4.96854, 4.97066, 4.97211, 4.97689, 4.97952, 4.98906, 4.99165, 4.99736, 5.00312, 5.01427,
+             5.01767, 5.02488, 5.02873, 5.03564, 5.04038, 5.04313, 5.05122, 5.05769, 5.06595, 5.07236,
+             5.08002, 5.08567, 5.08927, 5.09822, 5.11695, 5.12699, 5.14707, 5.15646, 5.16185, 5.16588,
+             5.17257, 5.18729, 5.19271, 5.21316, 5.228, 5.24459, 5.26059, 5.28803, 5.29545, 5.31003,
+             5.32411, 5.32421, 5.32488, 5.32658, 5.32827, 5.33026, 5.33545, 5.34064, 5.34584, 5.34737,
+             5.34801, 5.34866, 5.34913, 5.34945, 5.34977, 5.35021, 5.35099, 5.35178, 5.35256, 5.35802,
+             5.36363, 5.36925, 5.37205, 5.37359, 5.37513, 5.3771, 5.3797, 5.3823, 5.38459, 5.38487,
+             5.38514, 5.38541, 5.38616, 5.387, 5.38783, 5.39322, 5.402, 5.41078, 5.41871, 5.42458,
+             5.43046, 5.43626, 5.437, 5.43775, 5.43849, 5.4405, 5.44296, 5.44542, 5.44896, 5.45378,
+             5.4586, 5.46268, 5.46339, 5.46411, 5.46483, 5.46538, 5.46592, 5.46645, 5.4667, 5.46676,
+             5.46683, 5.47137, 5.48444, 5.49751, 5.51032, 5.51931, 5.5283, 5.5373, 5.54195, 5.54543,
+             5.54892, 5.55589, 5.56623, 5.57658, 5.58593, 5.59193, 5.59794, 5.60394, 5.60641, 5.60869,
+             5.61097, 5.62294, 5.63962, 5.65631, 5.67123, 5.68343, 5.69562, 5.70981, 5.73942, 5.76904,
+             5.79865, 5.81367, 5.8288, 5.84393, 5.85906, 5.87419, 5.88932, 5.90391, 5.91435, 5.92479,
+             5.93522, 5.94566, 5.9561, 5.96654, 5.97695, 5.98733, 5.99772, 6.0081, 6.01848]),
+}
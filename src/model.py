@@ -0,0 +1,254 @@
+# Model matrices of polynomial models in coded factors, shared by the optimal design and analysis code
+
+import itertools
+import numpy as np
+
+
+def model_terms(model, factor_names, categorical=None):
+    """
+    Returns the terms of a model, each term being a tuple of factor indexes (a factor appearing twice is
+    squared), with the intercept () first.
+
+    Parameters:
+        model: 'linear' (main effects), 'interaction' (main effects and two factor interactions),
+        'quadratic' (interactions and the squares of the numeric factors) or a list of terms such as
+        ['Height', 'Width', 'Height*Width', 'Height^2'].
+
+        factor_names: The names of the factors.
+
+        categorical: A list of True or False for each factor, categorical factors cannot be squared.
+
+    Example:
+        >>> import model
+        >>> model.model_terms('interaction', ['A', 'B', 'C'])
+        [(), (0,), (1,), (2,), (0, 1), (0, 2), (1, 2)]
+    """
+    n_factors = len(factor_names)
+    categorical = [False] * n_factors if categorical is None else list(categorical)
+    main = [(i,) for i in range(n_factors)]
+    if isinstance(model, str):
+        if model == 'linear':
+            terms = main
+        elif model in ('interaction', 'interactions'):
+            terms = main + list(itertools.combinations(range(n_factors), 2))
+        elif model == 'quadratic':
+            terms = (main + list(itertools.combinations(range(n_factors), 2)) +
+                     [(i, i) for i in range(n_factors) if not categorical[i]])
+        else:
+            raise ValueError("model must be 'linear', 'interaction', 'quadratic' or a list of terms, not {}".format(
+                model))
+    else:
+        terms = [_parse_term(term, factor_names) for term in model]
+    for term in terms:
+        for i in set(term):
+            if categorical[i] and term.count(i) > 1:
+                raise ValueError('The categorical factor {} cannot be raised to a power'.format(factor_names[i]))
+    # The intercept is always in the model, and each term only once
+    unique = [()]
+    for term in terms:
+        if term not in unique:
+            unique.append(term)
+    return unique
+
+
+def _parse_term(term, factor_names):
+    if isinstance(term, tuple):
+        return tuple(sorted(term))
+    indexes = []
+    for part in str(term).split('*'):
+        part = part.strip()
+        power = 1
+        if '^' in part:
+            part, power = part.split('^')
+            part, power = part.strip(), int(power)
+        if part not in factor_names:
+            raise ValueError('{} in the term {} is not a factor'.format(part, term))
+        indexes += [factor_names.index(part)] * power
+    return tuple(sorted(indexes))
+
+
+def effects_coding(n_levels):
+    """
+    Returns the n_levels by n_levels - 1 matrix coding a categorical factor, level i being row i.
+    Each column compares one level with the last, so every column adds up to zero.
+    """
+    coding = np.zeros((n_levels, max(n_levels - 1, 0)))
+    coding[:n_levels - 1] = np.eye(n_levels - 1)
+    coding[n_levels - 1] = -1
+    return coding
+
+
+def model_matrix(coded, terms, level_counts=None):
+    """
+    Returns the model matrix of a design with one row per run and one column per model column.
+
+    Parameters:
+        coded: The design with one column per factor, numeric factors in coded units (-1 to +1) and
+        categorical factors as the index of their level. A stack of designs of the same shape (designs by
+        runs by factors) gives a stack of model matrices.
+
+        terms: The model terms from model_terms.
+
+        level_counts: A list with the number of levels of each categorical factor and None for each
+        numeric factor, if None every factor is numeric.
+    """
+    coded = np.asarray(coded, dtype=float)
+    if coded.ndim == 1:
+        coded = coded[None, :]
+    level_counts = [None] * coded.shape[-1] if level_counts is None else level_counts
+    columns = []
+    for term in terms:
+        columns += _term_columns(coded, term, level_counts)
+    return np.stack(columns, axis=-1) if columns else np.empty(coded.shape[:-1] + (0,))
+
+
+def _term_columns(coded, term, level_counts):
+    # A term is the product of each of its factors' columns, a categorical factor giving one column
+    # per effects coded contrast so its terms can be several columns
+    columns = [np.ones(coded.shape[:-1])]
+    for i in sorted(set(term)):
+        if level_counts[i] is None:
+            factor_columns = [coded[..., i] ** term.count(i)]
+        else:
+            coding = effects_coding(level_counts[i])
+            factor_columns = list(np.moveaxis(coding[coded[..., i].astype(np.intp)], -1, 0))
+        columns = [column * factor_column for column in columns for factor_column in factor_columns]
+    return columns
+
+
+def code_design(design, dic_factors=None):
+    """
+    Returns a design in the coding used by model_matrix, numeric factors from -1 (lowest level) to +1
+    (highest level) and categorical factors as the index of their level.
+
+    Parameters:
+        design: A Design, a dataframe or an array already in coded units.
+
+        dic_factors: The dictionary of factors the design was made from. For a dataframe it gives the factor
+        columns, the ranges of numeric factors and the order of the levels of categorical factors, if None
+        every column is a factor ranging from its lowest to its highest value. Not needed for a Design,
+        whose own coded levels are used.
+
+    Returns:
+        coded: A float array with one row per run and one column per factor.
+
+        level_counts: The number of levels of each categorical factor and None for each numeric factor.
+
+        factor_names: The name of each factor.
+    """
+    if hasattr(design, 'coded_levels'):
+        level_counts = [None if is_numeric(levels) else len(levels) for levels in design.levels]
+        coded = design.coded().astype(float)
+        for j, count in enumerate(level_counts):
+            if count is not None:
+                coded[:, j] = design.codes[:, j]
+        return coded, level_counts, list(design.factor_names)
+    if not hasattr(design, 'columns'):
+        coded = np.asarray(design, dtype=float)
+        return coded, [None] * coded.shape[-1], ['X{}'.format(j + 1) for j in range(coded.shape[-1])]
+    factor_names = list(dic_factors) if dic_factors is not None else list(design.columns)
+    coded = np.empty((len(design.index), len(factor_names)))
+    level_counts = []
+    for j, name in enumerate(factor_names):
+        column = design[name]
+        levels = list(dic_factors[name]) if dic_factors is not None else None
+        if is_numeric(levels if levels is not None else column):
+            values = np.asarray(column, dtype=float)
+            low = min(levels) if levels is not None else values.min()
+            high = max(levels) if levels is not None else values.max()
+            coded[:, j] = (values - (low + high) / 2) / ((high - low) / 2 if high > low else 1)
+            level_counts.append(None)
+        else:
+            levels = levels if levels is not None else sorted(set(column))
+            coded[:, j] = _level_indexes(column, levels, name)
+            level_counts.append(len(levels))
+    return coded, level_counts, factor_names
+
+
+def is_numeric(values):
+    """
+    Returns True if every value is a number, factors with any other levels are categorical.
+    """
+    if hasattr(values, 'dtype'):
+        return values.dtype.kind in 'iuf'
+    return all(isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, (bool, np.bool_))
+               for value in values)
+
+
+def _level_indexes(column, levels, name):
+    positions = {level: i for i, level in enumerate(levels)}
+    try:
+        return [positions[value] for value in column]
+    except KeyError as error:
+        raise ValueError('{} is not one of the levels of {}'.format(error.args[0], name))
+
+
+def column_names(terms, factor_names, level_counts=None, levels=None):
+    """
+    Returns the name of each column of the model matrix, with categorical contrasts named factor[level].
+    """
+    level_counts = [None] * len(factor_names) if level_counts is None else level_counts
+    names = []
+    for term in terms:
+        if term == ():
+            names.append('Intercept')
+            continue
+        parts = [['']]
+        for i in sorted(set(term)):
+            if level_counts[i] is None:
+                power = term.count(i)
+                factor_parts = [factor_names[i] + ('^{}'.format(power) if power > 1 else '')]
+            else:
+                level_names = levels[i] if levels is not None else range(level_counts[i])
+                factor_parts = ['{}[{}]'.format(factor_names[i], level) for level in list(level_names)[:-1]]
+            parts = [part + [factor_part] for part in parts for factor_part in factor_parts]
+        names += ['*'.join(part[1:]) for part in parts]
+    return names
+
+
+def moment_matrix(terms, level_counts, points):
+    """
+    Returns the matrix of the average of f(x) f(x)^T over the design region, f(x) being the row of the
+    model matrix at x. The factors are independent over the region so each entry is a product over the
+    factors of one dimensional averages, which are found from the points and weights given for each factor.
+
+    Parameters:
+        terms: The model terms.
+
+        level_counts: The number of levels of each categorical factor and None for numeric factors.
+
+        points: For each factor a pair (values, weights) of coded values (or level indexes) and the weight
+        of each, weights adding up to one.
+    """
+    # Each model column is described by, for each factor, either a power or an effects coding column
+    descriptions = []
+    for term in terms:
+        options = [[]]
+        for i in sorted(set(term)):
+            if level_counts[i] is None:
+                choices = [(i, 'power', term.count(i))]
+            else:
+                choices = [(i, 'contrast', c) for c in range(level_counts[i] - 1)]
+            options = [option + [choice] for option in options for choice in choices]
+        descriptions += options
+    values = []
+    for i, (points_i, weights_i) in enumerate(points):
+        points_i = np.asarray(points_i, dtype=float)
+        if level_counts[i] is None:
+            values.append(lambda kind, index, x=points_i: x ** index)
+        else:
+            coding = effects_coding(level_counts[i])
+            values.append(lambda kind, index, x=points_i, coding=coding: coding[x.astype(np.intp), index])
+    moments = np.ones((len(descriptions), len(descriptions)))
+    for a, first in enumerate(descriptions):
+        for b in range(a, len(descriptions)):
+            second = descriptions[b]
+            value = 1.0
+            for i in set(part[0] for part in first) | set(part[0] for part in second):
+                product = np.ones(len(points[i][0]))
+                for part in first + second:
+                    if part[0] == i:
+                        product = product * values[i](part[1], part[2])
+                value *= float(np.dot(points[i][1], product))
+            moments[a, b] = moments[b, a] = value
+    return moments
@@ -0,0 +1,258 @@
+# Writing designs to disk in chunks and memory-mapping them back, as .npy files or with pyarrow as
+# Arrow IPC or Parquet files
+
+import json
+import numpy as np
+import pandas as pd
+import design
+import instrument
+
+# Written into every file so that the readers can tell a stored design from any other file
+_FORMAT = 'design-of-experiments'
+_METADATA_KEY = b'design_of_experiments'
+
+
+@instrument.instrumented
+def write_npy(path, source, chunk_size=2 ** 20):
+    """
+    Writes a design to a .npy file in chunks of runs, with its factor names and levels in a JSON file
+    next to it (path + '.json'). A Design or LazyFullFactorial is stored as its compact matrix of level
+    codes, a LazyFullFactorial being decoded a chunk at a time so that it is never held in memory.
+    A dataframe, which must be all numbers, is stored as a matrix of floats.
+
+    Parameters:
+        path: The file to write.
+
+        source: A Design, LazyFullFactorial or dataframe.
+
+        chunk_size: The number of runs made and written at a time.
+
+    Example:
+        >>> import design
+        >>> import storage
+        >>> import tempfile, os
+        >>> path = os.path.join(tempfile.mkdtemp(), 'design.npy')
+        >>> storage.write_npy(path, design.LazyFullFactorial({'A':[1,2,3],'B':['x','y']}), chunk_size=4)
+        >>> d = storage.read_npy(path)
+        >>> d.to_dataframe().head(3)
+           A  B
+        0  1  x
+        1  1  y
+        2  2  x
+    """
+    metadata, runs, dtype, chunks = _source_chunks(source, chunk_size)
+    if metadata['kind'] == 'values' and dtype is None:
+        raise ValueError('Only dataframes of numbers can be written to .npy, use write_arrow or write_parquet')
+    with instrument.stage('write'):
+        instrument.note(rows=runs, columns=len(metadata['factor_names']))
+        shape = (runs, len(metadata['factor_names']))
+        array = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=shape)
+        start = 0
+        for chunk in chunks:
+            array[start:start + len(chunk)] = chunk
+            start += len(chunk)
+        array.flush()
+        del array
+    with open(path + '.json', 'w') as file:
+        json.dump(metadata, file, default=_to_builtin)
+
+
+def read_npy(path):
+    """
+    Reads a design written by write_npy, memory-mapping the file so that nothing is copied or read
+    until it is used.
+
+    Returns:
+        design: A Design for a file of level codes, or a dataframe for a file of values.
+    """
+    with open(path + '.json') as file:
+        metadata = json.load(file)
+    _check_metadata(metadata, path)
+    array = np.load(path, mmap_mode='r')
+    if metadata['kind'] == 'codes':
+        return design.Design(array, metadata['levels'], metadata['factor_names'], metadata['coded_levels'])
+    return pd.DataFrame(array, columns=metadata['factor_names'], copy=False)
+
+
+@instrument.instrumented
+def write_arrow(path, source, chunk_size=2 ** 20):
+    """
+    Writes a design to an Arrow IPC file, one record batch per chunk of runs. Each factor of a Design or
+    LazyFullFactorial is a dictionary encoded column, the level codes with the levels as the dictionary,
+    so other Arrow tools read the levels themselves. The factor names and levels are in the schema metadata.
+    Needs pyarrow.
+
+    Parameters:
+        path: The file to write.
+
+        source: A Design, LazyFullFactorial or dataframe.
+
+        chunk_size: The number of runs made and written at a time.
+    """
+    import pyarrow as pa
+    metadata, runs, dtype, chunks = _source_chunks(source, chunk_size)
+    with instrument.stage('write'):
+        instrument.note(rows=runs, columns=len(metadata['factor_names']))
+        writer = None
+        for batch in _record_batches(metadata, chunks):
+            if writer is None:
+                schema = batch.schema.with_metadata({_METADATA_KEY: json.dumps(metadata, default=_to_builtin)})
+                writer = pa.ipc.new_file(path, schema)
+            writer.write_batch(batch)
+        if writer is None:
+            writer = pa.ipc.new_file(path, _empty_schema(metadata))
+        writer.close()
+
+
+def read_arrow(path, as_table=False):
+    """
+    Reads a design written by write_arrow, memory-mapping the file.
+
+    Parameters:
+        path: The file to read.
+
+        as_table: If True the memory-mapped pyarrow Table is returned without copying anything,
+        otherwise the design is returned as a Design (for level codes) or a dataframe (for values).
+        A Design holds its codes as one matrix, so they are copied out of the file's columns into it.
+    """
+    import pyarrow as pa
+    table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    return _from_table(table, path, as_table)
+
+
+@instrument.instrumented
+def write_parquet(path, source, chunk_size=2 ** 20, compression='snappy'):
+    """
+    Writes a design to a Parquet file, one row group per chunk of runs. Needs pyarrow.
+    Parquet rebuilds the dictionaries of dictionary encoded columns from their values, which loses
+    which level is which when two levels have the same value (such as the axial and factorial levels
+    of a face centred design). So each factor of a Design or LazyFullFactorial is stored as its column
+    of level codes, with the factor names and levels in the schema metadata. A dataframe is stored as it is.
+
+    Parameters:
+        path: The file to write.
+
+        source: A Design, LazyFullFactorial or dataframe.
+
+        chunk_size: The number of runs made and written at a time.
+
+        compression: The Parquet compression, such as 'snappy', 'zstd' or None.
+    """
+    import pyarrow.parquet as pq
+    metadata, runs, dtype, chunks = _source_chunks(source, chunk_size)
+    if metadata['kind'] == 'codes':
+        metadata['encoding'] = 'codes'
+    with instrument.stage('write'):
+        instrument.note(rows=runs, columns=len(metadata['factor_names']))
+        writer = None
+        for batch in _record_batches(metadata, chunks):
+            if writer is None:
+                schema = batch.schema.with_metadata({_METADATA_KEY: json.dumps(metadata, default=_to_builtin)})
+                writer = pq.ParquetWriter(path, schema, compression=compression)
+            writer.write_batch(batch)
+        if writer is None:
+            writer = pq.ParquetWriter(path, _empty_schema(metadata), compression=compression)
+        writer.close()
+
+
+def read_parquet(path, as_table=False):
+    """
+    Reads a design written by write_parquet, memory-mapping the file while it is decoded.
+
+    Parameters:
+        path: The file to read.
+
+        as_table: If True the pyarrow Table is returned, otherwise the design is returned as a Design
+        (for level codes, copied into one matrix) or a dataframe (for values).
+    """
+    import pyarrow.parquet as pq
+    return _from_table(pq.read_table(path, memory_map=True), path, as_table)
+
+
+def _source_chunks(source, chunk_size):
+    """
+    Returns the metadata, number of runs, numpy type and an iterator over the chunks of a source.
+    The chunks are matrices of level codes, or dataframes for a source of values.
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least one')
+    if isinstance(source, design.LazyFullFactorial):
+        metadata = _codes_metadata(source.factor_names, source.factor_levels, None)
+        dtype = design._codes_dtype(source.level_counts)
+        chunks = (design._full_factorial_indices(source.level_counts,
+                                                 np.arange(first, min(first + chunk_size, source.runs),
+                                                           dtype=np.int64)).astype(dtype)
+                  for first in range(0, source.runs, chunk_size))
+        return metadata, source.runs, dtype, chunks
+    if isinstance(source, design.Design):
+        metadata = _codes_metadata(source.factor_names, source.levels, source.coded_levels)
+        chunks = (source.codes[first:first + chunk_size] for first in range(0, source.runs, chunk_size))
+        return metadata, source.runs, source.codes.dtype, chunks
+    if isinstance(source, pd.DataFrame):
+        metadata = {'format': _FORMAT, 'kind': 'values', 'factor_names': [str(name) for name in source.columns]}
+        numeric = all(kind in 'iuf' for kind in source.dtypes.map(lambda dtype: getattr(dtype, 'kind', 'O')))
+        chunks = (source.iloc[first:first + chunk_size] for first in range(0, len(source.index), chunk_size))
+        return metadata, len(source.index), np.dtype(float) if numeric else None, chunks
+    raise TypeError('A design to write must be a Design, LazyFullFactorial or dataframe, not {}'.format(
+        type(source).__name__))
+
+
+def _codes_metadata(factor_names, levels, coded_levels):
+    return {'format': _FORMAT, 'kind': 'codes', 'factor_names': list(factor_names),
+            'levels': [list(factor_levels) for factor_levels in levels],
+            'coded_levels': None if coded_levels is None else [list(values) for values in coded_levels]}
+
+
+def _record_batches(metadata, chunks):
+    import pyarrow as pa
+    if metadata['kind'] == 'values':
+        for chunk in chunks:
+            yield pa.RecordBatch.from_pandas(chunk, preserve_index=False)
+        return
+    dictionaries = [pa.array(levels) for levels in metadata['levels']]
+    for chunk in chunks:
+        columns = [pa.array(np.ascontiguousarray(chunk[:, j])) for j in range(chunk.shape[1])]
+        if metadata.get('encoding') != 'codes':
+            columns = [pa.DictionaryArray.from_arrays(column, dictionary)
+                       for column, dictionary in zip(columns, dictionaries)]
+        yield pa.RecordBatch.from_arrays(columns, names=metadata['factor_names'])
+
+
+def _empty_schema(metadata):
+    import pyarrow as pa
+    fields = [pa.field(name, pa.float64()) for name in metadata['factor_names']]
+    return pa.schema(fields, metadata={_METADATA_KEY: json.dumps(metadata, default=_to_builtin)})
+
+
+def _from_table(table, path, as_table):
+    metadata = json.loads(table.schema.metadata[_METADATA_KEY])
+    _check_metadata(metadata, path)
+    if as_table:
+        return table
+    if metadata['kind'] == 'values':
+        return table.to_pandas()
+    # The codes of each column are gathered from the record batches into one matrix. They are taken by
+    # position, the indices of a dictionary column (whose dictionary is the levels) or the column itself
+    # when it holds the codes, as levels need not be unique
+    codes = np.empty((table.num_rows, table.num_columns),
+                     dtype=design._codes_dtype([len(levels) for levels in metadata['levels']]))
+    for j in range(table.num_columns):
+        start = 0
+        for piece in table.column(j).chunks:
+            if hasattr(piece, 'indices'):
+                piece = piece.indices
+            codes[start:start + len(piece), j] = piece.to_numpy(zero_copy_only=False)
+            start += len(piece)
+    return design.Design(codes, metadata['levels'], metadata['factor_names'], metadata['coded_levels'])
+
+
+def _check_metadata(metadata, path):
+    if metadata.get('format') != _FORMAT:
+        raise ValueError('{} was not written by this package'.format(path))
+
+
+def _to_builtin(value):
+    # numpy numbers and arrays in the metadata are written as plain numbers and lists
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError('{} cannot be written as JSON'.format(type(value).__name__))
@@ -0,0 +1,81 @@
+# The fast Walsh-Hadamard transform and the word structure of regular two level designs, shared by the
+# design generators and the analysis of screening experiments
+
+import numpy as np
+
+
+def fwht(values):
+    """
+    Returns the fast Walsh-Hadamard transform of values along the first axis, whose length must be
+    a power of two. Entry w of the result is the sum over runs i of (-1)^(number of bits in i & w) * values[i],
+    so it costs n log n operations rather than the n^2 of multiplying by a Hadamard matrix.
+
+    Example:
+        >>> import walsh
+        >>> walsh.fwht([1, 2, 3, 4])
+        array([10., -2., -4.,  0.])
+    """
+    values = np.asarray(values, dtype=float)
+    shape = values.shape
+    n = shape[0]
+    result = values.reshape(n, -1)
+    h = 1
+    # Each pass combines runs that differ only in one bit of their run number
+    while h < n:
+        blocks = result.reshape(n // (2 * h), 2, h, -1)
+        result = np.stack([blocks[:, 0] + blocks[:, 1], blocks[:, 0] - blocks[:, 1]], axis=1).reshape(n, -1)
+        h *= 2
+    return result.reshape(shape)
+
+
+def column_words(coded):
+    """
+    Works out how a two level design coded as -1 and +1 sits inside a full factorial. If the design is
+    a full or regular fractional factorial with a power of two runs, every column is (plus or minus) a
+    product of a set of base columns, written as a bit mask 'word' over the base columns.
+
+    Returns:
+        None if the design is not a regular two level design, otherwise
+
+        order: The rows of the design put into standard (Yates) order.
+
+        words: The word of each column.
+
+        signs: +1 or -1 for each column, as column = sign * product of the base columns in its word.
+
+    Example:
+        >>> import walsh
+        >>> # The third column is minus the product of the first two, so its word is theirs combined
+        >>> order, words, signs = walsh.column_words([[-1, -1, -1], [1, -1, 1], [-1, 1, 1], [1, 1, -1]])
+        >>> words
+        array([2, 1, 3])
+        >>> int(signs[2] * signs[0] * signs[1])
+        -1
+    """
+    coded = np.asarray(coded)
+    n = len(coded)
+    if n < 2 or n & (n - 1):
+        return None
+    high = coded > 0
+    # Base columns are chosen greedily, a column is a new base column if it splits every group of
+    # runs with the same base column levels in two
+    codes = np.zeros(n, dtype=np.int64)
+    distinct = 1
+    for j in range(coded.shape[1]):
+        candidate = codes * 2 + high[:, j]
+        candidate_distinct = len(np.unique(candidate))
+        if candidate_distinct == 2 * distinct:
+            codes = candidate
+            distinct = candidate_distinct
+            if distinct == n:
+                break
+    if distinct != n:
+        return None
+    order = np.argsort(codes)
+    # In standard order each column of a regular design transforms to a single spike of height n
+    transformed = fwht(coded[order])
+    words = np.argmax(abs(transformed), axis=0)
+    spikes = transformed[words, np.arange(coded.shape[1])]
+    if not np.allclose(abs(spikes), n) or np.count_nonzero(np.round(transformed)) != coded.shape[1]:
+        return None
+    return order, words.astype(np.int64), np.sign(spikes).astype(np.int8)
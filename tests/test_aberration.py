@@ -0,0 +1,91 @@
+import itertools
+import random
+
+import pytest
+
+import aberration
+import cache
+import design
+
+
+@pytest.fixture(autouse=True)
+def no_stored_searches(monkeypatch):
+    # Every search is run rather than read back from memory or the on-disk cache
+    monkeypatch.setattr(aberration, '_searched', {})
+    monkeypatch.setattr(cache, 'load_array', lambda name: None)
+    monkeypatch.setattr(cache, 'save_array', lambda name, array: None)
+
+
+def _word_length_pattern(words, n_base):
+    # Each word of the defining relation is a product of generators, its length being the base
+    # factors left in it plus the generated factors in it
+    n_factors = n_base + len(words)
+    pattern = [0] * (n_factors + 1)
+    for size in range(1, len(words) + 1):
+        for subset in itertools.combinations(words, size):
+            product = 0
+            for word in subset:
+                product ^= word
+            pattern[bin(product).count('1') + size] += 1
+    return pattern[3:]
+
+
+@pytest.mark.parametrize('n_factors, runs', [(6, 16), (8, 16), (10, 16), (8, 32), (9, 32)])
+def test_search_matches_brute_force(n_factors, runs):
+    n_base = runs.bit_length() - 1
+    candidates = [mask for mask in range(1, runs) if bin(mask).count('1') >= 2]
+    best = min(_word_length_pattern(words, n_base)
+               for words in itertools.combinations(candidates, n_factors - n_base))
+    words = aberration.minimum_aberration_words(n_factors, runs)
+    assert _word_length_pattern(words, n_base) == best
+
+
+def test_isomorphic_designs_are_recognised():
+    # Relabelling the base factors gives an isomorphic design
+    random.seed(1)
+    n_base = 6
+    words = [7, 11, 19, 29, 46, 53, 62]
+    columns = [1 << j for j in range(n_base)] + words
+    for _ in range(20):
+        order = random.sample(range(n_base), n_base)
+        relabelled = [sum(1 << order[j] for j in range(n_base) if word >> j & 1) for word in words]
+        other = [1 << j for j in range(n_base)] + random.sample(relabelled, len(relabelled))
+        assert aberration._isomorphic(columns, [0] * len(columns), other, [0] * len(other), n_base)
+    # So does swapping a base factor with a generated one, A with F=ABC making F=ABC and G=ACD from
+    # F=ABC and G=ABD
+    assert aberration._isomorphic([1, 2, 4, 8, 16, 7, 11], [0] * 7, [1, 2, 4, 8, 16, 7, 13], [0] * 7, 5)
+
+
+def test_designs_that_are_not_isomorphic_are_kept_apart():
+    # F=ABC, G=ABD has a word of length four that F=ABC, G=ADE does not have
+    columns = [1, 2, 4, 8, 16, 7, 11]
+    assert not aberration._isomorphic(columns, [0] * 7, [1, 2, 4, 8, 16, 7, 25], [0] * 7, 5)
+
+
+def test_frac_fact_2level_passes_on_the_search_options(monkeypatch):
+    calls = []
+
+    def search(factor_names, runs, time_limit=60, processes=None):
+        calls.append((time_limit, processes))
+        return ['E=A*B*C*D']
+
+    monkeypatch.setattr(aberration, 'minimum_aberration_generators', search)
+    factors = {name: [0, 1] for name in 'ABCDE'}
+    design.frac_fact_2level(factors, 16, generators='minimum_aberration', time_limit=7, processes=2)
+    assert calls == [(7, 2)]
+
+
+def test_designs_sharing_their_patterns_are_both_searched():
+    # These two 64 run designs have the same word length pattern and letter pattern but are not isomorphic,
+    # the first has pairs of factors in no word of length four and the second does not
+    search = aberration._Search(6, 6, float('inf'))
+    first = [11, 25, 31, 37, 47, 56]
+    second = [7, 14, 22, 42, 49, 59]
+    invariants = []
+    for words in (first, second):
+        columns = [1 << j for j in range(6)] + words
+        weights = search._weights(words)
+        key = search._key(search._patterns(weights[None, :], len(columns))[0])
+        invariants.append((key, sorted(search._letter_rows(columns, weights))))
+        assert search._new_class(words, key, weights)
+    assert invariants[0] == invariants[1]
@@ -0,0 +1,56 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import design
+
+CASES = [('ABCDE', 8, ['D=AB', 'E=-AC']),
+         ('ABCDEF', 16, ['E=ABC', 'F=-BCD']),
+         ('ABCDEFG', 16, ['E=ABC', 'F=ABD', 'G=-ACD']),
+         ('ABCDEFGH', 32, ['F=ABC', 'G=ABD', 'H=BCDE'])]
+
+
+def _brute_force(df, max_order=2):
+    # Every product of factor columns is worked out, a product that is constant is a word of the
+    # defining relation and effects whose columns are equal (or opposite) are aliased
+    names = list(df.columns)
+    columns = df.to_numpy(dtype=np.int64)
+    words = []
+    for r in range(1, len(names) + 1):
+        for combination in itertools.combinations(range(len(names)), r):
+            product = np.prod(columns[:, list(combination)], axis=1)
+            if abs(product.sum()) == len(product):
+                words.append(('-' if product[0] < 0 else '') + '*'.join(names[i] for i in combination))
+    effects = {}
+    for r in range(1, max_order + 1):
+        for combination in itertools.combinations(range(len(names)), r):
+            effects['*'.join(names[i] for i in combination)] = np.prod(columns[:, list(combination)], axis=1)
+    aliases = {}
+    for name, column in effects.items():
+        chain = []
+        if abs(column.sum()) == len(column):
+            chain.append('I' if column[0] > 0 else '-I')
+        for other, other_column in effects.items():
+            if other != name and abs(column @ other_column) == len(column):
+                chain.append(('' if column @ other_column > 0 else '-') + other)
+        aliases[name] = chain
+    return words, aliases
+
+
+@pytest.mark.parametrize('names, runs, generators', CASES)
+@pytest.mark.parametrize('from_design', [False, True])
+def test_alias_structure_matches_brute_force(names, runs, generators, from_design):
+    factors = {name: [-1, 1] for name in names}
+    df = design.frac_fact_2level(factors, runs, generators=generators)
+    words, aliases = _brute_force(df)
+    if from_design:
+        structure = design.alias_structure(df)
+    else:
+        structure = design.alias_structure(factors, generators)
+    assert sorted(structure['defining_relation']) == sorted(words)
+    lengths = [len(word.lstrip('-').split('*')) for word in words]
+    assert structure['resolution'] == min(lengths)
+    assert list(structure['word_length_pattern']) == [lengths.count(length) for length in range(1, len(names) + 1)]
+    found = {name: sorted(chain) for name, chain in structure['aliases'].items()}
+    assert found == {name: sorted(chain) for name, chain in aliases.items()}
@@ -0,0 +1,53 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+import cli
+
+
+def _run(tmp_path, designs):
+    manifest = tmp_path / 'manifest.json'
+    manifest.write_text(json.dumps({'designs': designs}))
+    output_dir = tmp_path / 'out'
+    status = cli.main([str(manifest), '--output-dir', str(output_dir), '--processes', '1'])
+    return status, output_dir
+
+
+def test_identical_specs_are_generated_once_and_copied(tmp_path):
+    spec = {'type': 'frac_fact_2level', 'factors': {'A': [0, 1], 'B': [0, 1], 'C': [0, 1]},
+            'options': {'runs': 4}}
+    status, output_dir = _run(tmp_path, [dict(spec, name='a'), dict(spec, name='b')])
+    assert status == 0
+    assert pd.read_csv(output_dir / 'a.csv').equals(pd.read_csv(output_dir / 'b.csv'))
+
+
+def test_factor_order_is_part_of_the_spec(tmp_path):
+    # The same factors in a different order give a different design, so must not be deduplicated
+    first = {'name': 'a', 'type': 'frac_fact_2level', 'options': {'runs': 4},
+             'factors': {'Temp': [20, 40], 'Time': [10, 30], 'pH': [6, 8]}}
+    second = dict(first, name='b', factors={'pH': [6, 8], 'Time': [10, 30], 'Temp': [20, 40]})
+    status, output_dir = _run(tmp_path, [first, second])
+    assert status == 0
+    assert list(pd.read_csv(output_dir / 'a.csv').columns) == ['Temp', 'Time', 'pH']
+    b = pd.read_csv(output_dir / 'b.csv')
+    assert list(b.columns) == ['pH', 'Time', 'Temp']
+    # The last factor is the generated one, Temp = pH * Time in coded units
+    coded = b.apply(lambda column: (column == column.max()) * 2 - 1)
+    assert (coded['Temp'] == coded['pH'] * coded['Time']).all()
+
+
+def test_duplicate_names_are_rejected_before_any_work(tmp_path):
+    spec = {'name': 'a', 'type': 'full_factorial', 'factors': {'A': [1, 2]}}
+    with pytest.raises(ValueError, match='both named'):
+        _run(tmp_path, [spec, dict(spec, factors={'A': [1, 2, 3]})])
+    assert not os.path.exists(tmp_path / 'out')
+
+
+@pytest.mark.parametrize('name', ['../x', 'sub/x', 'sub\\x', '..', ''])
+def test_names_that_are_not_plain_file_names_are_rejected(tmp_path, name):
+    spec = {'name': name, 'type': 'full_factorial', 'factors': {'A': [1, 2]}}
+    with pytest.raises(ValueError, match='file name'):
+        _run(tmp_path, [spec])
+    assert not os.path.exists(tmp_path / 'x')
@@ -0,0 +1,23 @@
+import pytest
+
+import design
+
+FACTORS = {name: [0, 1] for name in 'ABCDE'}
+
+
+@pytest.mark.parametrize('generators', ['D = ABC, E = AC', 'D=ABC,E=AC', ' D=ABC ,  E=AC, ',
+                                        ['D = ABC', ' E = AC'], ['D = A*B*C', 'E = A * C']])
+def test_spaced_generators_give_the_same_design(generators):
+    expected = design.frac_fact_2level(FACTORS, 8, generators=['D=ABC', 'E=AC'])
+    assert design.frac_fact_2level(FACTORS, 8, generators=generators).equals(expected)
+
+
+def test_spaced_negative_generator():
+    structure = design.alias_structure(FACTORS, 'D = ABC, E = - AC')
+    assert sorted(structure['defining_relation']) == ['-A*C*E', '-B*D*E', 'A*B*C*D']
+
+
+@pytest.mark.parametrize('generators', ['D=', 'D==AB', 'DABC', '=AB', 'D = -'])
+def test_malformed_generators_are_rejected(generators):
+    with pytest.raises(ValueError, match='should look like E=ABCD'):
+        design.frac_fact_2level(FACTORS, 8, generators=generators)
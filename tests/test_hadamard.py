@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+import cache
+import hadamard
+
+ORDERS = [1, 2] + list(range(4, 257, 4))
+
+
+@pytest.fixture(autouse=True)
+def no_stored_matrices(monkeypatch):
+    # Every matrix is built here rather than read back from memory or the on-disk cache
+    monkeypatch.setattr(cache, 'load_array', lambda name: None)
+    monkeypatch.setattr(cache, 'save_array', lambda name, array: None)
+    hadamard._cached_hadamard.cache_clear()
+    yield
+    hadamard._cached_hadamard.cache_clear()
+
+
+@pytest.mark.parametrize('order', ORDERS)
+def test_every_order_up_to_256_is_a_normalised_hadamard_matrix(order):
+    matrix = hadamard.hadamard(order)
+    assert matrix.shape == (order, order)
+    assert set(np.unique(matrix)) <= {-1, 1}
+    product = matrix.astype(np.int64) @ matrix.T.astype(np.int64)
+    assert np.array_equal(product, order * np.eye(order, dtype=np.int64))
+    assert (matrix[0] == 1).all() and (matrix[:, 0] == 1).all()
+    assert not matrix.flags.writeable
+
+
+@pytest.mark.parametrize('order', [0, 3, 6, 10])
+def test_orders_that_cannot_exist_are_rejected(order):
+    with pytest.raises(ValueError):
+        hadamard.hadamard(order)
@@ -0,0 +1,26 @@
+import numpy as np
+
+import design
+import hypercube
+
+
+def test_default_iterations_grow_with_the_runs(monkeypatch):
+    found = []
+
+    def _maximin(runs, n_factors, iterations, seed_sequence):
+        found.append(iterations)
+        return 0.0, hypercube._random_strata(np.random.default_rng(seed_sequence), runs, n_factors)
+
+    monkeypatch.setattr(hypercube, '_maximin', _maximin)
+    for runs in (10, 5000, 50000):
+        hypercube.sample(runs, 5, method='maximin', seed=1)
+    assert found[1] >= 10 * 5000 and found[2] >= 10 * 50000
+    hypercube.sample(5000, 5, method='maximin', seed=1, iterations=7)
+    assert found[-1] == 7
+
+
+def test_seeded_design_is_made_again():
+    factors = {'Height': [1.6, 2], 'Width': [0.2, 0.4], 'Temp': [10, 20]}
+    for method in ('random', 'maximin'):
+        first = design.latin_hypercube(factors, 8, method=method, seed=3)
+        assert first.equals(design.latin_hypercube(factors, 8, method=method, seed=3))
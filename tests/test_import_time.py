@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src')
+
+# The modules of this package, the time spent importing them (not counting numpy and pandas)
+# must stay within the budget below
+OWN_MODULES = {'analysis', 'design', 'hadamard', 'aberration', 'hypercube', 'cache', 'instrument',
+               'model', 'exchange', 'walsh'}
+BUDGET_MICROSECONDS = 250000
+
+
+def _import_times(module):
+    """
+    Imports module in a fresh interpreter with -X importtime and returns its output and a dictionary
+    of each imported module's own import time in microseconds.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                            cwd=SRC, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own_time, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(own_time)
+    return result.stdout, times
+
+
+def test_import_does_no_work():
+    stdout, times = _import_times('analysis')
+    assert stdout == ''
+    # Optional and heavy dependencies are only loaded when they are used
+    for module in ('lhsmdu', 'urllib.request', 'scipy', 'lenth_tables'):
+        assert module not in times
+    # The analysis functions take dataframes, so the design generators are not needed to import them
+    for module in ('design', 'hadamard', 'aberration', 'hypercube', 'exchange'):
+        assert module not in times
+
+
+def test_import_time_budget():
+    stdout, times = _import_times('analysis')
+    own_time = sum(time for name, time in times.items() if name in OWN_MODULES)
+    assert own_time < BUDGET_MICROSECONDS
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+import analysis
+import design
+import model
+
+FACTORS = {'Temp': [20, 40], 'Time': [10, 30], 'pH': [6, 8]}
+
+
+def _model_matrix(df):
+    coded, level_counts, names = model.code_design(df, FACTORS)
+    return model.model_matrix(coded, model.model_terms('quadratic', names), level_counts)
+
+
+def _refit(df, results):
+    # The full least squares fit of every run so far, from scratch
+    matrix = _model_matrix(df)
+    coefficients = np.linalg.lstsq(matrix, results, rcond=None)[0]
+    residuals = results - matrix @ coefficients
+    degrees_of_freedom = len(results) - matrix.shape[1]
+    variance = residuals @ residuals / degrees_of_freedom if degrees_of_freedom > 0 else np.nan
+    standard_errors = np.sqrt(np.diag(np.linalg.inv(matrix.T @ matrix)) * variance)
+    r_squared = 1 - residuals @ residuals / ((results - results.mean()) ** 2).sum()
+    return coefficients, standard_errors, variance, r_squared
+
+
+def test_matches_a_full_refit_after_each_batch():
+    runs = design.box_behnken(FACTORS)
+    rng = np.random.default_rng(7)
+    results = 50 + 3 * runs['Temp'] - runs['Time'] + 0.1 * runs['Temp'] * runs['pH'] + rng.standard_normal(len(runs))
+    order = rng.permutation(len(runs))
+    # Two extra centre runs, not in the design, come in as a dataframe
+    extra = pd.DataFrame({'Temp': [30, 30], 'Time': [20, 20], 'pH': [7, 7]})
+    extra_results = np.array([140.5, 139.2])
+
+    fit = analysis.IncrementalFit(runs, model='quadratic', dic_factors=FACTORS)
+    seen_runs = runs.iloc[[]]
+    seen_results = np.array([])
+    compared = 0
+    for batch in ([order[:4]], [order[4:13]], [extra, extra_results], [order[13]], [order[14:]]):
+        if len(batch) == 2:
+            new_runs, new_results = batch
+            fit.add(new_runs, new_results)
+        else:
+            indexes = np.atleast_1d(batch[0])
+            new_runs, new_results = runs.iloc[indexes], np.asarray(results)[indexes]
+            fit.add(batch[0], new_results)
+        seen_runs = pd.concat([seen_runs, new_runs], ignore_index=True)
+        seen_results = np.concatenate([seen_results, new_results])
+        table = fit.coefficients()
+        assert fit.n_observations == len(seen_results)
+        matrix = _model_matrix(seen_runs)
+        if np.linalg.matrix_rank(matrix) < matrix.shape[1]:
+            assert not fit.estimable
+            assert table['Coefficient'].isna().all()
+            continue
+        coefficients, standard_errors, variance, r_squared = _refit(seen_runs, seen_results)
+        assert fit.estimable
+        compared += 1
+        assert np.allclose(table['Coefficient'], coefficients)
+        assert np.allclose(fit.r_squared, r_squared)
+        if np.isnan(variance):
+            assert np.isnan(fit.residual_variance)
+        else:
+            assert np.allclose(fit.residual_variance, variance)
+            assert np.allclose(table['Std Error'], standard_errors)
+    # The fit is checked both when it first becomes estimable and after updates
+    assert compared >= 2
@@ -0,0 +1,64 @@
+import logging
+import threading
+
+import numpy as np
+
+import instrument
+
+
+@instrument.instrumented
+def _allocate_in_stages():
+    with instrument.stage('outer'):
+        # 8 MB is allocated and freed before the inner stage starts
+        block = np.ones(2 ** 20)
+        del block
+        with instrument.stage('inner'):
+            small = np.ones(1000)
+    return small
+
+
+@instrument.instrumented
+def _add(a, b):
+    return a + b
+
+
+def test_nested_stage_keeps_its_parents_peak():
+    with instrument.record(trace_memory=True) as recording:
+        _allocate_in_stages()
+    outer = recording.calls[0]['stages'][0]
+    inner = outer['stages'][0]
+    assert outer['details']['peak_memory'] >= 8 * 2 ** 20
+    assert inner['details']['peak_memory'] < 2 ** 20
+
+
+def test_callback_errors_are_logged_not_raised(caplog):
+    def failing(record):
+        raise RuntimeError('metrics system is down')
+
+    instrument.add_callback(failing)
+    try:
+        with caplog.at_level(logging.ERROR, logger='instrument'):
+            assert _add(1, 2) == 3
+    finally:
+        instrument.remove_callback(failing)
+    assert 'metrics system is down' in caplog.text
+
+
+def test_recording_only_takes_calls_from_its_own_thread():
+    # Each thread opens a recording while the other is inside its own, so both are open at once
+    both_open = threading.Barrier(2)
+    recordings = {}
+
+    def work(name, a):
+        with instrument.record() as recording:
+            both_open.wait()
+            _add(a, 1)
+            both_open.wait()
+        recordings[name] = recording
+
+    worker = threading.Thread(target=work, args=('worker', 10))
+    worker.start()
+    work('main', 0)
+    worker.join()
+    for name in ('main', 'worker'):
+        assert [call['name'] for call in recordings[name].calls] == ['_add']
@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+import analysis
+import design
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # Chunks of 50 resamples of the 16 run design, so the resamples are shared out between processes
+    monkeypatch.setattr(analysis, '_RESAMPLE_CHUNK_VALUES', 16 * 50)
+
+
+def _results():
+    factors = {name: [-1, 1] for name in 'ABCD'}
+    df = design.full_factorial_2level(factors)
+    df['Yield'] = [60, 52, 54, 45, 72, 83, 68, 80, 61, 50, 57, 44, 70, 85, 66, 79]
+    return df
+
+
+@pytest.mark.parametrize('function, size', [(analysis.permutation_test, 'n_permutations'),
+                                            (analysis.bootstrap_intervals, 'n_bootstrap')])
+def test_same_seed_gives_the_same_result(small_chunks, function, size):
+    df = _results()
+    first = function(df, seed=11, **{size: 500})
+    pd.testing.assert_frame_equal(first, function(df, seed=11, **{size: 500}))
+    assert not first.equals(function(df, seed=12, **{size: 500}))
+
+
+@pytest.mark.parametrize('function, size', [(analysis.permutation_test, 'n_permutations'),
+                                            (analysis.bootstrap_intervals, 'n_bootstrap')])
+def test_result_does_not_depend_on_the_processes(small_chunks, function, size):
+    df = _results()
+    alone = function(df, seed=11, processes=1, **{size: 500})
+    shared = function(df, seed=11, processes=2, **{size: 500})
+    pd.testing.assert_frame_equal(alone, shared)
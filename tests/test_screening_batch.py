@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+import analysis
+import design
+
+FACTORS = {name: [-1, 1] for name in 'ABCDE'}
+RESPONSES = ['y1', 'y2', 'y3']
+
+
+def _results():
+    df = design.frac_fact_2level(FACTORS, 16)
+    rng = np.random.default_rng(3)
+    for response in RESPONSES:
+        df[response] = rng.standard_normal(16) + 3 * df['A'] * (response != 'y3')
+    return df
+
+
+def test_batch_matches_screening_each_response_alone():
+    df = _results()
+    batch = analysis.fit_two_level_screening_batch(df, list(FACTORS), RESPONSES)
+    for response in RESPONSES:
+        alone = analysis.fit_two_level_screening(df[list(FACTORS) + [response]])
+        rows = batch[batch['Response'] == response]
+        assert list(rows['Effect']) == list(alone.index)
+        assert np.allclose(rows['Individual p-Value'], alone['Individual p-Value'])
+
+
+@pytest.mark.parametrize('engine', ['fwht', 'dense'])
+def test_engines_give_the_same_contrasts(engine):
+    df = _results()
+    expected = analysis.fit_two_level_screening_batch(df, list(FACTORS), RESPONSES, engine='auto')
+    result = analysis.fit_two_level_screening_batch(df, list(FACTORS), RESPONSES, engine=engine)
+    assert np.allclose(result['Contrast'], expected['Contrast'])
+    assert np.allclose(result['Individual p-Value'], expected['Individual p-Value'])
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import design
+import storage
+
+FORMATS = ['npy', 'arrow', 'parquet']
+
+
+def _round_trip(tmp_path, output_format, source, **kwargs):
+    if output_format != 'npy':
+        pytest.importorskip('pyarrow')
+    path = str(tmp_path / ('design.' + output_format))
+    getattr(storage, 'write_' + output_format)(path, source, **kwargs)
+    return getattr(storage, 'read_' + output_format)(path)
+
+
+@pytest.mark.parametrize('output_format', FORMATS)
+def test_design_round_trip(tmp_path, output_format):
+    # A central composite design has levels and coded levels that are not evenly spaced
+    source = design.central_composite({'Temp': [20, 40], 'Time': [10, 30], 'pH': [6, 8]}, as_design=True)
+    result = _round_trip(tmp_path, output_format, source, chunk_size=5)
+    assert np.array_equal(np.asarray(result.codes), source.codes)
+    assert result.factor_names == source.factor_names
+    for levels, expected in zip(result.levels, source.levels):
+        assert np.allclose(np.asarray(levels, dtype=float), np.asarray(expected, dtype=float))
+    for values, expected in zip(result.coded_levels, source.coded_levels):
+        assert np.allclose(values, expected)
+    pd.testing.assert_frame_equal(result.to_dataframe(), source.to_dataframe(), check_dtype=False)
+
+
+@pytest.mark.parametrize('output_format', FORMATS)
+def test_repeated_levels_round_trip(tmp_path, output_format):
+    # A face centred design has its axial levels equal to its factorial levels, so levels can only be
+    # told apart by their position
+    source = design.central_composite({'Temp': [1, 2], 'Time': [10, 30]}, alpha='face', as_design=True)
+    assert len(set(source.levels[0])) < len(source.levels[0])
+    result = _round_trip(tmp_path, output_format, source, chunk_size=5)
+    assert np.array_equal(np.asarray(result.codes), source.codes)
+    for values, expected in zip(result.coded_levels, source.coded_levels):
+        assert np.allclose(values, expected)
+    pd.testing.assert_frame_equal(result.to_dataframe(), source.to_dataframe(), check_dtype=False)
+
+
+@pytest.mark.parametrize('output_format', FORMATS)
+def test_lazy_full_factorial_round_trip(tmp_path, output_format):
+    factors = {'Height': [1.6, 1.8, 2], 'Colour': ['red', 'green'], 'Batch': [1, 2, 3, 4]}
+    lazy = design.LazyFullFactorial(factors)
+    result = _round_trip(tmp_path, output_format, lazy, chunk_size=7)
+    expected = pd.concat(lazy.chunks(7), ignore_index=True)
+    assert len(result) == lazy.runs
+    pd.testing.assert_frame_equal(result.to_dataframe(), expected, check_dtype=False)
+
+
+@pytest.mark.parametrize('output_format', FORMATS)
+def test_values_round_trip(tmp_path, output_format):
+    source = pd.DataFrame({'x': np.linspace(0, 1, 11), 'y': np.arange(11, dtype=float) ** 2})
+    result = _round_trip(tmp_path, output_format, source, chunk_size=4)
+    pd.testing.assert_frame_equal(result, source)
+
+
+@pytest.mark.parametrize('output_format', ['arrow', 'parquet'])
+def test_values_with_text_round_trip(tmp_path, output_format):
+    source = pd.DataFrame({'x': [0.5, 1.5, 2.5], 'Operator': ['Ann', 'Bob', 'Ann']})
+    result = _round_trip(tmp_path, output_format, source, chunk_size=2)
+    pd.testing.assert_frame_equal(result, source, check_dtype=False)
+
+
+def test_npy_rejects_values_with_text(tmp_path):
+    source = pd.DataFrame({'x': [0.5, 1.5], 'Operator': ['Ann', 'Bob']})
+    with pytest.raises(ValueError):
+        storage.write_npy(str(tmp_path / 'design.npy'), source)
+
+
+@pytest.mark.parametrize('output_format', ['arrow', 'parquet'])
+def test_files_from_elsewhere_are_rejected(tmp_path, output_format):
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+    path = str(tmp_path / ('other.' + output_format))
+    table = pa.table({'x': [1.0, 2.0]}).replace_schema_metadata({storage._METADATA_KEY: b'{"format": "other"}'})
+    if output_format == 'arrow':
+        with pa.ipc.new_file(path, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        pq.write_table(table, path)
+    with pytest.raises(ValueError):
+        getattr(storage, 'read_' + output_format)(path)